@@ -0,0 +1,197 @@
+"""
+Module AGRÉGATION HIÉRARCHIQUE
+Moteur unique de cumul d'une table de mesures (une ligne par feuille ou plusieurs,
+ex: une ligne par année) sur tous les niveaux d'une hiérarchie
+(commune -> département -> région -> zone -> national).
+
+La hiérarchie est une suite de niveaux reliés par des tableaux de parents
+(identifiants entiers denses) ; chaque niveau est calculé directement depuis les
+lignes avec un np.bincount par mesure, dans l'ordre des lignes : aucun parcours
+Python par groupe, quel que soit le nombre de feuilles (~35 000 communes).
+
+Spécification des mesures : {nom: (opération, colonne[, colonne_poids])}
+- "somme"            : somme des valeurs (NaN ignorés)
+- "nombre"           : nombre de valeurs renseignées (de lignes si colonne None)
+- "moyenne"          : moyenne simple des valeurs renseignées (NaN si aucune)
+- "moyenne_ponderee" : moyenne pondérée par colonne_poids (valeur et poids renseignés)
+- "min" / "max"      : extrêmes des valeurs renseignées (NaN si aucune)
+"""
+import functools
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.registre_donnees import registre
+
+OPERATIONS = ("somme", "nombre", "moyenne", "moyenne_ponderee", "min", "max")
+
+# Jeux d'arguments gardés par fonction mémoïsée (les moins récemment utilisés sont oubliés) :
+# les arguments viennent des paramètres de requête (annee, zone...)
+TAILLE_MAX_MEMOISATION = 32
+
+
+class Hierarchie:
+    """
+    Niveaux du plus fin au plus large : [(nom, codes, parents)], parents[i] étant
+    l'identifiant du parent de l'élément i au niveau suivant (-1 : sans parent).
+    Le dernier niveau n'a pas de parents (None).
+    """
+
+    def __init__(self, niveaux: Sequence[Tuple[str, Sequence[str], Optional[np.ndarray]]]):
+        self.noms = [nom for nom, _, _ in niveaux]
+        self.codes = {nom: tuple(codes) for nom, codes, _ in niveaux}
+        self.parents = [None if parents is None else np.asarray(parents, dtype=np.int64) for _, _, parents in niveaux]
+        self._index = {}
+
+    def index(self, niveau: str) -> Dict[str, int]:
+        """Identifiant de chaque code d'un niveau"""
+        if niveau not in self._index:
+            self._index[niveau] = {code: i for i, code in enumerate(self.codes[niveau])}
+        return self._index[niveau]
+
+    def ids(self, codes: Iterable, niveau: Optional[str] = None) -> np.ndarray:
+        """Identifiants de codes (niveau le plus fin par défaut, -1 si inconnu)"""
+        index = self.index(niveau or self.noms[0])
+        codes = list(codes)
+        distincts = {code: index.get(code, -1) for code in set(codes)}
+        return np.fromiter((distincts[code] for code in codes), dtype=np.int64, count=len(codes))
+
+    def ancetres(self, niveau: str) -> np.ndarray:
+        """Identifiant au niveau demandé de chaque feuille (composition des parents, -1 propagé)"""
+        ids = np.arange(len(self.codes[self.noms[0]]), dtype=np.int64)
+        for parents in self.parents[:self.noms.index(niveau)]:
+            ids = np.where(ids >= 0, parents[ids], -1)
+        return ids
+
+    def a_partir_de(self, niveau: str) -> "Hierarchie":
+        """Sous-hiérarchie dont les feuilles sont le niveau donné"""
+        debut = self.noms.index(niveau)
+        return Hierarchie([
+            (nom, self.codes[nom], parents)
+            for nom, parents in zip(self.noms[debut:], self.parents[debut:])
+        ])
+
+    def etendre(self, nom: str, codes: Sequence[str], parents: np.ndarray) -> "Hierarchie":
+        """Hiérarchie avec un niveau plus fin (ex: communes rattachées aux départements)"""
+        return Hierarchie([(nom, codes, parents)] + [
+            (n, self.codes[n], p) for n, p in zip(self.noms, self.parents)
+        ])
+
+
+def _somme(ids: np.ndarray, valeurs: np.ndarray, nb: int) -> np.ndarray:
+    return np.bincount(ids, weights=valeurs, minlength=nb)
+
+
+def _extreme(ids: np.ndarray, valeurs: np.ndarray, nb: int, operation: str) -> np.ndarray:
+    if operation == "min":
+        resultat = np.full(nb, np.inf)
+        np.minimum.at(resultat, ids, valeurs)
+    else:
+        resultat = np.full(nb, -np.inf)
+        np.maximum.at(resultat, ids, valeurs)
+    resultat[np.isinf(resultat)] = np.nan
+    return resultat
+
+
+def _mesure(spec: Tuple, colonnes: Dict[str, np.ndarray], ids: np.ndarray, nb: int) -> np.ndarray:
+    operation, colonne = spec[0], spec[1]
+    if operation not in OPERATIONS:
+        raise ValueError(f"Opération inconnue: {operation} (attendu: {', '.join(OPERATIONS)})")
+
+    if colonne is None:
+        if operation != "nombre":
+            raise ValueError(f"Colonne requise pour l'opération {operation}")
+        return np.bincount(ids, minlength=nb).astype(np.int64)
+
+    valeurs = colonnes[colonne]
+    renseignees = ~np.isnan(valeurs)
+    if operation == "moyenne_ponderee":
+        poids = colonnes[spec[2]]
+        renseignees &= ~np.isnan(poids)
+
+    ids, valeurs = ids[renseignees], valeurs[renseignees]
+    if operation == "somme":
+        return _somme(ids, valeurs, nb)
+    if operation == "nombre":
+        return np.bincount(ids, minlength=nb).astype(np.int64)
+    if operation in ("min", "max"):
+        return _extreme(ids, valeurs, nb, operation)
+
+    if operation == "moyenne":
+        numerateur, denominateur = _somme(ids, valeurs, nb), np.bincount(ids, minlength=nb)
+    else:
+        poids = poids[renseignees]
+        numerateur, denominateur = _somme(ids, valeurs * poids, nb), _somme(ids, poids, nb)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(denominateur > 0, numerateur / denominateur, np.nan)
+
+
+def agreger(hierarchie: Hierarchie, feuilles: np.ndarray, colonnes: Dict[str, Iterable],
+            spec: Dict[str, Tuple], niveaux: Optional[List[str]] = None) -> Dict[str, Dict[str, np.ndarray]]:
+    """
+    Cumule une table de mesures sur les niveaux de la hiérarchie
+
+    Args:
+        hierarchie: Hiérarchie (feuilles = premier niveau)
+        feuilles: Identifiant de feuille de chaque ligne (-1 : ligne ignorée)
+        colonnes: Colonnes numériques de la table, alignées sur feuilles
+        spec: {mesure: (opération, colonne[, colonne_poids])}
+        niveaux: Niveaux à calculer (tous par défaut)
+
+    Returns:
+        {niveau: {"codes": codes du niveau, mesure: tableau aligné sur les codes}}
+    """
+    feuilles = np.asarray(feuilles, dtype=np.int64)
+    colonnes = {nom: np.asarray(valeurs, dtype=np.float64) for nom, valeurs in colonnes.items()}
+
+    resultat = {}
+    for niveau in niveaux or hierarchie.noms:
+        nb = len(hierarchie.codes[niveau])
+        ancetres = hierarchie.ancetres(niveau)
+        ids = np.where(feuilles >= 0, ancetres[feuilles], -1)
+        gardees = ids >= 0
+        ids_gardes = ids[gardees]
+        colonnes_gardees = {nom: valeurs[gardees] for nom, valeurs in colonnes.items()}
+
+        resultat[niveau] = {"codes": hierarchie.codes[niveau]}
+        for mesure, definition in spec.items():
+            resultat[niveau][mesure] = _mesure(definition, colonnes_gardees, ids_gardes, nb)
+    return resultat
+
+
+def memoise_par_version(fonction: Callable) -> Callable:
+    """
+    Décorateur : résultat gardé par arguments pour la version courante des données
+    (registre.version), oublié dès que les données changent. Au plus
+    TAILLE_MAX_MEMOISATION jeux d'arguments (LRU).
+
+    Les valeurs sont partagées entre les requêtes : ne jamais les modifier en place.
+    """
+    valeurs: "OrderedDict[tuple, object]" = OrderedDict()
+    etat = {"version": None}
+    verrou = threading.Lock()
+
+    @functools.wraps(fonction)
+    def enveloppe(*args, **kwargs):
+        version = registre.version()
+        cle = (args, tuple(sorted(kwargs.items())))
+        with verrou:
+            if etat["version"] != version:
+                valeurs.clear()
+                etat["version"] = version
+            elif cle in valeurs:
+                valeurs.move_to_end(cle)
+                return valeurs[cle]
+
+        valeur = fonction(*args, **kwargs)
+        with verrou:
+            if etat["version"] == version:
+                valeurs[cle] = valeur
+                valeurs.move_to_end(cle)
+                while len(valeurs) > TAILLE_MAX_MEMOISATION:
+                    valeurs.popitem(last=False)
+        return valeur
+
+    return enveloppe
@@ -5,11 +5,15 @@ Utilise les vraies données + IA locale (Ollama) pour recommandations
 import pandas as pd
 import numpy as np
 from pathlib import Path
-import json
 from typing import Dict, List, Optional
 from scipy import stats
 import requests
 
+from app.fraicheur import servi_perime_si_vieux
+from app.registre_donnees import registre
+from app.index_temporel import lire_dataframe_indexe
+from app.snapshot_colonnes import lire_dataframe_snapshot
+
 # Configuration
 DATA_DIR = Path(__file__).parent.parent / "data" / "datagouve"
 COUVERTURE_VACCINAL_DIR = DATA_DIR / "couverture_vaccinal"
@@ -18,13 +22,14 @@ PASSAGE_URGENCE_DIR = DATA_DIR / "passage_urgence"
 # Objectif national
 OBJECTIF_NATIONAL_65PLUS = 75.0  # 75% de couverture pour les 65+
 
+# Analyse des zones sous-vaccinées (appels IA compris) : valeur servie jusqu'à 10 min,
+# puis recalculée en arrière-plan
+FRAICHEUR_ZONES_SOUS_VACCINEES_S = 600
+
 # Configuration Ollama
 OLLAMA_URL = "http://localhost:11434/api/generate"
 OLLAMA_MODEL = "llama3.2"  # ou mistral, phi3, etc.
 
-# Cache simple pour éviter de recharger les gros fichiers
-_CACHE = {}
-
 
 # =============================================================================
 # FONCTION OLLAMA - AGENT IA LOCAL
@@ -70,22 +75,11 @@ def appeler_agent_ia(prompt: str, temperature: float = 0.7) -> str:
         return f"⚠️ Erreur IA: {str(e)}"
 
 
-def charger_donnees_avec_cache(chemin: Path, cache_key: str) -> pd.DataFrame:
-    """Charge un fichier JSON avec cache pour éviter rechargements"""
-    if cache_key in _CACHE:
-        return _CACHE[cache_key]
-    
-    with open(chemin, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    df = pd.DataFrame(data)
-    _CACHE[cache_key] = df
-    return df
-
-
 # =============================================================================
 # OBJECTIF 1 : IDENTIFIER ZONES SOUS-VACCINÉES
 # =============================================================================
 
+@servi_perime_si_vieux(FRAICHEUR_ZONES_SOUS_VACCINEES_S)
 def identifier_zones_sous_vaccinees(annee: str = "2024", seuil_critique: float = 50.0) -> Dict:
     """
     Identifie les zones sous-vaccinées avec analyse IA.
@@ -97,9 +91,9 @@ def identifier_zones_sous_vaccinees(annee: str = "2024", seuil_critique: float =
     Returns:
         Analyse complète avec recommandations IA
     """
-    # 1. Charger données régionales AVEC CACHE
+    # 1. Charger données régionales (registre partagé)
     chemin = COUVERTURE_VACCINAL_DIR / "couvertures-vaccinales-des-adolescents-et-adultes-depuis-2011-region.json"
-    df = charger_donnees_avec_cache(chemin, "couverture_region")
+    df = registre.charger(chemin, lire_dataframe_snapshot)
     
     # 2. Filtrer année cible
     df_annee = df[df['an_mesure'] == annee].copy()
@@ -199,9 +193,7 @@ def predire_besoins_vaccins(annee_cible: str = "2025") -> Dict:
     """
     # 1. Charger données historiques
     chemin = COUVERTURE_VACCINAL_DIR / "couvertures-vaccinales-des-adolescents-et-adultes-depuis-2011-region.json"
-    with open(chemin, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    df = pd.DataFrame(data)
+    df = registre.charger(chemin, lire_dataframe_snapshot)
     
     # 2. Populations estimées par région (65+) - Données INSEE approximatives
     populations_65plus = {
@@ -316,9 +308,7 @@ def optimiser_distribution_zones(annee: str = "2024") -> Dict:
     """
     # 1. Charger données IQVIA (doses distribuées vs actes)
     chemin = DATA_DIR / annee / f"couverture-{annee} (1).json"
-    with open(chemin, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    df = pd.DataFrame(data)
+    df = registre.charger(chemin, lire_dataframe_snapshot)
     
     # 2. Calculer par région
     analyses = []
@@ -439,26 +429,17 @@ def anticiper_passages_urgences(periode: str = "hiver_2024") -> Dict:
     """
     # 1. Charger données passages urgences régional
     chemin_urgences = PASSAGE_URGENCE_DIR / "grippe-passages-urgences-et-actes-sos-medecin_reg.json"
-    with open(chemin_urgences, 'r', encoding='utf-8') as f:
-        data_urgences = json.load(f)
-    df_urgences = pd.DataFrame(data_urgences)
+    df_urgences, index_urgences = registre.charger(chemin_urgences, lire_dataframe_indexe, colonne_date="semaine")
     
     # 2. Charger données couverture vaccinale
     chemin_couv = COUVERTURE_VACCINAL_DIR / "couvertures-vaccinales-des-adolescents-et-adultes-depuis-2011-region.json"
-    with open(chemin_couv, 'r', encoding='utf-8') as f:
-        data_couv = json.load(f)
-    df_couv = pd.DataFrame(data_couv)
+    df_couv = registre.charger(chemin_couv, lire_dataframe_snapshot)
     
     # 3. Analyser par région (focus sur 65+, période hivernale)
     correlations = []
     
     # Filtrer données hivernales 2024 (semaines 40-52 de 2023 et 1-20 de 2024)
-    df_hiver = df_urgences[
-        (df_urgences['semaine'].str.contains('2023-S4') | 
-         df_urgences['semaine'].str.contains('2023-S5') |
-         df_urgences['semaine'].str.contains('2024-S0') |
-         df_urgences['semaine'].str.contains('2024-S1'))
-    ]
+    df_hiver = df_urgences.iloc[index_urgences.plage_saison(2023)]
     
     # Pour chaque région
     for reg_code in df_couv['reg'].unique():
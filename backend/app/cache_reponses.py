@@ -0,0 +1,323 @@
+"""
+Module CACHE DES RÉPONSES
+Les routes GET de données sont des fonctions pures de leurs paramètres et des fichiers
+de data/datagouve : leur réponse JSON est mise en cache déjà sérialisée (bytes).
+
+Clé = chemin + paramètres normalisés (triés) + en-tête Accept + version des données
+(empreinte du registre) + jour courant (les prédictions dépendent de la date).
+Un fichier modifié change la version : les anciennes entrées ne sont plus jamais lues
+et sortent du cache par ancienneté (LRU).
+
+- Cache local au processus : LRU borné en octets (CACHE_REPONSES_OCTETS, 0 = désactivé)
+- Cache partagé entre workers, optionnel : serveur compatible Redis (CACHE_REPONSES_REDIS,
+  ex: redis://localhost:6379/0), nécessite le paquet redis. Ses appels bloquants passent
+  par le pool de threads ; après une erreur il est ignoré pendant PAUSE_REDIS_SECONDES
+
+La même clé donne l'ETag des réponses : un client qui renvoie If-None-Match reçoit
+un 304 sans que la route soit exécutée, tant que les données n'ont pas changé.
+Les requêtes identiques simultanées non servies par le cache partagent une seule
+exécution de la route (voir vol_unique).
+"""
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import Callable, Optional
+from urllib.parse import urlencode
+
+from fastapi import Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, Response
+
+from app.fraicheur import suivre_valeurs_perimees
+from app.registre_donnees import registre
+from app.vol_unique import VolUnique
+
+BUDGET_DEFAUT_OCTETS = 64 * 1024 * 1024
+DUREE_REDIS_SECONDES = 24 * 3600  # Les entrées d'anciennes versions expirent d'elles-mêmes
+PREFIXE_REDIS = "grippe:reponse:"
+DELAI_REDIS_SECONDES = 0.1  # Connexion et lecture / écriture
+PAUSE_REDIS_SECONDES = 30  # Après une erreur Redis, cache local seul pendant cette durée
+
+# Routes de données mises en cache (les routes IA, /health et /ready ne le sont jamais)
+PREFIXES_CACHES = ("/vaccination", "/prediction", "/couverture", "/urgences", "/medecins", "/couts", "/capacite")
+
+# Durée de fraîcheur côté client par famille de routes : au-delà, le client revalide
+# avec If-None-Match et reçoit un 304 tant que les données n'ont pas changé
+CACHE_CONTROL_FAMILLES = {
+    "/urgences": "public, max-age=900",  # Passages hebdomadaires
+    "/prediction": "public, max-age=900",  # Dépend aussi de la date du jour
+    "/medecins": "public, max-age=3600",
+}
+CACHE_CONTROL_DEFAUT = "public, max-age=3600"  # Couvertures et coûts annuels
+
+# En-tête interne posé sur les réponses {"success": false} (retiré avant l'envoi au client)
+ENTETE_ECHEC = "x-resultat-echec"
+
+# Routes POST non mises en cache mais dont les appels identiques simultanés sont regroupés
+ROUTES_POST_REGROUPEES = ("/ai/analyze",)
+
+
+def budget_configure() -> int:
+    """Budget du cache local en octets (0 si le cache est désactivé)"""
+    try:
+        return max(0, int(os.environ.get("CACHE_REPONSES_OCTETS", BUDGET_DEFAUT_OCTETS)))
+    except ValueError:
+        return BUDGET_DEFAUT_OCTETS
+
+
+class CacheLRU:
+    """Cache LRU thread-safe de bytes, borné par la taille totale des clés et valeurs"""
+
+    def __init__(self, budget_octets: int = BUDGET_DEFAUT_OCTETS):
+        self.budget_octets = budget_octets
+        self.taille_octets = 0
+        self._entrees: "OrderedDict[str, bytes]" = OrderedDict()
+        self._verrou = threading.Lock()
+
+    def lire(self, cle: str) -> Optional[bytes]:
+        with self._verrou:
+            valeur = self._entrees.get(cle)
+            if valeur is not None:
+                self._entrees.move_to_end(cle)
+            return valeur
+
+    def ecrire(self, cle: str, valeur: bytes):
+        taille = len(cle) + len(valeur)
+        if taille > self.budget_octets:
+            return
+
+        with self._verrou:
+            ancienne = self._entrees.pop(cle, None)
+            if ancienne is not None:
+                self.taille_octets -= len(cle) + len(ancienne)
+            self._entrees[cle] = valeur
+            self.taille_octets += taille
+
+            while self.taille_octets > self.budget_octets:
+                cle_ancienne, valeur_ancienne = self._entrees.popitem(last=False)
+                self.taille_octets -= len(cle_ancienne) + len(valeur_ancienne)
+
+    def vider(self):
+        with self._verrou:
+            self._entrees.clear()
+            self.taille_octets = 0
+
+
+class CacheReponses:
+    """
+    Cache à deux niveaux : LRU local puis, si configuré, serveur Redis partagé.
+
+    Une erreur Redis (serveur arrêté, paquet absent) n'interrompt jamais une requête :
+    le cache local continue de fonctionner seul. Les appels Redis s'exécutent dans le pool
+    de threads, jamais sur la boucle d'événements.
+    """
+
+    def __init__(self, budget_octets: int = BUDGET_DEFAUT_OCTETS, url_redis: Optional[str] = None):
+        self.local = CacheLRU(budget_octets)
+        self.url_redis = url_redis
+        self._redis = None
+        self._redis_suspendu_jusqu_a = 0.0
+        self._verrou_redis = threading.Lock()
+
+    @property
+    def actif(self) -> bool:
+        return self.local.budget_octets > 0
+
+    @property
+    def redis_disponible(self) -> bool:
+        """Serveur partagé configuré et pas en pause après une erreur"""
+        return bool(self.url_redis) and time.monotonic() >= self._redis_suspendu_jusqu_a
+
+    def _client_redis(self):
+        """Connexion Redis ouverte au premier usage (appel bloquant : hors de la boucle d'événements)"""
+        with self._verrou_redis:
+            if self._redis is None:
+                import redis
+
+                client = redis.Redis.from_url(self.url_redis, socket_timeout=DELAI_REDIS_SECONDES,
+                                              socket_connect_timeout=DELAI_REDIS_SECONDES)
+                client.ping()
+                self._redis = client
+                print(f"✅ Cache des réponses partagé : {self.url_redis}")
+            return self._redis
+
+    def _appeler_redis(self, operation: str, appel: Callable):
+        """
+        Exécute appel(client) sur le serveur partagé (dans le pool de threads).
+        Une erreur le met en pause PAUSE_REDIS_SECONDES avec un seul message.
+        """
+        if not self.redis_disponible:
+            return None
+        try:
+            return appel(self._client_redis())
+        except ImportError as e:
+            self.url_redis = None
+            print(f"⚠️  Cache Redis désactivé : {e} - cache local seul")
+        except Exception as e:
+            with self._verrou_redis:
+                deja_suspendu = not self.redis_disponible
+                self._redis_suspendu_jusqu_a = time.monotonic() + PAUSE_REDIS_SECONDES
+            if not deja_suspendu:
+                print(f"⚠️  Cache Redis indisponible ({operation}): {e} - cache local seul pendant {PAUSE_REDIS_SECONDES} s")
+        return None
+
+    async def lire(self, cle: str) -> Optional[bytes]:
+        valeur = self.local.lire(cle)
+        if valeur is not None or not self.redis_disponible:
+            return valeur
+
+        valeur = await run_in_threadpool(self._appeler_redis, "lecture", lambda client: client.get(PREFIXE_REDIS + cle))
+        if valeur is not None:
+            self.local.ecrire(cle, valeur)
+        return valeur
+
+    async def ecrire(self, cle: str, valeur: bytes):
+        self.local.ecrire(cle, valeur)
+
+        if self.redis_disponible:
+            await run_in_threadpool(
+                self._appeler_redis, "écriture",
+                lambda client: client.set(PREFIXE_REDIS + cle, valeur, ex=DUREE_REDIS_SECONDES)
+            )
+
+
+class ReponseDonnees(JSONResponse):
+    """
+    Réponse JSON par défaut de l'application : marque les échecs signalés par la route
+    (success à False) d'un en-tête interne, pour que le cache ne les garde jamais
+    """
+
+    def __init__(self, content, *args, **kwargs):
+        super().__init__(content, *args, **kwargs)
+        if isinstance(content, dict) and content.get("success") is False:
+            self.headers[ENTETE_ECHEC] = "1"
+
+
+def cle_requete(request: Request) -> str:
+    """Clé de cache d'une requête (l'ordre des paramètres n'a pas d'importance)"""
+    parametres = urlencode(sorted(request.query_params.multi_items()))
+    return "|".join((
+        request.url.path,
+        parametres,
+        request.headers.get("accept", ""),
+        registre.version(),
+        date.today().isoformat()
+    ))
+
+
+def etag_requete(cle: str) -> str:
+    """ETag fort : empreinte de la clé (chemin, paramètres, version des données, jour)"""
+    return '"' + hashlib.blake2b(cle.encode(), digest_size=12).hexdigest() + '"'
+
+
+def etag_correspond(if_none_match: Optional[str], etag: str, representation: bool = False) -> bool:
+    """
+    Vrai si l'en-tête If-None-Match du client contient l'ETag.
+    Le joker * n'est honoré que s'il existe une représentation courante réussie (representation=True).
+    """
+    if not if_none_match:
+        return False
+    candidats = [c.strip() for c in if_none_match.split(",")]
+    if representation and "*" in candidats:
+        return True
+    return etag in (c[2:] if c.startswith("W/") else c for c in candidats)
+
+
+def cache_control(chemin: str) -> str:
+    """En-tête Cache-Control de la famille de routes du chemin"""
+    for prefixe, valeur in CACHE_CONTROL_FAMILLES.items():
+        if chemin.startswith(prefixe):
+            return valeur
+    return CACHE_CONTROL_DEFAUT
+
+
+async def _executer_regroupe(cle: str, request: Request, call_next):
+    """
+    Exécute la route une seule fois pour toutes les requêtes identiques simultanées.
+
+    Returns:
+        (entetes, corps, perime, partage) pour une réponse JSON 200, sinon la réponse d'origine
+        (flux NDJSON, erreur HTTP : non partageable, chaque requête l'exécute elle-même).
+        perime vaut True si la route a servi un agrégat périmé (voir fraicheur)
+    """
+    async def executer():
+        perimees = suivre_valeurs_perimees()
+        reponse = await call_next(request)
+        if reponse.status_code != 200 or reponse.headers.get("content-type") != "application/json":
+            return reponse
+        return dict(reponse.headers), b"".join([morceau async for morceau in reponse.body_iterator]), bool(perimees)
+
+    resultat, partage = await vols_en_cours.executer(cle, executer)
+    if not isinstance(resultat, tuple):
+        return await call_next(request) if partage else resultat
+    entetes, corps, perime = resultat
+    return dict(entetes), corps, perime, partage
+
+
+async def servir_avec_cache(request: Request, call_next):
+    """
+    Middleware des routes de données :
+    - If-None-Match égal à l'ETag de la requête : 304 sans exécuter la route
+      (If-None-Match: * seulement une fois la réponse réussie connue, depuis le cache ou calculée)
+    - sinon réponse JSON servie depuis le cache, ou route exécutée puis mise en cache
+      si elle a réussi (statut 200, sans l'en-tête d'échec de ReponseDonnees)
+    - les requêtes identiques simultanées (et les analyses IA identiques) partagent
+      une seule exécution
+    Les réponses réussies portent ETag et Cache-Control, sauf celles construites avec
+    un agrégat périmé en cours de recalcul.
+
+    Doit s'exécuter à l'intérieur de registre.instantane() pour que la version de la clé
+    soit celle des données lues par la route.
+    """
+    if request.method == "POST" and request.url.path in ROUTES_POST_REGROUPEES:
+        cle = "|".join((request.url.path, hashlib.blake2b(await request.body()).hexdigest(), registre.version()))
+        resultat = await _executer_regroupe(cle, request, call_next)
+        if not isinstance(resultat, tuple):
+            return resultat
+        entetes, corps, _, partage = resultat
+        entetes.pop(ENTETE_ECHEC, None)
+        if partage:
+            entetes["X-Cache"] = "SHARED"
+        return Response(content=corps, headers=entetes)
+
+    if request.method != "GET" or not request.url.path.startswith(PREFIXES_CACHES):
+        return await call_next(request)
+
+    cle = cle_requete(request)
+    validation = {"ETag": etag_requete(cle), "Cache-Control": cache_control(request.url.path)}
+    if_none_match = request.headers.get("if-none-match")
+    if etag_correspond(if_none_match, validation["ETag"]):
+        return Response(status_code=304, headers=validation)
+
+    corps = await cache_reponses.lire(cle) if cache_reponses.actif else None
+    if corps is not None:
+        if etag_correspond(if_none_match, validation["ETag"], representation=True):
+            return Response(status_code=304, headers=validation)
+        return Response(content=corps, media_type="application/json", headers={**validation, "X-Cache": "HIT"})
+
+    # Flux NDJSON et erreurs HTTP : ni cache ni ETag
+    resultat = await _executer_regroupe(cle, request, call_next)
+    if not isinstance(resultat, tuple):
+        return resultat
+
+    entetes, corps, perime, partage = resultat
+    echec = entetes.pop(ENTETE_ECHEC, None) is not None
+    if perime:
+        # Agrégat servi périmé pendant son recalcul : ni cache ni ETag pour cette version
+        entetes.update({"X-Cache": "STALE", "Cache-Control": "no-cache"})
+    elif not echec:
+        if cache_reponses.actif and not partage:
+            await cache_reponses.ecrire(cle, corps)
+        if etag_correspond(if_none_match, validation["ETag"], representation=True):
+            return Response(status_code=304, headers=validation)
+        entetes["X-Cache"] = "SHARED" if partage else "MISS"
+        entetes.update(validation)
+    return Response(content=corps, headers=entetes)
+
+
+# Instances uniques partagées par tout le processus
+vols_en_cours = VolUnique()
+cache_reponses = CacheReponses(budget_configure(), os.environ.get("CACHE_REPONSES_REDIS") or None)
@@ -0,0 +1,142 @@
+"""
+Module CAPACITÉ VACCINALE
+Confronte l'offre de vaccination (médecins réels x capacité journalière) à la demande
+restante (population cible encore à vacciner pour atteindre l'objectif) pour chaque
+département, puis agrège par zone A, B, C.
+
+Une seule jointure vectorisée offre / demande : jours nécessaires pour atteindre
+l'objectif et départements goulots d'étranglement sur la durée de la campagne.
+"""
+from typing import Dict, Any
+
+import numpy as np
+import pandas as pd
+
+from app.geographie import normaliser_code_departement
+from app.medecins_reels import charger_table_medecins
+from app.vaccination import calculer_taux_par_departement
+
+OBJECTIF_COUVERTURE = 70.0  # % de la population cible (objectif OMS)
+DUREE_CAMPAGNE_JOURS = 90  # Mi-octobre -> mi-janvier
+NB_GOULOTS = 10
+
+
+def offre_par_departement() -> pd.DataFrame:
+    """
+    Offre de vaccination par département à partir des médecins réels
+
+    Returns:
+        DataFrame (code_departement, nb_medecins, capacite_journaliere)
+    """
+    table = charger_table_medecins()
+    if table.empty:
+        return pd.DataFrame(columns=["code_departement", "nb_medecins", "capacite_journaliere"])
+
+    codes = table["code_departement"].map(
+        {code: normaliser_code_departement(code) for code in table["code_departement"].unique()}
+    )
+    vaccinateurs = table["vaccination_grippe"].astype(bool)
+    capacite = table["capacite_journaliere"].where(vaccinateurs, 0)
+
+    return (
+        pd.DataFrame({"code_departement": codes, "nb_medecins": vaccinateurs.astype(np.int64), "capacite_journaliere": capacite})
+        .groupby("code_departement", as_index=False, sort=False)
+        .sum()
+    )
+
+
+def _jours_pour_objectif(demande: np.ndarray, capacite: np.ndarray) -> np.ndarray:
+    """Jours de vaccination nécessaires (inf si demande sans capacité)"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(demande > 0, demande / capacite, 0.0)
+
+
+def _indicateurs(df: pd.DataFrame, duree_campagne: int) -> pd.DataFrame:
+    """Ajoute demande restante, jours pour l'objectif et goulots (vectorisé)"""
+    objectif = np.ceil(df["population_cible"].to_numpy(dtype=float) * OBJECTIF_COUVERTURE / 100)
+    demande = np.maximum(objectif - df["nombre_vaccines"].to_numpy(dtype=float), 0)
+    capacite = df["capacite_journaliere"].to_numpy(dtype=float)
+    jours = _jours_pour_objectif(demande, capacite)
+    capacite_campagne = capacite * duree_campagne
+
+    df = df.copy()
+    df["objectif_vaccines"] = objectif.astype(np.int64)
+    df["demande_restante"] = demande.astype(np.int64)
+    df["capacite_campagne"] = capacite_campagne.astype(np.int64)
+    df["jours_pour_objectif"] = jours
+    df["deficit_campagne"] = np.maximum(demande - capacite_campagne, 0).astype(np.int64)
+    df["goulot"] = jours > duree_campagne
+    return df
+
+
+def _format_ligne(ligne: Dict) -> Dict[str, Any]:
+    """Ligne JSON (jours infinis -> None)"""
+    jours = ligne["jours_pour_objectif"]
+    return {
+        **ligne,
+        "jours_pour_objectif": None if np.isinf(jours) else round(float(jours), 1),
+        "goulot": bool(ligne["goulot"]),
+    }
+
+
+def calculer_capacite_departements(annee: str = "2024", zone_filter: str = None,
+                                   duree_campagne: int = DUREE_CAMPAGNE_JOURS) -> Dict[str, Any]:
+    """
+    Capacité vaccinale vs demande restante pour tous les départements et zones
+
+    Args:
+        annee: Année de référence de la couverture
+        zone_filter: Filtre par zone (A, B ou C) ou None pour toutes
+        duree_campagne: Durée de la campagne en jours
+
+    Returns:
+        Dict avec départements, zones, total national et goulots d'étranglement
+        (jours_pour_objectif à None si aucune capacité face à une demande)
+    """
+    if duree_campagne <= 0:
+        raise ValueError("duree_campagne doit être positive")
+
+    demande = pd.DataFrame(
+        calculer_taux_par_departement(annee, zone_filter),
+        columns=["code_departement", "nom_departement", "zone", "population_cible", "nombre_vaccines"]
+    )
+
+    # Jointure offre / demande (départements sans médecin : capacité nulle)
+    offre = offre_par_departement()
+    departements = demande.merge(offre, on="code_departement", how="left")
+    departements[["nb_medecins", "capacite_journaliere"]] = (
+        departements[["nb_medecins", "capacite_journaliere"]].fillna(0).astype(np.int64)
+    )
+    departements = _indicateurs(departements, duree_campagne)
+
+    # Agrégation par zone puis nationale
+    colonnes_somme = ["population_cible", "nombre_vaccines", "nb_medecins", "capacite_journaliere"]
+    zones = _indicateurs(departements.groupby("zone", as_index=False)[colonnes_somme].sum(), duree_campagne)
+    national = _indicateurs(departements[colonnes_somme].sum().to_frame().T, duree_campagne)
+
+    goulots = departements[departements["goulot"]].sort_values(
+        ["jours_pour_objectif", "deficit_campagne"], ascending=False, kind="stable"
+    )
+
+    return {
+        "annee": annee,
+        "hypotheses": {
+            "objectif_couverture": OBJECTIF_COUVERTURE,
+            "duree_campagne_jours": duree_campagne,
+            "capacite": "capacite_journaliere des médecins réels pratiquant la vaccination grippe"
+        },
+        "national": _format_ligne(national.to_dict('records')[0]),
+        "zones": [_format_ligne(l) for l in zones.to_dict('records')],
+        "departements": [_format_ligne(l) for l in departements.to_dict('records')],
+        "goulots": [
+            {
+                "code_departement": l["code_departement"],
+                "nom_departement": l["nom_departement"],
+                "zone": l["zone"],
+                "jours_pour_objectif": l["jours_pour_objectif"],
+                "deficit_campagne": l["deficit_campagne"]
+            }
+            for l in (_format_ligne(l) for l in goulots.head(NB_GOULOTS).to_dict('records'))
+        ],
+        "nb_goulots": int(len(goulots))
+    }
@@ -24,6 +24,71 @@ REGIONS_ZONES = {
     "94": {"zone": "C", "nom": "Corse", "population": 349_465},
 }
 
+# Rattachement département -> région (codes officiels INSEE, DOM : régions hors zones)
+DEPARTEMENTS_REGIONS = {
+    # Auvergne-Rhône-Alpes
+    "01": "84", "03": "84", "07": "84", "15": "84", "26": "84", "38": "84",
+    "42": "84", "43": "84", "63": "84", "69": "84", "73": "84", "74": "84",
+    # Bourgogne-Franche-Comté
+    "21": "27", "25": "27", "39": "27", "58": "27", "70": "27", "71": "27", "89": "27", "90": "27",
+    # Bretagne
+    "22": "53", "29": "53", "35": "53", "56": "53",
+    # Centre-Val de Loire
+    "18": "24", "28": "24", "36": "24", "37": "24", "41": "24", "45": "24",
+    # Corse
+    "2A": "94", "2B": "94",
+    # Grand Est
+    "08": "44", "10": "44", "51": "44", "52": "44", "54": "44",
+    "55": "44", "57": "44", "67": "44", "68": "44", "88": "44",
+    # Hauts-de-France
+    "02": "32", "59": "32", "60": "32", "62": "32", "80": "32",
+    # Île-de-France
+    "75": "11", "77": "11", "78": "11", "91": "11", "92": "11", "93": "11", "94": "11", "95": "11",
+    # Normandie
+    "14": "28", "27": "28", "50": "28", "61": "28", "76": "28",
+    # Nouvelle-Aquitaine
+    "16": "75", "17": "75", "19": "75", "23": "75", "24": "75", "33": "75",
+    "40": "75", "47": "75", "64": "75", "79": "75", "86": "75", "87": "75",
+    # Occitanie
+    "09": "76", "11": "76", "12": "76", "30": "76", "31": "76", "32": "76", "34": "76",
+    "46": "76", "48": "76", "65": "76", "66": "76", "81": "76", "82": "76",
+    # Pays de la Loire
+    "44": "52", "49": "52", "53": "52", "72": "52", "85": "52",
+    # Provence-Alpes-Côte d'Azur
+    "04": "93", "05": "93", "06": "93", "13": "93", "83": "93", "84": "93",
+    # DOM
+    "971": "01", "972": "02", "973": "03", "974": "04", "976": "06",
+}
+
+# Populations approximatives par département (INSEE 2021)
+POPULATIONS_DEPARTEMENTS = {
+    # Métropole
+    "01": 652_432, "02": 531_345, "03": 335_136, "04": 164_308, "05": 141_284,
+    "06": 1_083_310, "07": 328_278, "08": 272_988, "09": 153_287, "10": 310_242,
+    "11": 376_029, "12": 279_169, "13": 2_043_110, "14": 694_002, "15": 144_692,
+    "16": 352_335, "17": 651_358, "18": 305_937, "19": 240_872, "2A": 155_000,
+    "2B": 180_000, "21": 535_503, "22": 602_991, "23": 116_617, "24": 413_606,
+    "25": 541_052, "26": 516_762, "27": 601_843, "28": 1_254_609, "29": 908_249,
+    "30": 748_437, "31": 1_400_000, "32": 192_432, "33": 1_600_000, "34": 1_200_000,
+    "35": 1_000_000, "36": 225_184, "37": 610_079, "38": 1_258_722, "39": 260_781,
+    "40": 414_929, "41": 331_280, "42": 764_023, "43": 227_552, "44": 1_400_000,
+    "45": 678_105, "46": 173_828, "47": 332_119, "48": 76_422, "49": 818_573,
+    "50": 495_045, "51": 566_145, "52": 172_512, "53": 307_445, "54": 733_481,
+    "55": 184_083, "56": 750_863, "57": 1_043_522, "58": 204_452, "59": 2_608_346,
+    "60": 824_503, "61": 279_942, "62": 1_465_278, "63": 662_285, "64": 682_621,
+    "65": 230_956, "66": 487_307, "67": 1_125_559, "68": 764_030, "69": 1_843_319,
+    "70": 235_313, "71": 555_663, "72": 567_501, "73": 436_434, "74": 825_194,
+    "75": 2_165_423, "76": 1_254_609, "77": 1_403_997, "78": 1_438_266, "79": 374_435,
+    "80": 569_880, "81": 389_844, "82": 260_189, "83": 1_076_711, "84": 561_469,
+    "85": 1_400_000, "86": 438_435, "87": 374_426, "88": 364_762, "89": 337_108,
+    "90": 144_504, "91": 1_296_641, "92": 1_609_306, "93": 1_623_540, "94": 1_387_926,
+    "95": 1_241_250,
+    # DOM-TOM
+    "971": 384_315, "972": 376_480, "973": 294_071, "974": 858_450, "976": 288_926
+}
+
+POPULATION_DEPARTEMENT_DEFAUT = 500_000  # Défaut 500k
+
 # Population cible vaccination (65+ et personnes à risque = ~30%)
 POURCENTAGE_CIBLE = 0.30
 
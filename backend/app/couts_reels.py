@@ -6,13 +6,14 @@ Calcule les coûts RÉELS de la vaccination grippe basés sur les données offic
 - Remboursements Sécurité Sociale
 - Basé sur les VRAIES données de vaccination 2021-2024
 """
-import json
 import os
 from pathlib import Path
 from typing import Dict, Any, List
 from datetime import datetime
 import pandas as pd
 
+from app.registre_donnees import registre
+
 DATA_DIR = Path(__file__).parent.parent / "data" / "datagouve"
 
 
@@ -28,9 +29,8 @@ def charger_doses_reelles() -> int:
         fichier_2024 = DATA_DIR / "2024" / "campagne-2024 (1).json"
         
         if fichier_2024.exists():
-            with open(fichier_2024, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                
+            data = registre.charger(fichier_2024)
+            
             # Extraire DOSES(J07E1) - index 1
             if 'valeur' in data and '1' in data['valeur']:
                 doses_reelles = data['valeur']['1']
@@ -3,10 +3,16 @@ Module COUVERTURES VACCINALES DÉTAILLÉES
 HPV + Grippe (toutes catégories)
 Par niveau : National, Régional, Départemental
 """
-import json
+import threading
 from pathlib import Path
 from typing import Optional, List, Dict
 
+from app.agregation_hierarchique import agreger, memoise_par_version
+from app.cube_couverture import CubeCouverture
+from app.geographie import NOMS_ZONES, geographie
+from app.registre_donnees import registre
+from app.snapshot_colonnes import lire_dataframe_snapshot
+
 DATA_DIR = Path(__file__).parent.parent / "data" / "datagouve" / "couverture_vaccinal"
 
 # Fichiers sources
@@ -18,9 +24,7 @@ FICHIER_DEPARTEMENTAL = DATA_DIR / "couvertures-vaccinales-des-adolescent-et-adu
 def charger_donnees_nationales():
     """Charge les données nationales"""
     try:
-        with open(FICHIER_NATIONAL, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return data
+        return registre.charger(FICHIER_NATIONAL)
     except Exception as e:
         print(f"❌ Erreur chargement national: {e}")
         return []
@@ -29,9 +33,7 @@ def charger_donnees_nationales():
 def charger_donnees_regionales():
     """Charge les données régionales"""
     try:
-        with open(FICHIER_REGIONAL, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return data
+        return registre.charger(FICHIER_REGIONAL)
     except Exception as e:
         print(f"❌ Erreur chargement régional: {e}")
         return []
@@ -40,14 +42,91 @@ def charger_donnees_regionales():
 def charger_donnees_departementales():
     """Charge les données départementales"""
     try:
-        with open(FICHIER_DEPARTEMENTAL, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return data
+        return registre.charger(FICHIER_DEPARTEMENTAL)
     except Exception as e:
         print(f"❌ Erreur chargement départemental: {e}")
         return []
 
 
+def charger_dataframe_departemental():
+    """Charge les données départementales sous forme de DataFrame (colonnes)"""
+    try:
+        return registre.charger(FICHIER_DEPARTEMENTAL, lire_dataframe_snapshot)
+    except Exception as e:
+        print(f"❌ Erreur chargement départemental: {e}")
+        import pandas as pd
+        return pd.DataFrame()
+
+
+# ============================================================================
+# CUBE DE COUVERTURE (construit une fois par version des fichiers)
+# ============================================================================
+
+# Indicateurs exposés par les routes grippe (clé de réponse -> colonne source)
+INDICATEURS_GRIPPE = [
+    ("moins_65_ans", "grip_moins65"),
+    ("65_ans_et_plus", "grip_65plus"),
+    ("65_74_ans", "grip_6574"),
+    ("75_ans_et_plus", "grip_75plus"),
+    ("residents_ehpad", "grip_resid"),
+    ("professionnels_sante", "grip_pro"),
+]
+INDICATEURS_HPV = ["hpv1_f", "hpv2_f", "hpv1_g", "hpv2_g"]
+
+_cube_verrou = threading.Lock()
+_cube_cache = {"sources": None, "cube": None}
+
+
+def obtenir_cube() -> CubeCouverture:
+    """Retourne le cube de couverture, reconstruit seulement si un fichier source a changé"""
+    sources = (charger_donnees_nationales(), charger_donnees_regionales(), charger_donnees_departementales())
+    
+    with _cube_verrou:
+        anciennes = _cube_cache["sources"]
+        if anciennes is None or any(a is not b for a, b in zip(anciennes, sources)):
+            _cube_cache["cube"] = CubeCouverture(*sources)
+            _cube_cache["sources"] = sources
+        return _cube_cache["cube"]
+
+
+def _format_hpv(annee: str, valeurs: List) -> Dict:
+    """Formate une année HPV (valeurs dans l'ordre de INDICATEURS_HPV)"""
+    return {
+        "annee": annee,
+        "hpv_filles": {
+            "dose_1": valeurs[0],
+            "dose_2": valeurs[1]
+        },
+        "hpv_garcons": {
+            "dose_1": valeurs[2],
+            "dose_2": valeurs[3]
+        }
+    }
+
+
+def _format_grippe(annee: str, valeurs: List) -> Dict:
+    """Formate une année grippe (valeurs dans l'ordre de INDICATEURS_GRIPPE)"""
+    ligne = {"annee": annee}
+    ligne.update(zip([cle for cle, _ in INDICATEURS_GRIPPE], valeurs))
+    return ligne
+
+
+def _series(cube: CubeCouverture, niveau: str, selection, indicateurs: List[str], formatter) -> List[Dict]:
+    """Construit les entités (code, libellés, data par année) d'une sélection du cube"""
+    colonne_code = {"regional": "code_region", "departemental": "code_departement"}[niveau]
+    entites = []
+    for geo, annees in selection:
+        libelles = cube.libelles[niveau][geo]
+        entite = {colonne_code: cube.codes[niveau][geo]}
+        if niveau == "departemental":
+            entite["nom_departement"] = libelles["libgeo"]
+            entite["code_region"] = libelles["reg"]
+        entite["nom_region"] = libelles["reglib"]
+        entite["data"] = [formatter(a, v) for a, v in cube.extraire(niveau, geo, annees, indicateurs)]
+        entites.append(entite)
+    return entites
+
+
 # ============================================================================
 # NIVEAU NATIONAL
 # ============================================================================
@@ -59,28 +138,17 @@ def get_hpv_national(annee_debut: str = "2022") -> Dict:
     Returns:
         Dict avec évolution HPV filles/garçons par année
     """
-    data = charger_donnees_nationales()
+    cube = obtenir_cube()
     
-    if not data:
+    if cube.niveau_vide("national"):
         return {"error": "Données non disponibles"}
     
-    # Filtrer par année >= annee_debut
-    filtered = [d for d in data if d.get('an_mesure') and int(d['an_mesure']) >= int(annee_debut)]
+    # Filtrer par année >= annee_debut (années déjà triées dans le cube)
+    selection = cube.selectionner("national", cube.masque_annees(annee_debut=annee_debut))
     
-    # Organiser par année
     result = []
-    for row in sorted(filtered, key=lambda x: x['an_mesure']):
-        result.append({
-            "annee": row['an_mesure'],
-            "hpv_filles": {
-                "dose_1": row.get('hpv1_f'),
-                "dose_2": row.get('hpv2_f')
-            },
-            "hpv_garcons": {
-                "dose_1": row.get('hpv1_g'),
-                "dose_2": row.get('hpv2_g')
-            }
-        })
+    for geo, annees in selection:
+        result = [_format_hpv(a, v) for a, v in cube.extraire("national", geo, annees, INDICATEURS_HPV)]
     
     return {
         "niveau": "National",
@@ -96,29 +164,24 @@ def get_grippe_national(annee: Optional[str] = None) -> Dict:
     Returns:
         Dict avec toutes les catégories grippe
     """
-    data = charger_donnees_nationales()
+    cube = obtenir_cube()
     
-    if not data:
+    if cube.niveau_vide("national"):
         return {"error": "Données non disponibles"}
     
-    # Si année spécifiée, filtrer
-    if annee:
-        filtered = [d for d in data if d.get('an_mesure') == annee]
-    else:
-        # Prendre toutes les années avec données grippe
-        filtered = [d for d in data if d.get('grip_65plus') is not None]
+    # Si année spécifiée, filtrer ; sinon toutes les années avec données grippe
+    selection = cube.selectionner(
+        "national",
+        cube.masque_annees(annee=annee),
+        indicateur_requis=None if annee else "grip_65plus"
+    )
     
     result = []
-    for row in sorted(filtered, key=lambda x: x.get('an_mesure', '0')):
-        result.append({
-            "annee": row['an_mesure'],
-            "moins_65_ans": row.get('grip_moins65'),
-            "65_ans_et_plus": row.get('grip_65plus'),
-            "65_74_ans": row.get('grip_6574'),
-            "75_ans_et_plus": row.get('grip_75plus'),
-            "residents_ehpad": row.get('grip_resid'),
-            "professionnels_sante": row.get('grip_pro')
-        })
+    for geo, annees in selection:
+        result = [
+            _format_grippe(a, v)
+            for a, v in cube.extraire("national", geo, annees, [col for _, col in INDICATEURS_GRIPPE])
+        ]
     
     return {
         "niveau": "National",
@@ -141,54 +204,23 @@ def get_hpv_regional(code_region: Optional[str] = None, annee_debut: str = "2022
     Returns:
         Dict avec données HPV par région
     """
-    data = charger_donnees_regionales()
+    cube = obtenir_cube()
     
-    if not data:
+    if cube.niveau_vide("regional"):
         return {"error": "Données non disponibles"}
     
-    # Filtrer par année
-    filtered = [d for d in data if d.get('an_mesure') and int(d['an_mesure']) >= int(annee_debut)]
-    
-    # Filtrer par région si spécifié
-    if code_region:
-        filtered = [d for d in filtered if d.get('reg') == code_region]
-    
-    # Grouper par région
-    regions = {}
-    for row in filtered:
-        reg_code = row.get('reg')
-        reg_name = row.get('reglib')
-        
-        if reg_code not in regions:
-            regions[reg_code] = {
-                "code_region": reg_code,
-                "nom_region": reg_name,
-                "data": []
-            }
-        
-        regions[reg_code]["data"].append({
-            "annee": row['an_mesure'],
-            "hpv_filles": {
-                "dose_1": row.get('hpv1_f'),
-                "dose_2": row.get('hpv2_f')
-            },
-            "hpv_garcons": {
-                "dose_1": row.get('hpv1_g'),
-                "dose_2": row.get('hpv2_g')
-            }
-        })
-    
-    # Trier les données par année
-    for reg in regions.values():
-        reg["data"] = sorted(reg["data"], key=lambda x: x['annee'])
+    selection = cube.selectionner(
+        "regional", cube.masque_annees(annee_debut=annee_debut), code=code_region or None
+    )
+    regions = _series(cube, "regional", selection, INDICATEURS_HPV, _format_hpv)
     
     if code_region:
-        return regions.get(code_region, {"error": f"Région {code_region} non trouvée"})
+        return regions[0] if regions else {"error": f"Région {code_region} non trouvée"}
     else:
         return {
             "niveau": "Régional",
             "periode": f"{annee_debut} - présent",
-            "regions": list(regions.values())
+            "regions": regions
         }
 
 
@@ -200,53 +232,22 @@ def get_grippe_regional(code_region: Optional[str] = None, annee: Optional[str]
         code_region: Code région ou None pour toutes
         annee: Année spécifique ou None pour toutes
     """
-    data = charger_donnees_regionales()
+    cube = obtenir_cube()
     
-    if not data:
+    if cube.niveau_vide("regional"):
         return {"error": "Données non disponibles"}
     
-    # Filtrer
-    filtered = [d for d in data if d.get('grip_65plus') is not None]
-    
-    if annee:
-        filtered = [d for d in filtered if d.get('an_mesure') == annee]
-    
-    if code_region:
-        filtered = [d for d in filtered if d.get('reg') == code_region]
-    
-    # Grouper par région
-    regions = {}
-    for row in filtered:
-        reg_code = row.get('reg')
-        reg_name = row.get('reglib')
-        
-        if reg_code not in regions:
-            regions[reg_code] = {
-                "code_region": reg_code,
-                "nom_region": reg_name,
-                "data": []
-            }
-        
-        regions[reg_code]["data"].append({
-            "annee": row['an_mesure'],
-            "moins_65_ans": row.get('grip_moins65'),
-            "65_ans_et_plus": row.get('grip_65plus'),
-            "65_74_ans": row.get('grip_6574'),
-            "75_ans_et_plus": row.get('grip_75plus'),
-            "residents_ehpad": row.get('grip_resid'),
-            "professionnels_sante": row.get('grip_pro')
-        })
-    
-    # Trier
-    for reg in regions.values():
-        reg["data"] = sorted(reg["data"], key=lambda x: x['annee'])
+    selection = cube.selectionner(
+        "regional", cube.masque_annees(annee=annee), code=code_region or None, indicateur_requis="grip_65plus"
+    )
+    regions = _series(cube, "regional", selection, [col for _, col in INDICATEURS_GRIPPE], _format_grippe)
     
     if code_region:
-        return regions.get(code_region, {"error": f"Région {code_region} non trouvée"})
+        return regions[0] if regions else {"error": f"Région {code_region} non trouvée"}
     else:
         return {
             "niveau": "Régional",
-            "regions": list(regions.values())
+            "regions": regions
         }
 
 
@@ -262,63 +263,40 @@ def get_hpv_departemental(code_dept: Optional[str] = None, annee_debut: str = "2
         code_dept: Code département (ex: "75") ou None pour tous
         annee_debut: Année de début
     """
-    data = charger_donnees_departementales()
+    cube = obtenir_cube()
     
-    if not data:
+    if cube.niveau_vide("departemental"):
         return {"error": "Données non disponibles"}
     
-    # Filtrer
-    filtered = [d for d in data if d.get('an_mesure') and int(d['an_mesure']) >= int(annee_debut)]
+    selection = cube.selectionner(
+        "departemental", cube.masque_annees(annee_debut=annee_debut), code=code_dept or None
+    )
+    departements = _series(cube, "departemental", selection, INDICATEURS_HPV, _format_hpv)
     
     if code_dept:
-        filtered = [d for d in filtered if d.get('dep') == code_dept]
-    
-    # Grouper par département
-    departements = {}
-    for row in filtered:
-        dept_code = row.get('dep')
-        dept_name = row.get('libgeo')
-        reg_code = row.get('reg')
-        reg_name = row.get('reglib')
-        
-        if dept_code not in departements:
-            departements[dept_code] = {
-                "code_departement": dept_code,
-                "nom_departement": dept_name,
-                "code_region": reg_code,
-                "nom_region": reg_name,
-                "data": []
-            }
-        
-        departements[dept_code]["data"].append({
-            "annee": row['an_mesure'],
-            "hpv_filles": {
-                "dose_1": row.get('hpv1_f'),
-                "dose_2": row.get('hpv2_f')
-            },
-            "hpv_garcons": {
-                "dose_1": row.get('hpv1_g'),
-                "dose_2": row.get('hpv2_g')
-            }
-        })
-    
-    # Trier
-    for dept in departements.values():
-        dept["data"] = sorted(dept["data"], key=lambda x: x['annee'])
-    
-    if code_dept:
-        return departements.get(code_dept, {"error": f"Département {code_dept} non trouvé"})
+        return departements[0] if departements else {"error": f"Département {code_dept} non trouvé"}
     else:
         return {
             "niveau": "Départemental",
             "periode": f"{annee_debut} - présent",
-            "departements": list(departements.values())
+            "departements": departements
         }
 
 
+# Moyennes des régions par zone (moteur d'agrégation hiérarchique)
+SPEC_GRIPPE_ZONES = {
+    "total_moins_65": ("somme", "moins_65_ans"),
+    "count_moins_65": ("nombre", "moins_65_ans"),
+    "total_65_plus": ("somme", "65_ans_et_plus"),
+    "count_65_plus": ("nombre", "65_ans_et_plus"),
+}
+
+
+@memoise_par_version
 def get_grippe_par_zones(annee: Optional[str] = None) -> Dict:
     """
     Récupère les données grippe groupées par zones (A, B, C)
+    (résultat partagé, ne pas modifier)
     
     Args:
         annee: Année spécifique ou None pour toutes
@@ -329,69 +307,61 @@ def get_grippe_par_zones(annee: Optional[str] = None) -> Dict:
     if "error" in data_regional:
         return data_regional
     
-    # Mapping des régions vers les zones
-    zones_regions = {
-        "A": ["11", "84", "93", "76", "75"],  # Grandes métropoles
-        "B": ["32", "44", "53", "52"],        # Agglomérations moyennes  
-        "C": ["28", "27", "24", "94"]         # Reste de la France
-    }
-    
-    # Noms des zones
-    zones_noms = {
-        "A": "Grandes Métropoles",
-        "B": "Agglomérations Moyennes", 
-        "C": "Reste de la France"
+    # Une ligne par point de données des régions rattachées à une zone (DOM exclus)
+    regions = data_regional.get("regions", [])
+    ids_regions = [geographie.index_region.get(region["code_region"], -1) for region in regions]
+    feuilles, moins_65, plus_65 = [], [], []
+    for id_region, region in zip(ids_regions, regions):
+        if id_region < 0:
+            continue
+        for data_point in region.get("data", []):
+            feuilles.append(id_region)
+            moins_65.append(data_point.get("moins_65_ans"))
+            plus_65.append(data_point.get("65_ans_et_plus"))
+    
+    colonnes = {
+        "moins_65_ans": [float("nan") if v is None else v for v in moins_65],
+        "65_ans_et_plus": [float("nan") if v is None else v for v in plus_65],
     }
+    cumuls = agreger(geographie.hierarchie.a_partir_de("region"), feuilles, colonnes,
+                     SPEC_GRIPPE_ZONES, niveaux=["zone"])["zone"]
     
-    # Grouper par zone
+    # Grouper par zone (référentiel géographique)
     zones_data = {}
     
-    for zone_code, regions_codes in zones_regions.items():
-        zones_data[zone_code] = {
-            "zone_code": zone_code,
-            "zone_nom": zones_noms[zone_code],
-            "regions": [],
-            "statistiques": {
-                "total_regions": 0,
-                "population_totale": 0,
-                "taux_moyen_moins_65": 0,
-                "taux_moyen_65_plus": 0,
-                "taux_moyen_global": 0
-            }
+    for z, zone_code in enumerate(cumuls["codes"]):
+        regions_zone = [
+            region for id_region, region in zip(ids_regions, regions)
+            if id_region >= 0 and geographie.zone_des_regions[id_region] == z
+        ]
+        statistiques = {
+            "total_regions": len(regions_zone),
+            "population_totale": 0,
+            "taux_moyen_moins_65": 0,
+            "taux_moyen_65_plus": 0,
+            "taux_moyen_global": 0
         }
         
-        # Ajouter les régions de cette zone
-        for region in data_regional.get("regions", []):
-            if region["code_region"] in regions_codes:
-                zones_data[zone_code]["regions"].append(region)
-                zones_data[zone_code]["statistiques"]["total_regions"] += 1
+        # Statistiques moyennes de la zone
+        total_moins_65, count_moins_65 = float(cumuls["total_moins_65"][z]), int(cumuls["count_moins_65"][z])
+        total_65_plus, count_65_plus = float(cumuls["total_65_plus"][z]), int(cumuls["count_65_plus"][z])
+        if count_moins_65 > 0:
+            statistiques["taux_moyen_moins_65"] = round(total_moins_65 / count_moins_65, 2)
+        if count_65_plus > 0:
+            statistiques["taux_moyen_65_plus"] = round(total_65_plus / count_65_plus, 2)
         
-        # Calculer les statistiques moyennes pour la zone
-        if zones_data[zone_code]["regions"]:
-            total_moins_65 = 0
-            total_65_plus = 0
-            count_moins_65 = 0
-            count_65_plus = 0
-            
-            for region in zones_data[zone_code]["regions"]:
-                for data_point in region.get("data", []):
-                    if data_point.get("moins_65_ans") is not None:
-                        total_moins_65 += data_point["moins_65_ans"]
-                        count_moins_65 += 1
-                    if data_point.get("65_ans_et_plus") is not None:
-                        total_65_plus += data_point["65_ans_et_plus"]
-                        count_65_plus += 1
-            
-            if count_moins_65 > 0:
-                zones_data[zone_code]["statistiques"]["taux_moyen_moins_65"] = round(total_moins_65 / count_moins_65, 2)
-            if count_65_plus > 0:
-                zones_data[zone_code]["statistiques"]["taux_moyen_65_plus"] = round(total_65_plus / count_65_plus, 2)
-            
-            # Taux global moyen
-            if count_moins_65 > 0 and count_65_plus > 0:
-                zones_data[zone_code]["statistiques"]["taux_moyen_global"] = round(
-                    (total_moins_65 + total_65_plus) / (count_moins_65 + count_65_plus), 2
-                )
+        # Taux global moyen
+        if count_moins_65 > 0 and count_65_plus > 0:
+            statistiques["taux_moyen_global"] = round(
+                (total_moins_65 + total_65_plus) / (count_moins_65 + count_65_plus), 2
+            )
+        
+        zones_data[zone_code] = {
+            "zone_code": zone_code,
+            "zone_nom": NOMS_ZONES[zone_code],
+            "regions": regions_zone,
+            "statistiques": statistiques
+        }
     
     return {
         "niveau": "Zones",
@@ -408,57 +378,22 @@ def get_grippe_departemental(code_dept: Optional[str] = None, annee: Optional[st
     """
     Récupère les données grippe au niveau départemental
     """
-    data = charger_donnees_departementales()
+    cube = obtenir_cube()
     
-    if not data:
+    if cube.niveau_vide("departemental"):
         return {"error": "Données non disponibles"}
     
-    # Filtrer
-    filtered = [d for d in data if d.get('grip_65plus') is not None]
-    
-    if annee:
-        filtered = [d for d in filtered if d.get('an_mesure') == annee]
+    selection = cube.selectionner(
+        "departemental", cube.masque_annees(annee=annee), code=code_dept or None, indicateur_requis="grip_65plus"
+    )
+    departements = _series(cube, "departemental", selection, [col for _, col in INDICATEURS_GRIPPE], _format_grippe)
     
     if code_dept:
-        filtered = [d for d in filtered if d.get('dep') == code_dept]
-    
-    # Grouper par département
-    departements = {}
-    for row in filtered:
-        dept_code = row.get('dep')
-        dept_name = row.get('libgeo')
-        reg_code = row.get('reg')
-        reg_name = row.get('reglib')
-        
-        if dept_code not in departements:
-            departements[dept_code] = {
-                "code_departement": dept_code,
-                "nom_departement": dept_name,
-                "code_region": reg_code,
-                "nom_region": reg_name,
-                "data": []
-            }
-        
-        departements[dept_code]["data"].append({
-            "annee": row['an_mesure'],
-            "moins_65_ans": row.get('grip_moins65'),
-            "65_ans_et_plus": row.get('grip_65plus'),
-            "65_74_ans": row.get('grip_6574'),
-            "75_ans_et_plus": row.get('grip_75plus'),
-            "residents_ehpad": row.get('grip_resid'),
-            "professionnels_sante": row.get('grip_pro')
-        })
-    
-    # Trier
-    for dept in departements.values():
-        dept["data"] = sorted(dept["data"], key=lambda x: x['annee'])
-    
-    if code_dept:
-        return departements.get(code_dept, {"error": f"Département {code_dept} non trouvé"})
+        return departements[0] if departements else {"error": f"Département {code_dept} non trouvé"}
     else:
         return {
             "niveau": "Départemental",
-            "departements": list(departements.values())
+            "departements": departements
         }
 
 
@@ -468,53 +403,44 @@ def get_grippe_departemental(code_dept: Optional[str] = None, annee: Optional[st
 
 def get_annees_disponibles() -> Dict:
     """Retourne les années disponibles pour chaque type de données"""
-    data_nat = charger_donnees_nationales()
+    cube = obtenir_cube()
     
-    annees_hpv = sorted(set([d['an_mesure'] for d in data_nat if d.get('hpv1_f') is not None]))
-    annees_grippe = sorted(set([d['an_mesure'] for d in data_nat if d.get('grip_65plus') is not None]))
+    def annees_avec(indicateur):
+        selection = cube.selectionner("national", cube.masque_annees(), indicateur_requis=indicateur)
+        return sorted(cube.annees[a] for _, annees in selection for a in annees)
     
     return {
-        "hpv": annees_hpv,
-        "grippe": annees_grippe
+        "hpv": annees_avec("hpv1_f"),
+        "grippe": annees_avec("grip_65plus")
     }
 
 
 def get_liste_regions() -> List[Dict]:
     """Retourne la liste des régions disponibles"""
-    data = charger_donnees_regionales()
+    cube = obtenir_cube()
     
-    regions = {}
-    for row in data:
-        reg_code = row.get('reg')
-        reg_name = row.get('reglib')
-        
-        if reg_code and reg_code not in regions:
-            regions[reg_code] = {
-                "code": reg_code,
-                "nom": reg_name
-            }
+    regions = [
+        {"code": code, "nom": libelles["reglib"]}
+        for code, libelles in zip(cube.codes["regional"], cube.libelles["regional"])
+        if code
+    ]
     
-    return sorted(list(regions.values()), key=lambda x: x['code'])
+    return sorted(regions, key=lambda x: x['code'])
 
 
 def get_liste_departements() -> List[Dict]:
     """Retourne la liste des départements disponibles"""
-    data = charger_donnees_departementales()
-    
-    departements = {}
-    for row in data:
-        dept_code = row.get('dep')
-        dept_name = row.get('libgeo')
-        reg_code = row.get('reg')
-        reg_name = row.get('reglib')
-        
-        if dept_code and dept_code not in departements:
-            departements[dept_code] = {
-                "code": dept_code,
-                "nom": dept_name,
-                "region_code": reg_code,
-                "region_nom": reg_name
-            }
+    cube = obtenir_cube()
+    
+    departements = [
+        {
+            "code": code,
+            "nom": libelles["libgeo"],
+            "region_code": libelles["reg"],
+            "region_nom": libelles["reglib"]
+        }
+        for code, libelles in zip(cube.codes["departemental"], cube.libelles["departemental"])
+        if code
+    ]
     
-    return sorted(list(departements.values()), key=lambda x: x['code'])
-
+    return sorted(departements, key=lambda x: x['code'])
@@ -0,0 +1,144 @@
+"""
+Module CUBE DE COUVERTURE
+Matérialise les couvertures vaccinales (HPV, grippe, méningocoque, COVID)
+dans un tableau dense [année, niveau géographique, code géographique, indicateur]
+construit une seule fois à partir des fichiers Santé Publique France
+"""
+import math
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+NIVEAUX = ["national", "regional", "departemental"]
+
+INDICATEURS = [
+    "hpv1_f", "hpv2_f", "hpv1_g", "hpv2_g",
+    "menc10_14", "menc15_19", "menc20_24",
+    "grip_moins65", "grip_65plus", "grip_6574", "grip_75plus", "grip_resid", "grip_pro",
+    "covid_65plus", "covid_resid", "covid_pro",
+]
+
+# Colonne portant le code géographique pour chaque niveau
+COLONNES_CODE = {"national": None, "regional": "reg", "departemental": "dep"}
+CODE_NATIONAL = "FR"
+
+
+def _en_float(valeur) -> float:
+    """Convertit une valeur source (float, int, chaîne ou None) en float (NaN si absente)"""
+    if valeur is None:
+        return np.nan
+    try:
+        return float(valeur)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+class CubeCouverture:
+    """
+    Cube dense des couvertures vaccinales.
+
+    - valeurs[annee, niveau, geo, indicateur] : taux (NaN si absent)
+    - lignes[annee, niveau, geo] : position de la ligne dans le fichier source (-1 si absente),
+      utilisée pour conserver l'ordre d'apparition des entités dans les réponses
+    """
+
+    def __init__(self, donnees_nationales: List[Dict], donnees_regionales: List[Dict],
+                 donnees_departementales: List[Dict]):
+        sources = {
+            "national": donnees_nationales or [],
+            "regional": donnees_regionales or [],
+            "departemental": donnees_departementales or [],
+        }
+
+        self.annees = sorted({r["an_mesure"] for data in sources.values() for r in data if r.get("an_mesure")})
+        self.annees_int = np.array([int(a) for a in self.annees], dtype=np.int64)
+        self.index_annee = {a: i for i, a in enumerate(self.annees)}
+        self.index_indicateur = {ind: i for i, ind in enumerate(INDICATEURS)}
+
+        # Codes et libellés par niveau (ordre de première apparition)
+        self.codes: Dict[str, List[str]] = {}
+        self.index_geo: Dict[str, Dict[str, int]] = {}
+        self.libelles: Dict[str, List[Dict]] = {}
+        for niveau, data in sources.items():
+            colonne = COLONNES_CODE[niveau]
+            codes, index, libelles = [], {}, []
+            for r in data:
+                code = r.get(colonne) if colonne else CODE_NATIONAL
+                if code not in index:
+                    index[code] = len(codes)
+                    codes.append(code)
+                    libelles.append({"libgeo": r.get("libgeo"), "reg": r.get("reg"), "reglib": r.get("reglib")})
+            self.codes[niveau], self.index_geo[niveau], self.libelles[niveau] = codes, index, libelles
+
+        nb_geos = max([len(c) for c in self.codes.values()] + [1])
+        forme = (len(self.annees), len(NIVEAUX), nb_geos)
+        self.valeurs = np.full(forme + (len(INDICATEURS),), np.nan, dtype=np.float64)
+        self.lignes = np.full(forme, -1, dtype=np.int64)
+
+        for n, niveau in enumerate(NIVEAUX):
+            colonne = COLONNES_CODE[niveau]
+            for position, r in enumerate(sources[niveau]):
+                if not r.get("an_mesure"):
+                    continue
+                a = self.index_annee[r["an_mesure"]]
+                g = self.index_geo[niveau][r.get(colonne) if colonne else CODE_NATIONAL]
+                self.lignes[a, n, g] = position
+                self.valeurs[a, n, g] = [_en_float(r.get(ind)) for ind in INDICATEURS]
+
+    def niveau_vide(self, niveau: str) -> bool:
+        """True si aucune donnée n'est disponible pour ce niveau"""
+        return not self.codes[niveau]
+
+    def masque_annees(self, annee: Optional[str] = None, annee_debut: Optional[str] = None) -> np.ndarray:
+        """Masque booléen sur l'axe des années (année exacte et/ou année minimale)"""
+        masque = np.ones(len(self.annees), dtype=bool)
+        if annee_debut is not None:
+            masque &= self.annees_int >= int(annee_debut)
+        if annee:
+            masque &= np.array([a == annee for a in self.annees], dtype=bool)
+        return masque
+
+    def selectionner(self, niveau: str, masque_annees: np.ndarray, code: Optional[str] = None,
+                     indicateur_requis: Optional[str] = None) -> List[Tuple[int, np.ndarray]]:
+        """
+        Sélectionne les entités d'un niveau et leurs années disponibles.
+
+        Args:
+            niveau: "national", "regional" ou "departemental"
+            masque_annees: Masque booléen sur l'axe des années
+            code: Code géographique (recherche directe) ou None pour toutes les entités
+            indicateur_requis: Indicateur qui doit être renseigné pour retenir une année
+
+        Returns:
+            Liste de (index géographique, indices des années triées) dans l'ordre
+            d'apparition des entités dans le fichier source
+        """
+        n = NIVEAUX.index(niveau)
+        if code is not None:
+            g = self.index_geo[niveau].get(code)
+            if g is None:
+                return []
+            geos = np.array([g])
+        else:
+            geos = np.arange(len(self.codes[niveau]))
+
+        lignes = self.lignes[:, n, geos]
+        presents = (lignes >= 0) & masque_annees[:, None]
+        if indicateur_requis:
+            presents &= ~np.isnan(self.valeurs[:, n, geos, self.index_indicateur[indicateur_requis]])
+
+        premiere_ligne = np.where(presents, lignes, np.iinfo(np.int64).max).min(axis=0)
+        retenus = np.flatnonzero(presents.any(axis=0))
+        retenus = retenus[np.argsort(premiere_ligne[retenus], kind="stable")]
+        return [(int(geos[i]), np.flatnonzero(presents[:, i])) for i in retenus]
+
+    def extraire(self, niveau: str, geo: int, indices_annees: np.ndarray,
+                 indicateurs: List[str]) -> List[Tuple[str, List[Optional[float]]]]:
+        """Retourne [(année, [valeurs des indicateurs])] pour une entité (None si absent)"""
+        n = NIVEAUX.index(niveau)
+        colonnes = [self.index_indicateur[ind] for ind in indicateurs]
+        bloc = self.valeurs[indices_annees, n, geo][:, colonnes].tolist()
+        return [
+            (self.annees[a], [None if math.isnan(v) else v for v in ligne])
+            for a, ligne in zip(indices_annees.tolist(), bloc)
+        ]
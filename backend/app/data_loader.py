@@ -4,7 +4,9 @@ Combine les deux sources pour avoir les meilleures infos
 """
 import pandas as pd
 from pathlib import Path
-import json
+
+from app.registre_donnees import registre
+from app.snapshot_colonnes import lire_dataframe_snapshot
 
 DATA_DIR = Path(__file__).parent.parent / "data" / "datagouve"
 COUVERTURE_VACCINAL_DIR = DATA_DIR / "couverture_vaccinal"
@@ -21,10 +23,7 @@ def charger_couverture_historique_region():
     try:
         chemin = COUVERTURE_VACCINAL_DIR / "couvertures-vaccinales-des-adolescents-et-adultes-depuis-2011-region.json"
         if chemin.exists():
-            with open(chemin, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            df = pd.DataFrame(data)
-            return df
+            return registre.charger(chemin, lire_dataframe_snapshot)
         else:
             print(f"❌ Fichier historique région introuvable: {chemin}")
             return pd.DataFrame()
@@ -43,10 +42,7 @@ def charger_couverture_historique_france():
     try:
         chemin = COUVERTURE_VACCINAL_DIR / "couvertures-vaccinales-des-adolescents-et-adultes-depuis-2011-france.json"
         if chemin.exists():
-            with open(chemin, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            df = pd.DataFrame(data)
-            return df
+            return registre.charger(chemin, lire_dataframe_snapshot)
         else:
             print(f"❌ Fichier historique France introuvable: {chemin}")
             return pd.DataFrame()
@@ -74,20 +70,11 @@ def charger_fichier_local(annee: str, type_fichier: str):
         for chemin in chemins:
             if chemin.exists():
                 if chemin.suffix == ".json":
-                    # Lire JSON
-                    with open(chemin, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    
-                    # Convertir en DataFrame
-                    if isinstance(data, dict):
-                        df = pd.DataFrame(data)
-                    else:
-                        df = pd.DataFrame(data)
-                    
-                    return df
+                    # Lire JSON (depuis le snapshot colonnaire s'il est à jour)
+                    return registre.charger(chemin, lire_dataframe_snapshot)
                 else:
-                    # Lire CSV
-                    return pd.read_csv(chemin, sep=';')
+                    # Lire CSV (parsing historique avec sep=';', conservé tel quel)
+                    return registre.charger(chemin, pd.read_csv, sep=';')
         
         print(f"❌ Aucun fichier trouvé pour {type_fichier} {annee}")
         return pd.DataFrame()
@@ -304,21 +291,27 @@ def calculer_taux_reel_depuis_actes(annee="2024"):
         return None
 
 
-def get_donnees_vaccination_region(code_region, annee="2024"):
+def get_donnees_vaccination_region(code_region, annee="2024", contexte=None):
     """
     Récupère les données de vaccination d'une région.
     Calcule le taux réel basé sur les données départementales.
     
+    Args:
+        code_region: Code région
+        annee: Année de référence
+        contexte: ContexteCalcul partagé entre régions (créé si absent)
+    
     Returns:
         dict avec taux, nombre_vaccines, etc.
     """
     # 1. PRIORITE: Calculer le taux réel depuis les données départementales
-    from app.vaccination import calculer_taux_par_departement
-    from app.config import REGIONS_ZONES
+    from app.vaccination import ContexteCalcul
+    
+    if contexte is None:
+        contexte = ContexteCalcul(annee)
     
-    # Obtenir tous les départements de cette région
-    tous_departements = calculer_taux_par_departement(annee)
-    region_departements = [d for d in tous_departements if d["code_region"] == str(code_region)]
+    # Obtenir les départements de cette région (table calculée une fois par contexte)
+    region_departements = contexte.departements_region(code_region)
     
     if region_departements:
         # Calculer les totaux pour la région
@@ -329,7 +322,7 @@ def get_donnees_vaccination_region(code_region, annee="2024"):
         taux_regional = (total_vaccines / total_population) * 100 if total_population > 0 else 0
         
         # Calculer les taux par âge (estimation basée sur le taux national)
-        taux_actes = calculer_taux_reel_depuis_actes(annee)
+        taux_actes = contexte.taux_national
         ratio_regional = taux_regional / taux_actes["taux_reel_global"] if taux_actes else 1
         
         return {
@@ -346,7 +339,7 @@ def get_donnees_vaccination_region(code_region, annee="2024"):
         }
     
     # 2. Fallback: Utiliser le taux national si pas de données départementales
-    taux_actes = calculer_taux_reel_depuis_actes(annee)
+    taux_actes = contexte.taux_national
     
     if taux_actes is not None:
         # Utiliser le taux global comme taux de vaccination pour cette région
@@ -0,0 +1,99 @@
+"""
+Module FRAÎCHEUR DES AGRÉGATS (stale-while-revalidate)
+Pour les agrégats coûteux qui tolèrent quelques minutes de retard : la dernière valeur
+calculée est servie immédiatement ; une fois périmée (durée dépassée ou données
+rechargées), un seul recalcul est lancé en arrière-plan et la remplace quand il termine.
+
+Seul le tout premier appel (pour des arguments donnés) calcule sur le chemin de la requête.
+Une valeur périmée servie est signalée au cache des réponses, qui ne la garde pas.
+"""
+import contextvars
+import functools
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
+
+from app.registre_donnees import registre
+
+NB_THREADS_RECALCUL = 2
+# Jeux d'arguments gardés par agrégat (les moins récemment utilisés sont oubliés)
+TAILLE_MAX_VALEURS = 32
+
+_executeur = ThreadPoolExecutor(max_workers=NB_THREADS_RECALCUL, thread_name_prefix="recalcul-agregats")
+
+# Valeurs périmées servies pendant la requête en cours (voir suivre_valeurs_perimees)
+_perimees: contextvars.ContextVar = contextvars.ContextVar("valeurs_perimees", default=None)
+
+
+def suivre_valeurs_perimees() -> List[str]:
+    """
+    Commence le suivi pour la requête en cours
+
+    Returns:
+        Liste (remplie pendant la requête) des agrégats servis périmés
+    """
+    perimees: List[str] = []
+    _perimees.set(perimees)
+    return perimees
+
+
+def servi_perime_si_vieux(duree_s: float) -> Callable:
+    """
+    Décorateur stale-while-revalidate d'une fonction d'agrégat (arguments hashables)
+
+    Args:
+        duree_s: Durée de fraîcheur d'une valeur en secondes
+
+    Au plus TAILLE_MAX_VALEURS jeux d'arguments sont gardés (LRU). Les valeurs sont partagées entre les requêtes : ne jamais les modifier en place.
+    """
+    def decorateur(fonction: Callable) -> Callable:
+        # (args, kwargs) -> (instant du calcul, version des données, valeur), au plus TAILLE_MAX_VALEURS
+        valeurs: "OrderedDict[tuple, tuple]" = OrderedDict()
+        en_cours = set()
+        verrou = threading.Lock()
+
+        def calculer(cle, args, kwargs):
+            version = registre.version()
+            valeur = fonction(*args, **kwargs)
+            with verrou:
+                valeurs[cle] = (time.monotonic(), version, valeur)
+                valeurs.move_to_end(cle)
+                while len(valeurs) > TAILLE_MAX_VALEURS:
+                    valeurs.popitem(last=False)
+            return valeur
+
+        def recalculer(cle, args, kwargs):
+            try:
+                calculer(cle, args, kwargs)
+            except Exception as e:
+                print(f"⚠️  Recalcul {fonction.__name__}: {e} (ancienne valeur conservée)")
+            finally:
+                with verrou:
+                    en_cours.discard(cle)
+
+        @functools.wraps(fonction)
+        def enveloppe(*args, **kwargs):
+            cle = (args, tuple(sorted(kwargs.items())))
+            with verrou:
+                entree = valeurs.get(cle)
+                if entree is not None:
+                    valeurs.move_to_end(cle)
+            if entree is None:
+                return calculer(cle, args, kwargs)
+
+            calcule_le, version, valeur = entree
+            if time.monotonic() - calcule_le > duree_s or version != registre.version():
+                with verrou:
+                    if cle not in en_cours:
+                        en_cours.add(cle)
+                        _executeur.submit(recalculer, cle, args, kwargs)
+                perimees: Optional[List[str]] = _perimees.get()
+                if perimees is not None:
+                    perimees.append(fonction.__name__)
+            return valeur
+
+        return enveloppe
+
+    return decorateur
@@ -0,0 +1,155 @@
+"""
+Module GÉOGRAPHIE
+Référentiel unique département -> région -> zone (A, B, C), construit une fois à
+l'import depuis app.config.
+
+Chaque département, région et zone reçoit un identifiant entier dense ; les
+rattachements sont des tableaux de parents et les populations des vecteurs :
+un cumul à un niveau supérieur est un seul np.bincount (voir cumuler).
+
+Les départements des régions hors zones (DOM) sont rattachés à la zone par défaut.
+La hiérarchie complète département -> région -> zone -> national sert au moteur
+d'agrégation (voir agregation_hierarchique).
+"""
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+from app.agregation_hierarchique import Hierarchie
+from app.config import (
+    DEPARTEMENTS_REGIONS,
+    POPULATION_DEPARTEMENT_DEFAUT,
+    POPULATIONS_DEPARTEMENTS,
+    REGIONS_ZONES,
+)
+
+ZONES = ("A", "B", "C")
+ZONE_DEFAUT = "C"  # Régions inconnues ou hors zones
+NOMS_ZONES = {
+    "A": "Grandes Métropoles",
+    "B": "Agglomérations Moyennes",
+    "C": "Reste de la France"
+}
+
+
+def normaliser_code_region(code) -> str:
+    """Code région comparable ("11.0" -> "11")"""
+    return str(code).replace('.0', '').strip()
+
+
+def normaliser_code_departement(code) -> str:
+    """Code département comparable ("1.0" -> "01")"""
+    code = str(code).strip()
+    if code.endswith('.0'):
+        code = code[:-2]
+    return code.zfill(2) if code.isdigit() else code
+
+
+class Geographie:
+    """
+    Référentiel géographique dense.
+
+    - zones, regions, departements : codes, l'identifiant est la position
+    - zone_des_regions, region_des_departements (-1 si hors zones), zone_des_departements :
+      tableaux de parents
+    - population_zones, population_regions, population_departements : vecteurs alignés
+
+    Les tableaux sont partagés : ne jamais les modifier en place.
+    """
+
+    def __init__(self):
+        self.zones = ZONES
+        self.index_zone = {zone: i for i, zone in enumerate(self.zones)}
+
+        self.regions = tuple(REGIONS_ZONES)
+        self.index_region = {code: i for i, code in enumerate(self.regions)}
+        self.noms_regions = tuple(info["nom"] for info in REGIONS_ZONES.values())
+        self.zone_des_regions = np.array(
+            [self.index_zone[info["zone"]] for info in REGIONS_ZONES.values()], dtype=np.int64
+        )
+        self.population_regions = np.array(
+            [info["population"] for info in REGIONS_ZONES.values()], dtype=np.int64
+        )
+
+        self.departements = tuple(DEPARTEMENTS_REGIONS)
+        self.index_departement = {code: i for i, code in enumerate(self.departements)}
+        self.region_des_departements = np.array(
+            [self.index_region.get(region, -1) for region in DEPARTEMENTS_REGIONS.values()], dtype=np.int64
+        )
+        self.zone_des_departements = np.where(
+            self.region_des_departements >= 0,
+            self.zone_des_regions[self.region_des_departements],
+            self.index_zone[ZONE_DEFAUT]
+        )
+        self.population_departements = np.array(
+            [POPULATIONS_DEPARTEMENTS.get(code, POPULATION_DEPARTEMENT_DEFAUT) for code in self.departements],
+            dtype=np.int64
+        )
+
+        # Population d'une zone = somme des populations de ses régions (config.REGIONS_ZONES)
+        self.population_zones = self.cumuler(self.zone_des_regions, self.population_regions, len(self.zones))
+        self.zone_par_region: Dict[str, str] = {code: self.zones[z] for code, z in zip(self.regions, self.zone_des_regions)}
+        self.hierarchie = self._construire_hierarchie()
+
+    def _construire_hierarchie(self) -> Hierarchie:
+        """
+        Département -> région -> zone -> national. Les régions hors zones (DOM) suivent
+        les régions de config.REGIONS_ZONES (mêmes identifiants) et sont rattachées à la zone par défaut.
+        """
+        hors_zones = tuple(sorted(set(DEPARTEMENTS_REGIONS.values()) - set(self.regions)))
+        regions = self.regions + hors_zones
+        index_regions = {code: i for i, code in enumerate(regions)}
+        zone_des_regions = np.concatenate([
+            self.zone_des_regions, np.full(len(hors_zones), self.index_zone[ZONE_DEFAUT], dtype=np.int64)
+        ])
+        return Hierarchie([
+            ("departement", self.departements, [index_regions[r] for r in DEPARTEMENTS_REGIONS.values()]),
+            ("region", regions, zone_des_regions),
+            ("zone", self.zones, np.zeros(len(self.zones), dtype=np.int64)),
+            ("national", ("FR",), None),
+        ])
+
+    @staticmethod
+    def cumuler(parents: np.ndarray, valeurs: np.ndarray, nb_parents: int) -> np.ndarray:
+        """Somme des valeurs par parent (un seul passage, les parents -1 sont ignorés)"""
+        parents = np.asarray(parents, dtype=np.int64)
+        valeurs = np.asarray(valeurs)
+        gardes = parents >= 0
+        sommes = np.bincount(parents[gardes], weights=valeurs[gardes], minlength=nb_parents)
+        return sommes.astype(valeurs.dtype) if valeurs.dtype.kind in "iu" else sommes
+
+    def zone_de_region(self, code_region) -> str:
+        """Zone (A, B, C) d'une région, zone par défaut si inconnue"""
+        return self.zone_par_region.get(normaliser_code_region(code_region), ZONE_DEFAUT)
+
+    def regions_de_zone(self, zone_code: str) -> List[str]:
+        """Codes des régions d'une zone (ordre de config.REGIONS_ZONES)"""
+        zone = self.index_zone.get(zone_code)
+        return [code for code, z in zip(self.regions, self.zone_des_regions) if z == zone]
+
+    def population_zone(self, zone_code: str = None) -> int:
+        """Population d'une zone (toutes zones si None, 0 si inconnue)"""
+        if zone_code is None:
+            return int(self.population_zones.sum())
+        zone = self.index_zone.get(zone_code)
+        return 0 if zone is None else int(self.population_zones[zone])
+
+    def ids_departements(self, codes: Iterable) -> np.ndarray:
+        """Identifiants des départements (-1 si inconnu), résolus une fois par code distinct"""
+        codes = list(codes)
+        distincts = {code: self.index_departement.get(code, -1) for code in set(codes)}
+        return np.fromiter((distincts[code] for code in codes), dtype=np.int64, count=len(codes))
+
+    def populations_departements(self, codes: Iterable) -> np.ndarray:
+        """Populations estimées des départements (défaut pour un code inconnu)"""
+        ids = self.ids_departements(codes)
+        return np.where(ids >= 0, self.population_departements[ids], POPULATION_DEPARTEMENT_DEFAUT)
+
+    def population_departement(self, code_dept: str) -> int:
+        """Population estimée d'un département"""
+        i = self.index_departement.get(code_dept)
+        return POPULATION_DEPARTEMENT_DEFAUT if i is None else int(self.population_departements[i])
+
+
+# Instance unique partagée par tout le processus
+geographie = Geographie()
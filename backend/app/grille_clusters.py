@@ -0,0 +1,115 @@
+"""
+Module GRILLE CLUSTERS
+Regroupement de points GPS pour l'affichage cartographique : grille hiérarchique
+alignée sur les tuiles Web Mercator (4 x 4 cellules de 64 px par tuile de 256 px).
+
+Chaque niveau de zoom est précalculé une fois (nombre de points, centroïde et
+premiers points de chaque cellule) ; une requête bbox + zoom ne parcourt que les
+lignes de cellules visibles.
+"""
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+ZOOM_MAX = 16
+CELLULES_PAR_TUILE = 4
+LATITUDE_MAX = 85.05112878  # Limite de la projection Web Mercator
+NB_EXEMPLES = 3
+
+
+def vers_mercator(latitudes, longitudes) -> Tuple[np.ndarray, np.ndarray]:
+    """Coordonnées en degrés -> (x, y) Web Mercator normalisés dans [0, 1]"""
+    lat = np.radians(np.clip(np.asarray(latitudes, dtype=np.float64), -LATITUDE_MAX, LATITUDE_MAX))
+    x = (np.asarray(longitudes, dtype=np.float64) + 180.0) / 360.0
+    y = (1.0 - np.log(np.tan(lat) + 1.0 / np.cos(lat)) / np.pi) / 2.0
+    return np.clip(x, 0.0, 1.0), np.clip(y, 0.0, 1.0)
+
+
+def _cellules(x, y, cote: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Colonnes / lignes de cellule d'une grille de `cote` x `cote`"""
+    cx = np.minimum((np.asarray(x) * cote).astype(np.int64), cote - 1)
+    cy = np.minimum((np.asarray(y) * cote).astype(np.int64), cote - 1)
+    return cx, cy
+
+
+class NiveauGrille:
+    """
+    Cellules non vides d'un niveau de zoom (triées par clé ligne * cote + colonne).
+
+    - cles, nb, latitudes, longitudes : clé, effectif et centroïde de chaque cellule
+    - debuts : début de la cellule dans `ordre` (positions des points groupées par cellule)
+    """
+
+    def __init__(self, cles_points: np.ndarray, latitudes: np.ndarray, longitudes: np.ndarray, cote: int):
+        self.cote = cote
+        self.ordre = np.argsort(cles_points, kind="stable")
+        self.cles, self.debuts, self.nb = np.unique(
+            cles_points[self.ordre], return_index=True, return_counts=True
+        )
+        if len(self.ordre):
+            self.latitudes = np.add.reduceat(latitudes[self.ordre], self.debuts) / self.nb
+            self.longitudes = np.add.reduceat(longitudes[self.ordre], self.debuts) / self.nb
+        else:
+            self.latitudes = self.longitudes = np.empty(0)
+
+    def cellules_visibles(self, x_min: float, y_min: float, x_max: float, y_max: float) -> np.ndarray:
+        """Indices (ordre des clés) des cellules non vides intersectant le rectangle"""
+        (c0, c1), (l0, l1) = _cellules([x_min, x_max], [y_min, y_max], self.cote)
+        lignes = range(int(l0), int(l1) + 1)
+
+        if len(lignes) > len(self.cles):
+            # Rectangle plus haut que le nombre de cellules : un seul masque suffit
+            colonnes, rangs = self.cles % self.cote, self.cles // self.cote
+            return np.flatnonzero((colonnes >= c0) & (colonnes <= c1) & (rangs >= l0) & (rangs <= l1))
+
+        bornes = np.array([(l * self.cote + c0, l * self.cote + c1 + 1) for l in lignes], dtype=np.int64)
+        debuts = np.searchsorted(self.cles, bornes[:, 0])
+        fins = np.searchsorted(self.cles, bornes[:, 1])
+        return np.concatenate([np.arange(d, f) for d, f in zip(debuts, fins)] or [np.empty(0, dtype=np.int64)])
+
+
+class GrilleClusters:
+    """Grille hiérarchique des points valides (les coordonnées NaN sont ignorées)"""
+
+    def __init__(self, latitudes, longitudes, zoom_max: int = ZOOM_MAX):
+        latitudes = np.asarray(latitudes, dtype=np.float64)
+        longitudes = np.asarray(longitudes, dtype=np.float64)
+        self.indices = np.flatnonzero(~np.isnan(latitudes) & ~np.isnan(longitudes))
+        self.latitudes = latitudes[self.indices]
+        self.longitudes = longitudes[self.indices]
+        self.zoom_max = zoom_max
+
+        # Cellules du niveau le plus fin, les niveaux parents s'en déduisent par décalage de bits
+        cote_max = CELLULES_PAR_TUILE << zoom_max
+        x, y = vers_mercator(self.latitudes, self.longitudes)
+        cx, cy = _cellules(x, y, cote_max)
+
+        self.niveaux: List[NiveauGrille] = []
+        for zoom in range(zoom_max + 1):
+            decalage = zoom_max - zoom
+            cote = cote_max >> decalage
+            cles = (cy >> decalage) * cote + (cx >> decalage)
+            self.niveaux.append(NiveauGrille(cles, self.latitudes, self.longitudes, cote))
+
+    def clusters(self, lon_min: float, lat_min: float, lon_max: float, lat_max: float,
+                 zoom: int, nb_exemples: int = NB_EXEMPLES) -> List[Dict]:
+        """
+        Clusters visibles d'un rectangle à un niveau de zoom (borné à zoom_max).
+
+        Returns:
+            Liste de {"latitude", "longitude", "nb", "exemples": [indices d'origine]}
+        """
+        niveau = self.niveaux[min(max(int(zoom), 0), self.zoom_max)]
+        (x_min, x_max), (y_max, y_min) = vers_mercator([lat_min, lat_max], [lon_min, lon_max])
+
+        resultat = []
+        for c in niveau.cellules_visibles(x_min, y_min, x_max, y_max):
+            debut = niveau.debuts[c]
+            exemples = niveau.ordre[debut:debut + min(nb_exemples, niveau.nb[c])]
+            resultat.append({
+                "latitude": float(niveau.latitudes[c]),
+                "longitude": float(niveau.longitudes[c]),
+                "nb": int(niveau.nb[c]),
+                "exemples": [int(i) for i in self.indices[exemples]],
+            })
+        return resultat
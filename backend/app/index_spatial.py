@@ -0,0 +1,95 @@
+"""
+Module INDEX SPATIAL
+Index géographique sur des points GPS (latitude / longitude en degrés) :
+- plus proches voisins et rayon : cKDTree sur coordonnées de la sphère unité
+- rectangle (bbox) : points triés par latitude + recherche dichotomique
+"""
+from typing import List, Optional, Tuple
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+RAYON_TERRE_KM = 6371.0088
+
+
+def vers_sphere_unite(latitudes, longitudes) -> np.ndarray:
+    """Convertit des coordonnées en degrés en points (x, y, z) de la sphère unité"""
+    lat = np.radians(np.asarray(latitudes, dtype=np.float64))
+    lon = np.radians(np.asarray(longitudes, dtype=np.float64))
+    cos_lat = np.cos(lat)
+    return np.column_stack((cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)))
+
+
+def corde_vers_km(corde):
+    """Longueur de corde (sphère unité) -> distance orthodromique en km"""
+    return 2 * RAYON_TERRE_KM * np.arcsin(np.minimum(np.asarray(corde) / 2, 1.0))
+
+
+def km_vers_corde(distance_km: float) -> float:
+    """Distance orthodromique en km -> longueur de corde (sphère unité)"""
+    return float(2 * np.sin(min(distance_km / RAYON_TERRE_KM, np.pi) / 2))
+
+
+def parser_bbox(bbox: str) -> Tuple[float, float, float, float]:
+    """
+    Parse un rectangle "lon_min,lat_min,lon_max,lat_max" (ordre GeoJSON)
+
+    Raises:
+        ValueError: Si le format ou les bornes sont invalides
+    """
+    try:
+        lon_min, lat_min, lon_max, lat_max = (float(v) for v in bbox.split(','))
+    except (AttributeError, ValueError):
+        raise ValueError("bbox doit être au format lon_min,lat_min,lon_max,lat_max")
+
+    if not (-90 <= lat_min <= lat_max <= 90) or not (-180 <= lon_min <= lon_max <= 180):
+        raise ValueError("bbox invalide (bornes hors limites ou min > max)")
+    return lon_min, lat_min, lon_max, lat_max
+
+
+class IndexSpatial:
+    """Index des points valides (les coordonnées NaN sont ignorées)"""
+
+    def __init__(self, latitudes, longitudes):
+        latitudes = np.asarray(latitudes, dtype=np.float64)
+        longitudes = np.asarray(longitudes, dtype=np.float64)
+        self.indices = np.flatnonzero(~np.isnan(latitudes) & ~np.isnan(longitudes))
+        self.latitudes = latitudes[self.indices]
+        self.longitudes = longitudes[self.indices]
+        self.arbre = cKDTree(vers_sphere_unite(self.latitudes, self.longitudes)) if len(self.indices) else None
+
+        # Tri par latitude pour les requêtes rectangle
+        self._ordre_lat = np.argsort(self.latitudes, kind="stable")
+        self._lat_triees = self.latitudes[self._ordre_lat]
+
+    def __len__(self):
+        return len(self.indices)
+
+    def proches(self, lat: float, lon: float, k: int = 10,
+                rayon_km: Optional[float] = None) -> List[Tuple[int, float]]:
+        """
+        Les k points les plus proches d'une position (éventuellement dans un rayon).
+
+        Returns:
+            Liste de (indice d'origine, distance en km) triée par distance croissante
+        """
+        if self.arbre is None or k <= 0:
+            return []
+
+        borne = km_vers_corde(rayon_km) if rayon_km is not None else np.inf
+        cordes, positions = self.arbre.query(
+            vers_sphere_unite([lat], [lon])[0], k=min(k, len(self)), distance_upper_bound=borne
+        )
+        cordes, positions = np.atleast_1d(cordes), np.atleast_1d(positions)
+        trouves = np.isfinite(cordes)
+        distances = corde_vers_km(cordes[trouves])
+        return [(int(self.indices[p]), float(d)) for p, d in zip(positions[trouves], distances)]
+
+    def dans_rectangle(self, lon_min: float, lat_min: float, lon_max: float, lat_max: float) -> np.ndarray:
+        """Indices d'origine (ordre croissant) des points situés dans le rectangle"""
+        debut = np.searchsorted(self._lat_triees, lat_min, side="left")
+        fin = np.searchsorted(self._lat_triees, lat_max, side="right")
+        bande = self._ordre_lat[debut:fin]
+        longitudes = self.longitudes[bande]
+        retenus = bande[(longitudes >= lon_min) & (longitudes <= lon_max)]
+        return np.sort(self.indices[retenus])
@@ -0,0 +1,146 @@
+"""
+Module INDEX TEMPOREL
+Index trié sur une colonne de dates avec positions précalculées par année,
+par semaine ISO et par saison grippale (semaine 40 -> semaine 20 de l'année suivante).
+
+Un filtre sur une période, une année ou une saison devient une recherche
+dichotomique suivie d'un simple découpage (slice).
+"""
+from datetime import date
+from typing import Dict, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.snapshot_colonnes import lire_dataframe_snapshot
+
+SEMAINE_DEBUT_SAISON = 40
+SEMAINE_FIN_SAISON = 20
+
+PLAGE_VIDE = slice(0, 0)
+
+
+def _lundi_semaine_iso(annee: int, semaine: int):
+    """Lundi de la semaine ISO (NaT si la semaine n'existe pas, ex: 2023-S53)"""
+    try:
+        return pd.Timestamp(date.fromisocalendar(annee, semaine, 1))
+    except ValueError:
+        return pd.NaT
+
+
+def convertir_dates(valeurs) -> np.ndarray:
+    """
+    Convertit une colonne de dates hétérogène en datetime64[D] (NaT si invalide).
+
+    Formats acceptés : "2024-10-14", "2024-S42" (lundi de la semaine ISO),
+    timestamp en secondes ou millisecondes (exports JSON pandas).
+    """
+    serie = pd.Series(valeurs, dtype=object).reset_index(drop=True)
+    resultat = pd.Series(pd.NaT, index=serie.index, dtype="datetime64[ns]")
+
+    numeriques = pd.to_numeric(serie, errors='coerce')
+    masque = numeriques.notna()
+    if masque.any():
+        # Au-delà de 1e11 secondes (an 5138) il s'agit de millisecondes
+        secondes = numeriques[masque].where(numeriques[masque].abs() < 1e11, numeriques[masque] / 1000)
+        resultat[masque] = pd.to_datetime(secondes, unit='s', errors='coerce')
+
+    textes = serie[~masque & serie.notna()].astype(str)
+    semaines = textes.str.extract(r'^(\d{4})-S(\d{1,2})$')
+    est_semaine = semaines[0].notna()
+    if est_semaine.any():
+        resultat[est_semaine[est_semaine].index] = [
+            _lundi_semaine_iso(int(a), int(s))
+            for a, s in zip(semaines[0][est_semaine], semaines[1][est_semaine])
+        ]
+    autres = textes[~est_semaine]
+    if len(autres):
+        resultat[autres.index] = pd.to_datetime(autres, errors='coerce', format='ISO8601')
+
+    return resultat.to_numpy(dtype="datetime64[D]")
+
+
+def bornes_saison(annee_debut: int) -> Tuple[np.datetime64, np.datetime64]:
+    """Premier et dernier jour de la saison grippale commençant en `annee_debut`"""
+    debut = date.fromisocalendar(annee_debut, SEMAINE_DEBUT_SAISON, 1)
+    fin = date.fromisocalendar(annee_debut + 1, SEMAINE_FIN_SAISON, 7)
+    return np.datetime64(debut, 'D'), np.datetime64(fin, 'D')
+
+
+class IndexTemporel:
+    """
+    Index temporel d'une série d'enregistrements.
+
+    - ordre : permutation qui trie les enregistrements par date (dates invalides en fin)
+    - dates : dates triées (datetime64[D])
+    - annees / semaines / saisons : plages précalculées dans l'ordre trié
+    """
+
+    def __init__(self, dates):
+        dates = np.asarray(dates, dtype="datetime64[D]")
+        self.ordre = np.argsort(dates, kind="stable")
+        self.dates = dates[self.ordre]
+        self.nb_datees = int(np.count_nonzero(~np.isnat(self.dates)))
+        datees = self.dates[:self.nb_datees]
+
+        self.annees: Dict[int, slice] = {}
+        self.semaines: Dict[Tuple[int, int], slice] = {}
+        self.saisons: Dict[int, slice] = {}
+        if not self.nb_datees:
+            return
+
+        # Années civiles
+        annees = datees.astype("datetime64[Y]")
+        valeurs, debuts = np.unique(annees, return_index=True)
+        fins = list(debuts[1:]) + [self.nb_datees]
+        for annee, debut, fin in zip(valeurs, debuts, fins):
+            self.annees[int(str(annee))] = slice(int(debut), int(fin))
+
+        # Semaines ISO (les dates triées donnent des semaines contiguës)
+        jours, debuts = np.unique(datees, return_index=True)
+        fins = list(debuts[1:]) + [self.nb_datees]
+        for jour, debut, fin in zip(jours.tolist(), debuts, fins):
+            annee_iso, semaine_iso, _ = jour.isocalendar()
+            cle = (annee_iso, semaine_iso)
+            precedente = self.semaines.get(cle)
+            self.semaines[cle] = slice(precedente.start if precedente else int(debut), int(fin))
+
+        # Saisons grippales couvertes par les données
+        premiere = datees[0].tolist().isocalendar()[0] - 1
+        derniere = datees[-1].tolist().isocalendar()[0]
+        for annee_debut in range(premiere, derniere + 1):
+            plage = self.plage_dates(*bornes_saison(annee_debut))
+            if plage.stop > plage.start:
+                self.saisons[annee_debut] = plage
+
+    def plage_dates(self, debut=None, fin=None) -> slice:
+        """Plage (ordre trié) des dates comprises entre `debut` et `fin` inclus"""
+        datees = self.dates[:self.nb_datees]
+        i = 0 if debut is None else int(np.searchsorted(datees, np.datetime64(debut, 'D'), side="left"))
+        j = self.nb_datees if fin is None else int(np.searchsorted(datees, np.datetime64(fin, 'D'), side="right"))
+        return slice(i, max(i, j))
+
+    def plage_annee(self, annee) -> slice:
+        """Plage d'une année civile"""
+        return self.annees.get(int(annee), PLAGE_VIDE)
+
+    def plage_semaine(self, annee, semaine) -> slice:
+        """Plage d'une semaine ISO"""
+        return self.semaines.get((int(annee), int(semaine)), PLAGE_VIDE)
+
+    def plage_saison(self, annee_debut) -> slice:
+        """Plage de la saison grippale S40 `annee_debut` -> S20 `annee_debut + 1`"""
+        return self.saisons.get(int(annee_debut), PLAGE_VIDE)
+
+
+def indexer_dataframe(df: pd.DataFrame, colonne_date: str) -> Tuple[pd.DataFrame, IndexTemporel]:
+    """Trie un DataFrame par date et retourne son index temporel"""
+    if colonne_date not in df.columns:
+        return df, IndexTemporel([])
+    index = IndexTemporel(convertir_dates(df[colonne_date]))
+    return df.iloc[index.ordre].reset_index(drop=True), index
+
+
+def lire_dataframe_indexe(chemin, colonne_date: str = "date") -> Tuple[pd.DataFrame, IndexTemporel]:
+    """Parseur pour le registre : DataFrame trié par date + index temporel"""
+    return indexer_dataframe(lire_dataframe_snapshot(chemin), colonne_date)
@@ -0,0 +1,137 @@
+"""
+Module INDEX TEXTE
+Index inversé sur des champs catégoriels (zone, région, département, spécialité...) :
+- listes de positions triées par valeur exacte (intersectées pour les filtres multiples)
+- index de trigrammes sur les valeurs distinctes pour les recherches par sous-chaîne
+  et les recherches approximatives (similarité de trigrammes)
+
+Le coût d'une requête dépend du nombre de valeurs distinctes et de la taille du
+résultat, pas du nombre d'enregistrements.
+"""
+from collections import Counter
+from typing import Dict, Iterable, List, Set
+
+import numpy as np
+import pandas as pd
+
+SEUIL_SIMILARITE = 0.3
+
+AUCUN = np.empty(0, dtype=np.int64)
+
+
+def trigrammes(texte: str) -> Set[str]:
+    """Trigrammes d'un texte en minuscules, bordé de deux espaces devant et un derrière"""
+    texte = f"  {texte.lower()} "
+    return {texte[i:i + 3] for i in range(len(texte) - 2)}
+
+
+def _trigrammes_internes(texte: str) -> Set[str]:
+    """Trigrammes d'une sous-chaîne recherchée (sans bordure)"""
+    texte = texte.lower()
+    return {texte[i:i + 3] for i in range(len(texte) - 2)}
+
+
+def intersecter(listes: List[np.ndarray]) -> np.ndarray:
+    """Intersection de listes de positions triées (en partant de la plus courte)"""
+    if not listes:
+        return AUCUN
+    listes = sorted(listes, key=len)
+    resultat = listes[0]
+    for autre in listes[1:]:
+        if not len(resultat) or not len(autre):
+            return AUCUN
+        positions = np.minimum(np.searchsorted(autre, resultat), len(autre) - 1)
+        resultat = resultat[autre[positions] == resultat]
+    return resultat
+
+
+def intersecter_ensembles(ensembles: Iterable[Set[str]]) -> Set[str]:
+    """Intersection d'ensembles (en partant du plus petit)"""
+    ensembles = sorted(ensembles, key=len)
+    if not ensembles:
+        return set()
+    resultat = set(ensembles[0])
+    for autre in ensembles[1:]:
+        resultat &= autre
+        if not resultat:
+            break
+    return resultat
+
+
+def unir(listes: Iterable[np.ndarray]) -> np.ndarray:
+    """Union de listes de positions triées et disjointes"""
+    listes = [l for l in listes if len(l)]
+    if not listes:
+        return AUCUN
+    if len(listes) == 1:
+        return listes[0]
+    return np.sort(np.concatenate(listes))
+
+
+class IndexInverse:
+    """
+    Index inversé d'une table.
+
+    - postings[champ][valeur] : positions triées des enregistrements ayant cette valeur
+    - minuscules[champ][valeur en minuscules] : valeurs exactes correspondantes
+    - trigrammes[champ][trigramme] : valeurs en minuscules contenant ce trigramme
+    """
+
+    def __init__(self, colonnes: Dict[str, Iterable], champs_texte: Iterable[str] = ()):
+        self.postings: Dict[str, Dict[str, np.ndarray]] = {}
+        self.minuscules: Dict[str, Dict[str, List[str]]] = {}
+        self.trigrammes: Dict[str, Dict[str, Set[str]]] = {}
+
+        for champ, valeurs in colonnes.items():
+            codes, uniques = pd.factorize(pd.Series(valeurs, dtype=object))
+            ordre = np.argsort(codes, kind="stable")
+            bornes = np.searchsorted(codes[ordre], np.arange(len(uniques) + 1))
+            self.postings[champ] = {
+                valeur: ordre[bornes[i]:bornes[i + 1]] for i, valeur in enumerate(uniques)
+            }
+
+        for champ in champs_texte:
+            minuscules: Dict[str, List[str]] = {}
+            for valeur in self.postings[champ]:
+                minuscules.setdefault(str(valeur).lower(), []).append(valeur)
+            index: Dict[str, Set[str]] = {}
+            for texte in minuscules:
+                for trigramme in trigrammes(texte):
+                    index.setdefault(trigramme, set()).add(texte)
+            self.minuscules[champ] = minuscules
+            self.trigrammes[champ] = index
+
+    def egal(self, champ: str, valeur) -> np.ndarray:
+        """Positions des enregistrements dont le champ vaut exactement `valeur`"""
+        return self.postings[champ].get(valeur, AUCUN)
+
+    def contient(self, champ: str, texte: str) -> np.ndarray:
+        """Positions des enregistrements dont le champ contient `texte` (insensible à la casse)"""
+        texte = texte.lower()
+        requete = _trigrammes_internes(texte)
+        if requete:
+            candidats = intersecter_ensembles(self.trigrammes[champ].get(t, set()) for t in requete)
+        else:
+            # Moins de 3 caractères : parcours des valeurs distinctes
+            candidats = self.minuscules[champ].keys()
+        return self._positions(champ, (v for v in candidats if texte in v))
+
+    def ressemble(self, champ: str, texte: str, seuil: float = SEUIL_SIMILARITE) -> np.ndarray:
+        """Positions des enregistrements dont le champ est proche de `texte` (similarité de trigrammes)"""
+        requete = trigrammes(texte)
+        communs = Counter(
+            valeur for t in requete for valeur in self.trigrammes[champ].get(t, ())
+        )
+        retenues = []
+        for valeur, nb in communs.items():
+            total = len(requete) + len(trigrammes(valeur)) - nb
+            if nb / total >= seuil or texte.lower() in valeur:
+                retenues.append(valeur)
+        return self._positions(champ, retenues)
+
+    def _positions(self, champ: str, textes: Iterable[str]) -> np.ndarray:
+        postings = self.postings[champ]
+        return unir(
+            postings[valeur] for texte in textes for valeur in self.minuscules[champ][texte]
+        )
+
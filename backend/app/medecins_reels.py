@@ -2,176 +2,408 @@
 Module MÉDECINS RÉELS
 Parse le fichier CSV des vrais médecins avec leurs coordonnées GPS
 """
+import numpy as np
 import pandas as pd
-import json
 import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
+
+from app.geographie import geographie, normaliser_code_region
+from app.grille_clusters import GrilleClusters
+from app.index_spatial import IndexSpatial, parser_bbox
+from app.index_texte import IndexInverse, intersecter
+from app.registre_donnees import registre
+from app.snapshot_colonnes import CACHE_DIR, charger_dataframe, sauvegarder_dataframe
+
+
+# Colonnes texte du CSV -> champs du médecin (ordre des champs de la réponse)
+CHAMPS_TEXTE = [
+    ("nom", "Nom du professionnel"),
+    ("civilite", "Civilité"),
+    ("telephone", "Numéro de téléphone"),
+    ("specialite", "Profession"),
+    ("adresse", "Adresse"),
+    ("commune", "Commune"),
+    ("code_insee", "code_insee"),
+    ("departement", "Nom Officiel Département"),
+    ("region", "Nom Officiel Région"),
+    ("code_departement", "Code Officiel Département"),
+    ("code_region", "Code Officiel Région"),
+]
+CHAMPS_TEXTE_SUITE = [
+    ("mode_exercice", "Mode d'exercice particulier"),
+    ("convention", "Convention et CAS"),
+    ("sesam_vitale", "Sesam Vitale"),
+    ("type_acte", "Type d'acte réalisé"),
+    ("tarif_secteur1", "Tarif Secteur 1 / adhérent OPTAM/OPTAM-CO"),
+    ("tarif_hors_secteur1", "Tarif hors secteur 1 / hors adhérent OPTAM/OPTAM-CO"),
+]
+
+# Valeurs par défaut (non présentes dans le fichier source)
+VALEURS_PAR_DEFAUT = {
+    "vaccination_grippe": True,  # On assume que tous peuvent faire de la vaccination
+    "capacite_journaliere": 20,  # Estimation
+    "tarif_vaccination": 25.00,  # Tarif standard
+    "disponibilite": "À contacter",
+    "note": 4.5,  # Note moyenne
+    "nb_avis": 0,  # Pas d'avis disponibles
+}
+
+# Champs d'un médecin dans l'ordre des réponses (projection fields=)
+CHAMPS_MEDECIN = (
+    ["id"] + [champ for champ, _ in CHAMPS_TEXTE] + ["latitude", "longitude"]
+    + [champ for champ, _ in CHAMPS_TEXTE_SUITE] + list(VALEURS_PAR_DEFAUT) + ["zone"]
+)
+
+PREFIXE_ID = "med_real_"
+
+MEDECINS_CSV = 'data/datagouve/medecin/medecins.csv'
+MEDECINS_DIR = CACHE_DIR / "medecins"
+
+
+def _texte(df: pd.DataFrame, colonne: str) -> pd.Series:
+    """Colonne convertie en texte nettoyé (équivalent de str(valeur).strip())"""
+    if colonne not in df.columns:
+        return pd.Series([''] * len(df), index=df.index, dtype=object)
+    return df[colonne].astype(str).str.strip()
+
+
+def construire_table_medecins(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Construit la table des médecins à partir du CSV brut (vectorisé)
+    
+    Returns:
+        DataFrame avec un médecin par ligne (GPS valides et nom renseigné uniquement)
+    """
+    # Extraire les coordonnées GPS "lat, lon"
+    coordonnees = _texte(df, 'Coordonnées')
+    morceaux = coordonnees.str.split(',', expand=True)
+    if morceaux.shape[1] == 2:
+        latitude = pd.to_numeric(morceaux[0].str.strip(), errors='coerce')
+        longitude = pd.to_numeric(morceaux[1].str.strip(), errors='coerce')
+    else:
+        # Aucune coordonnée "lat, lon" exploitable (0 ou plus de 2 morceaux)
+        vide = pd.Series(np.nan, index=df.index)
+        latitude, longitude = vide, vide
+        if morceaux.shape[1] > 2:
+            deux_morceaux = morceaux[2].isna() & morceaux[1].notna()
+            latitude = pd.to_numeric(morceaux[0].str.strip().where(deux_morceaux), errors='coerce')
+            longitude = pd.to_numeric(morceaux[1].str.strip().where(deux_morceaux), errors='coerce')
+    
+    table = pd.DataFrame({champ: _texte(df, colonne) for champ, colonne in CHAMPS_TEXTE})
+    table["latitude"] = latitude
+    table["longitude"] = longitude
+    for champ, colonne in CHAMPS_TEXTE_SUITE:
+        table[champ] = _texte(df, colonne)
+    for champ, valeur in VALEURS_PAR_DEFAUT.items():
+        table[champ] = valeur
+    
+    # Zone calculée une fois par code région distinct
+    codes_region = df['Code Officiel Région'].astype(str) if 'Code Officiel Région' in df.columns else table["code_region"]
+    table["zone"] = codes_region.map({code: get_zone_from_region(code) for code in codes_region.unique()})
+    
+    # Ne garder que les médecins avec des coordonnées GPS valides
+    valides = (
+        latitude.notna() & (latitude != 0) &
+        longitude.notna() & (longitude != 0) &
+        (table["nom"] != '')
+    )
+    table = table[valides].reset_index(drop=True)
+    table.insert(0, "id", [f"{PREFIXE_ID}{i}" for i in range(1, len(table) + 1)])
+    
+    return table
+
+
+def lire_table_medecins(chemin) -> pd.DataFrame:
+    """
+    Parseur pour le registre : ouvre la table persistée (fichier compagnon binaire)
+    si elle correspond au CSV, sinon parse le CSV et persiste la table.
+    """
+    stat = os.stat(chemin)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    
+    table = charger_dataframe(MEDECINS_DIR, signature)
+    if table is not None:
+        return table
+    
+    # Lire le CSV avec le bon séparateur
+    table = construire_table_medecins(pd.read_csv(chemin, sep=';', encoding='utf-8'))
+    try:
+        sauvegarder_dataframe(table, MEDECINS_DIR, signature)
+    except OSError as e:
+        print(f"⚠️  Table médecins non persistée ({MEDECINS_DIR}): {e}")
+    return table
+
+
+def _lire_enregistrements_medecins(chemin) -> List[Dict[str, Any]]:
+    """Parseur pour le registre : table des médecins convertie en liste de dicts"""
+    return registre.charger(chemin, lire_table_medecins).to_dict('records')
+
+
+def charger_table_medecins() -> pd.DataFrame:
+    """
+    Table des médecins (une ligne par médecin), partagée via le registre
+    
+    Returns:
+        DataFrame (vide si le fichier est absent)
+    """
+    if not os.path.exists(MEDECINS_CSV):
+        return pd.DataFrame()
+    
+    try:
+        return registre.charger(MEDECINS_CSV, lire_table_medecins)
+    except Exception as e:
+        print(f"Erreur lors du parsing: {e}")
+        return pd.DataFrame()
 
 
 def parser_medecins_csv() -> List[Dict[str, Any]]:
     """
     Parse le fichier CSV des médecins réels
     
+    Le résultat est mis en cache dans le registre (ne pas modifier les dicts retournés).
+    
     Returns:
         Liste des médecins avec toutes leurs informations
     """
-    file_path = 'data/datagouve/medecin/medecins.csv'
-    
-    if not os.path.exists(file_path):
+    if not os.path.exists(MEDECINS_CSV):
         return []
     
     try:
-        # Lire le CSV avec le bon séparateur
-        df = pd.read_csv(file_path, sep=';', encoding='utf-8')
-        
-        medecins = []
-        
-        for _, row in df.iterrows():
-            # Extraire les coordonnées GPS
-            coordonnees = str(row.get('Coordonnées', ''))
-            latitude, longitude = None, None
-            
-            if coordonnees and ',' in coordonnees:
-                try:
-                    lat_str, lon_str = coordonnees.split(',')
-                    latitude = float(lat_str.strip())
-                    longitude = float(lon_str.strip())
-                except:
-                    pass
-            
-            # Extraire les informations du médecin
-            medecin = {
-                "id": f"med_real_{len(medecins) + 1}",
-                "nom": str(row.get('Nom du professionnel', '')).strip(),
-                "civilite": str(row.get('Civilité', '')).strip(),
-                "telephone": str(row.get('Numéro de téléphone', '')).strip(),
-                "specialite": str(row.get('Profession', '')).strip(),
-                "adresse": str(row.get('Adresse', '')).strip(),
-                "commune": str(row.get('Commune', '')).strip(),
-                "code_insee": str(row.get('code_insee', '')).strip(),
-                "departement": str(row.get('Nom Officiel Département', '')).strip(),
-                "region": str(row.get('Nom Officiel Région', '')).strip(),
-                "code_departement": str(row.get('Code Officiel Département', '')).strip(),
-                "code_region": str(row.get('Code Officiel Région', '')).strip(),
-                "latitude": latitude,
-                "longitude": longitude,
-                "mode_exercice": str(row.get('Mode d\'exercice particulier', '')).strip(),
-                "convention": str(row.get('Convention et CAS', '')).strip(),
-                "sesam_vitale": str(row.get('Sesam Vitale', '')).strip(),
-                "type_acte": str(row.get('Type d\'acte réalisé', '')).strip(),
-                "tarif_secteur1": str(row.get('Tarif Secteur 1 / adhérent OPTAM/OPTAM-CO', '')).strip(),
-                "tarif_hors_secteur1": str(row.get('Tarif hors secteur 1 / hors adhérent OPTAM/OPTAM-CO', '')).strip(),
-                "vaccination_grippe": True,  # On assume que tous peuvent faire de la vaccination
-                "capacite_journaliere": 20,  # Estimation
-                "tarif_vaccination": 25.00,  # Tarif standard
-                "disponibilite": "À contacter",
-                "note": 4.5,  # Note moyenne
-                "nb_avis": 0,  # Pas d'avis disponibles
-                "zone": get_zone_from_region(str(row.get('Code Officiel Région', '')))
-            }
-            
-            # Ne garder que les médecins avec des coordonnées GPS valides
-            if latitude and longitude and medecin["nom"]:
-                medecins.append(medecin)
-        
-        return medecins
-        
+        return registre.charger(MEDECINS_CSV, _lire_enregistrements_medecins)
     except Exception as e:
         print(f"Erreur lors du parsing: {e}")
         return []
 
 
-def get_zone_from_region(code_region: str) -> str:
+def _construire_index_spatial(chemin) -> IndexSpatial:
+    """Parseur pour le registre : index spatial sur les coordonnées de la table des médecins"""
+    table = registre.charger(chemin, lire_table_medecins)
+    return IndexSpatial(table["latitude"].to_numpy(), table["longitude"].to_numpy())
+
+
+def charger_index_spatial() -> Optional[IndexSpatial]:
     """
-    Détermine la zone (A, B, C) à partir du code région
+    Index spatial des médecins (positions alignées sur parser_medecins_csv)
     
-    Args:
-        code_region: Code région (11, 84, 93, etc.)
-        
     Returns:
-        Zone (A, B, C)
+        IndexSpatial ou None si le fichier est absent
     """
-    # Nettoyer le code région (enlever .0)
-    clean_code = str(code_region).replace('.0', '').strip()
+    if not os.path.exists(MEDECINS_CSV):
+        return None
     
-    zones_regions = {
-        "A": ["11", "84", "93", "76", "75"],  # Grandes métropoles
-        "B": ["32", "44", "53", "52"],        # Agglomérations moyennes  
-        "C": ["28", "27", "24", "94"]         # Reste de la France
-    }
+    try:
+        return registre.charger(MEDECINS_CSV, _construire_index_spatial)
+    except Exception as e:
+        print(f"Erreur lors de la construction de l'index spatial: {e}")
+        return None
+
+
+def _construire_grille_clusters(chemin) -> GrilleClusters:
+    """Parseur pour le registre : grille de clusters sur les coordonnées de la table des médecins"""
+    table = registre.charger(chemin, lire_table_medecins)
+    return GrilleClusters(table["latitude"].to_numpy(), table["longitude"].to_numpy())
+
+
+def charger_grille_clusters() -> Optional[GrilleClusters]:
+    """
+    Grille hiérarchique de clusters des médecins (calculée une fois par version du fichier)
     
-    for zone, regions in zones_regions.items():
-        if clean_code in regions:
-            return zone
+    Returns:
+        GrilleClusters ou None si le fichier est absent
+    """
+    if not os.path.exists(MEDECINS_CSV):
+        return None
     
-    return "C"  # Par défaut
+    try:
+        return registre.charger(MEDECINS_CSV, _construire_grille_clusters)
+    except Exception as e:
+        print(f"Erreur lors de la construction de la grille de clusters: {e}")
+        return None
+
 
+def _construire_index_texte(chemin) -> IndexInverse:
+    """Parseur pour le registre : index inversé des filtres de recherche des médecins"""
+    table = registre.charger(chemin, lire_table_medecins)
+    codes_region = table["code_region"].map(
+        {code: normaliser_code_region(code) for code in table["code_region"].unique()}
+    )
+    latitude = table["latitude"].fillna(1)
+    longitude = table["longitude"].fillna(1)
+    return IndexInverse(
+        {
+            "zone": table["zone"],
+            "region": codes_region,
+            "departement": table["departement"],
+            "specialite": table["specialite"],
+            "gps": (latitude != 0) & (longitude != 0),
+        },
+        champs_texte=("departement", "specialite")
+    )
 
-def get_medecins_reels_par_region(code_region: str = None, limit: int = 100, offset: int = 0) -> Dict[str, Any]:
+
+def charger_index_texte() -> Optional[IndexInverse]:
     """
-    Récupère les médecins réels par région avec pagination
+    Index inversé des médecins (positions alignées sur parser_medecins_csv)
+    
+    Returns:
+        IndexInverse ou None si le fichier est absent
+    """
+    if not os.path.exists(MEDECINS_CSV):
+        return None
+    
+    try:
+        return registre.charger(MEDECINS_CSV, _construire_index_texte)
+    except Exception as e:
+        print(f"Erreur lors de la construction de l'index de recherche: {e}")
+        return None
+
+
+def _parser_champs(fields: Optional[str]) -> Optional[List[str]]:
+    """
+    Parse une projection "nom,latitude,longitude" (None = tous les champs)
+    
+    Raises:
+        ValueError: Si un champ est inconnu
+    """
+    if not fields:
+        return None
+    
+    champs = list(dict.fromkeys(c.strip() for c in fields.split(',') if c.strip()))
+    inconnus = [c for c in champs if c not in CHAMPS_MEDECIN]
+    if inconnus:
+        raise ValueError(f"Champs inconnus: {', '.join(inconnus)} (disponibles: {', '.join(CHAMPS_MEDECIN)})")
+    return champs or None
+
+
+def _debut_curseur(positions: np.ndarray, curseur: str) -> int:
+    """
+    Indice dans `positions` du premier médecin situé après le curseur
+    
+    Le curseur est l'id du dernier médecin reçu (med_real_N) : la clé de tri est
+    la position dans le fichier, stable pour une version donnée du CSV.
+    """
+    numero = curseur[len(PREFIXE_ID):] if curseur.startswith(PREFIXE_ID) else ''
+    if not numero.isdigit():
+        raise ValueError(f"Curseur invalide: {curseur}")
+    return int(np.searchsorted(positions, int(numero) - 1, side="right"))
+
+
+def iterer_medecins(positions: np.ndarray, curseur: str = None, fields: str = None) -> Iterator[Dict[str, Any]]:
+    """
+    Itère paresseusement sur les médecins aux positions données (mode flux NDJSON)
+    
+    Le curseur et la projection sont validés avant le premier médecin produit.
+    
+    Raises:
+        ValueError: Si le curseur ou la projection est invalide
+    """
+    champs = _parser_champs(fields)
+    debut = _debut_curseur(positions, curseur) if curseur else 0
+    medecins = parser_medecins_csv()
+    
+    def generer():
+        for i in positions[debut:]:
+            medecin = medecins[i]
+            yield {c: medecin[c] for c in champs} if champs else medecin
+    
+    return generer()
+
+
+def paginer_medecins(positions: np.ndarray, limit: int = 100, offset: int = 0,
+                     curseur: str = None, fields: str = None) -> Dict[str, Any]:
+    """
+    Page de médecins avec pagination par décalage ou par curseur (keyset)
     
     Args:
-        code_region: Code région ou None pour toutes les régions
-        limit: Nombre de médecins à retourner (max 100)
-        offset: Décalage pour la pagination
+        positions: Positions triées des médecins retenus
+        limit: Nombre de médecins à retourner
+        offset: Décalage pour la pagination (ignoré si curseur)
+        curseur: Id du dernier médecin de la page précédente
+        fields: Projection "champ1,champ2" (tous les champs si None)
         
     Returns:
         Dict avec médecins paginés et métadonnées
     """
+    champs = _parser_champs(fields)
+    debut = _debut_curseur(positions, curseur) if curseur else offset
     medecins = parser_medecins_csv()
     
-    # Filtrer par région si spécifiée
-    if code_region:
-        # Nettoyer le code région pour la comparaison
-        clean_code = str(code_region).replace('.0', '').strip()
-        medecins = [m for m in medecins if str(m["code_region"]).replace('.0', '').strip() == clean_code]
-    
     # Pagination
-    total = len(medecins)
-    medecins_pages = medecins[offset:offset + limit]
+    total = len(positions)
+    medecins_pages = [medecins[i] for i in positions[debut:debut + limit]]
+    has_more = debut + limit < total
     
     return {
-        "medecins": medecins_pages,
+        "medecins": [{c: m[c] for c in champs} for m in medecins_pages] if champs else medecins_pages,
         "pagination": {
             "total": total,
             "limit": limit,
-            "offset": offset,
-            "has_more": offset + limit < total,
-            "next_offset": offset + limit if offset + limit < total else None
+            "offset": debut,
+            "has_more": has_more,
+            "next_offset": debut + limit if has_more else None,
+            "next_cursor": medecins_pages[-1]["id"] if has_more and medecins_pages else None
         }
     }
 
 
-def get_medecins_reels_par_zone(zone_code: str, limit: int = 100, offset: int = 0) -> Dict[str, Any]:
+def _toutes_positions() -> np.ndarray:
+    return np.arange(len(parser_medecins_csv()))
+
+
+def get_zone_from_region(code_region: str) -> str:
     """
-    Récupère les médecins réels par zone avec pagination
+    Détermine la zone (A, B, C) à partir du code région
     
     Args:
-        zone_code: Code zone (A, B, C)
+        code_region: Code région (11, 84, 93, etc.)
+        
+    Returns:
+        Zone (A, B, C)
+    """
+    return geographie.zone_de_region(code_region)
+
+
+def get_medecins_reels_par_region(code_region: str = None, limit: int = 100, offset: int = 0,
+                                  curseur: str = None, fields: str = None) -> Dict[str, Any]:
+    """
+    Récupère les médecins réels par région avec pagination
+    
+    Args:
+        code_region: Code région ou None pour toutes les régions
         limit: Nombre de médecins à retourner (max 100)
         offset: Décalage pour la pagination
+        curseur: Id du dernier médecin reçu (pagination par curseur, prioritaire sur offset)
+        fields: Projection "champ1,champ2" (tous les champs si None)
         
     Returns:
         Dict avec médecins paginés et métadonnées
     """
-    medecins = parser_medecins_csv()
-    medecins_zone = [m for m in medecins if m["zone"] == zone_code]
+    # Filtrer par région si spécifiée
+    if code_region:
+        positions = positions_recherche_medecins(region_code=code_region)
+    else:
+        positions = _toutes_positions()
     
-    # Pagination
-    total = len(medecins_zone)
-    medecins_pages = medecins_zone[offset:offset + limit]
+    return paginer_medecins(positions, limit, offset, curseur, fields)
+
+
+def get_medecins_reels_par_zone(zone_code: str, limit: int = 100, offset: int = 0,
+                                curseur: str = None, fields: str = None) -> Dict[str, Any]:
+    """
+    Récupère les médecins réels par zone avec pagination
     
-    return {
-        "medecins": medecins_pages,
-        "pagination": {
-            "total": total,
-            "limit": limit,
-            "offset": offset,
-            "has_more": offset + limit < total,
-            "next_offset": offset + limit if offset + limit < total else None
-        }
-    }
+    Args:
+        zone_code: Code zone (A, B, C)
+        limit: Nombre de médecins à retourner (max 100)
+        offset: Décalage pour la pagination
+        curseur: Id du dernier médecin reçu (pagination par curseur, prioritaire sur offset)
+        fields: Projection "champ1,champ2" (tous les champs si None)
+        
+    Returns:
+        Dict avec médecins paginés et métadonnées
+    """
+    positions = positions_recherche_medecins(zone_code=zone_code)
+    return paginer_medecins(positions, limit, offset, curseur, fields)
 
 
 def get_comptage_medecins_par_region() -> Dict[str, Any]:
@@ -270,15 +502,16 @@ def get_statistiques_medecins_reels() -> Dict[str, Any]:
     }
 
 
-def rechercher_medecins_reels(
+def positions_recherche_medecins(
     zone_code: str = None,
     region_code: str = None,
     departement: str = None,
     specialite: str = None,
-    avec_gps: bool = None
-) -> List[Dict[str, Any]]:
+    avec_gps: bool = None,
+    approximatif: bool = False
+) -> np.ndarray:
     """
-    Recherche avancée dans les médecins réels
+    Positions (ordre du fichier) des médecins correspondant aux critères
     
     Args:
         zone_code: Code zone (A, B, C)
@@ -286,29 +519,172 @@ def rechercher_medecins_reels(
         departement: Nom du département
         specialite: Spécialité médicale
         avec_gps: Avoir des coordonnées GPS
+        approximatif: Département / spécialité par similarité de trigrammes
+                      (tolère les fautes de frappe) au lieu de la sous-chaîne
         
     Returns:
-        Liste des médecins correspondant aux critères
+        Positions triées dans parser_medecins_csv()
     """
-    medecins = parser_medecins_csv()
+    index = charger_index_texte()
+    if index is None:
+        return np.empty(0, dtype=np.int64)
     
-    # Appliquer les filtres
+    # Une liste de positions par filtre, puis intersection
+    texte = index.ressemble if approximatif else index.contient
+    listes = []
     if zone_code:
-        medecins = [m for m in medecins if m["zone"] == zone_code]
+        listes.append(index.egal("zone", zone_code))
     
     if region_code:
-        medecins = [m for m in medecins if str(m["code_region"]).replace('.0', '').strip() == str(region_code).replace('.0', '').strip()]
+        listes.append(index.egal("region", normaliser_code_region(region_code)))
     
     if departement:
-        medecins = [m for m in medecins if departement.lower() in m["departement"].lower()]
+        listes.append(texte("departement", departement))
     
     if specialite:
-        medecins = [m for m in medecins if specialite.lower() in m["specialite"].lower()]
+        listes.append(texte("specialite", specialite))
     
     if avec_gps is not None:
-        if avec_gps:
-            medecins = [m for m in medecins if m["latitude"] and m["longitude"]]
-        else:
-            medecins = [m for m in medecins if not (m["latitude"] and m["longitude"])]
+        listes.append(index.egal("gps", bool(avec_gps)))
     
-    return medecins
+    if not listes:
+        return _toutes_positions()
+    
+    return intersecter(listes)
+
+
+def rechercher_medecins_reels(
+    zone_code: str = None,
+    region_code: str = None,
+    departement: str = None,
+    specialite: str = None,
+    avec_gps: bool = None,
+    approximatif: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Recherche avancée dans les médecins réels
+    
+    Args:
+        zone_code: Code zone (A, B, C)
+        region_code: Code région
+        departement: Nom du département
+        specialite: Spécialité médicale
+        avec_gps: Avoir des coordonnées GPS
+        approximatif: Département / spécialité par similarité de trigrammes
+                      (tolère les fautes de frappe) au lieu de la sous-chaîne
+        
+    Returns:
+        Liste des médecins correspondant aux critères (ordre du fichier)
+    """
+    positions = positions_recherche_medecins(
+        zone_code, region_code, departement, specialite, avec_gps, approximatif
+    )
+    medecins = parser_medecins_csv()
+    return [medecins[i] for i in positions]
+
+
+def get_medecins_proches(lat: float, lon: float, k: int = 10, rayon_km: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Récupère les médecins les plus proches d'une position GPS
+    
+    Args:
+        lat: Latitude en degrés
+        lon: Longitude en degrés
+        k: Nombre maximum de médecins
+        rayon_km: Distance maximale en km (None = pas de limite)
+        
+    Returns:
+        Dict avec médecins triés par distance croissante (champ distance_km)
+    """
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        raise ValueError("Coordonnées invalides (lat entre -90 et 90, lon entre -180 et 180)")
+    if rayon_km is not None and rayon_km < 0:
+        raise ValueError("rayon_km doit être positif")
+    
+    index = charger_index_spatial()
+    medecins = parser_medecins_csv()
+    voisins = index.proches(lat, lon, k, rayon_km) if index is not None else []
+    
+    return {
+        "centre": {"latitude": lat, "longitude": lon},
+        "k": k,
+        "rayon_km": rayon_km,
+        "total_trouves": len(voisins),
+        "medecins": [
+            {**medecins[i], "distance_km": round(distance, 3)}
+            for i, distance in voisins
+        ]
+    }
+
+
+def get_medecins_bbox(bbox: str, limit: int = 100, offset: int = 0,
+                      curseur: str = None, fields: str = None) -> Dict[str, Any]:
+    """
+    Récupère les médecins situés dans un rectangle géographique avec pagination
+    
+    Args:
+        bbox: Rectangle "lon_min,lat_min,lon_max,lat_max"
+        limit: Nombre de médecins à retourner
+        offset: Décalage pour la pagination
+        curseur: Id du dernier médecin reçu (pagination par curseur, prioritaire sur offset)
+        fields: Projection "champ1,champ2" (tous les champs si None)
+        
+    Returns:
+        Dict avec médecins paginés et métadonnées
+    """
+    lon_min, lat_min, lon_max, lat_max = parser_bbox(bbox)
+    
+    index = charger_index_spatial()
+    indices = index.dans_rectangle(lon_min, lat_min, lon_max, lat_max) if index is not None else np.empty(0, dtype=np.int64)
+    
+    return {
+        "bbox": {"lon_min": lon_min, "lat_min": lat_min, "lon_max": lon_max, "lat_max": lat_max},
+        **paginer_medecins(indices, limit, offset, curseur, fields)
+    }
+
+
+def get_clusters_medecins(bbox: str, zoom: int) -> Dict[str, Any]:
+    """
+    Regroupe les médecins d'un rectangle pour l'affichage carte à un niveau de zoom
+    
+    Args:
+        bbox: Rectangle "lon_min,lat_min,lon_max,lat_max"
+        zoom: Niveau de zoom de la carte (0 = monde, borné au niveau le plus fin)
+        
+    Returns:
+        Dict avec clusters (nombre, centroïde, exemples) et total de médecins
+    """
+    lon_min, lat_min, lon_max, lat_max = parser_bbox(bbox)
+    if zoom < 0:
+        raise ValueError("zoom doit être positif")
+    
+    grille = charger_grille_clusters()
+    medecins = parser_medecins_csv()
+    clusters = grille.clusters(lon_min, lat_min, lon_max, lat_max, zoom) if grille is not None else []
+    
+    return {
+        "bbox": {"lon_min": lon_min, "lat_min": lat_min, "lon_max": lon_max, "lat_max": lat_max},
+        "zoom": min(zoom, grille.zoom_max) if grille is not None else zoom,
+        "total_medecins": sum(c["nb"] for c in clusters),
+        "nb_clusters": len(clusters),
+        "clusters": [
+            {
+                "latitude": round(c["latitude"], 6),
+                "longitude": round(c["longitude"], 6),
+                "nb_medecins": c["nb"],
+                "exemples": [
+                    {
+                        "id": medecins[i]["id"],
+                        "nom": medecins[i]["nom"],
+                        "adresse": medecins[i]["adresse"],
+                        "commune": medecins[i]["commune"],
+                        "latitude": medecins[i]["latitude"],
+                        "longitude": medecins[i]["longitude"],
+                        "telephone": medecins[i]["telephone"]
+                    }
+                    for i in c["exemples"]
+                ]
+            }
+            for c in clusters
+        ]
+    }
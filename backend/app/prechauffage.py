@@ -0,0 +1,126 @@
+"""
+Module PRÉCHAUFFAGE
+Charge les jeux de données, construit les tables dérivées et les index, puis calcule
+les agrégats de l'année par défaut avant que le worker ne reçoive du trafic.
+
+L'état de chaque étape (statut, durée) est exposé par la route /ready. Après un
+rechargement à chaud, les mêmes étapes recalculent les agrégats dérivés (les
+données inchangées sont servies par le registre).
+Désactivable en développement avec la variable d'environnement PRECHAUFFAGE=0.
+"""
+import importlib
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+ANNEE_DEFAUT = "2024"
+
+# Étapes dans l'ordre d'exécution : données et index d'abord, agrégats ensuite.
+# (nom, module, fonction ou None, arguments) : les modules sont importés par l'étape elle-même,
+# le temps d'import de pandas / numpy / scipy est donc compté dans la première étape.
+ETAPES: List[Tuple[str, str, str, tuple]] = [
+    ("snapshot", "app.snapshot_colonnes", "charger_manifeste", ()),
+    ("couverture_cube", "app.couverture_vaccins", "obtenir_cube", ()),
+    ("couverture_departementale", "app.couverture_vaccins", "charger_dataframe_departemental", ()),
+    ("urgences_departementales", "app.urgences", "charger_donnees_urgences_departementales", ()),
+    ("urgences_regionales", "app.urgences", "charger_donnees_urgences_regionales", ()),
+    ("historique_doses", "app.prediction", "charger_donnees_historiques", ()),
+    ("medecins", "app.medecins_reels", "parser_medecins_csv", ()),
+    ("medecins_index_texte", "app.medecins_reels", "charger_index_texte", ()),
+    ("medecins_index_spatial", "app.medecins_reels", "charger_index_spatial", ()),
+    ("medecins_clusters", "app.medecins_reels", "charger_grille_clusters", ()),
+    ("urgences_nationales", "app.urgences", "get_urgences_nationales", ()),
+    ("capacite_departements", "app.capacite", "calculer_capacite_departements", (ANNEE_DEFAUT,)),
+    ("stock_vs_besoin", "app.prediction", "get_stock_vs_besoin_par_zone", ()),
+    # Index des fiches zone / département (survol de la carte) : en dernier, une fois tous les fichiers chargés
+    ("vaccination_zones", "app.vaccination", "index_zones", (ANNEE_DEFAUT,)),
+    ("vaccination_departements", "app.vaccination", "index_departements", (ANNEE_DEFAUT,)),
+    ("modules_ia", "app.ia_analyzer", None, ()),  # import seul (requests), sans appel réseau
+]
+
+_etat = {"debut": None, "fin": None, "etapes": {}, "dernier_rafraichissement": None}
+_verrou = threading.Lock()
+
+
+def prechauffage_active() -> bool:
+    """Le préchauffage est actif sauf si PRECHAUFFAGE vaut 0 / false / non"""
+    return os.environ.get("PRECHAUFFAGE", "1").strip().lower() not in ("0", "false", "non")
+
+
+def prechauffer() -> Dict[str, Any]:
+    """
+    Exécute toutes les étapes (une étape en erreur n'empêche pas les suivantes)
+
+    Returns:
+        État du préchauffage (voir etat_preparation)
+    """
+    if not prechauffage_active():
+        with _verrou:
+            _etat["debut"] = _etat["fin"] = datetime.now().isoformat()
+            _etat["etapes"] = {}
+        print("ℹ️  Préchauffage désactivé (PRECHAUFFAGE=0) : chargements à la première requête")
+        return etat_preparation()
+
+    with _verrou:
+        _etat["debut"] = datetime.now().isoformat()
+        _etat["fin"] = None
+        _etat["etapes"] = {nom: {"statut": "en_attente"} for nom, *_ in ETAPES}
+
+    debut_total = time.perf_counter()
+    _executer_etapes()
+
+    with _verrou:
+        _etat["fin"] = datetime.now().isoformat()
+    print(f"✅ Préchauffage terminé en {time.perf_counter() - debut_total:.2f} s")
+    return etat_preparation()
+
+
+def rafraichir_agregats(fichiers: List[str]):
+    """
+    Recalcule les index et agrégats dérivés après un rechargement à chaud
+    (le worker reste prêt pendant le recalcul)
+    """
+    _executer_etapes()
+    with _verrou:
+        _etat["dernier_rafraichissement"] = {"date": datetime.now().isoformat(), "fichiers": list(fichiers)}
+
+
+def _executer_etapes():
+    for nom, module, fonction, arguments in ETAPES:
+        debut = time.perf_counter()
+        try:
+            module_charge = importlib.import_module(module)
+            if fonction is not None:
+                getattr(module_charge, fonction)(*arguments)
+            resultat = {"statut": "ok"}
+        except Exception as e:
+            print(f"⚠️  Préchauffage {nom}: {e}")
+            resultat = {"statut": "erreur", "erreur": str(e)}
+        resultat["duree_ms"] = round((time.perf_counter() - debut) * 1000, 1)
+        with _verrou:
+            _etat["etapes"][nom] = resultat
+
+
+def etat_preparation() -> Dict[str, Any]:
+    """
+    État de préparation du worker
+
+    Returns:
+        Dict avec pret (préchauffage terminé), dates, durée totale et détail par étape
+    """
+    with _verrou:
+        etapes = {nom: dict(etape) for nom, etape in _etat["etapes"].items()}
+        debut, fin = _etat["debut"], _etat["fin"]
+        rafraichissement = _etat["dernier_rafraichissement"]
+
+    return {
+        "pret": fin is not None,
+        "debut": debut,
+        "fin": fin,
+        "duree_totale_ms": round(sum(e.get("duree_ms", 0) for e in etapes.values()), 1),
+        "etapes_en_erreur": [nom for nom, e in etapes.items() if e["statut"] == "erreur"],
+        "etapes": etapes,
+        "dernier_rafraichissement": rafraichissement
+    }
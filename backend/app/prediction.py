@@ -4,62 +4,81 @@ Prédiction des besoins en doses de vaccin par zone
 Utilise les données historiques 2021-2024
 """
 import pandas as pd
-import json
 from pathlib import Path
 from datetime import datetime, timedelta
-from app.config import REGIONS_ZONES
+from app.fraicheur import servi_perime_si_vieux
+from app.geographie import geographie
+from app.registre_donnees import registre
+from app.index_temporel import indexer_dataframe
+from app.snapshot_colonnes import lire_dataframe_snapshot
 
 DATA_DIR = Path(__file__).parent.parent / "data" / "datagouve"
 
+# Comparaison stock / besoin : valeur servie jusqu'à 5 min, puis recalculée en arrière-plan
+FRAICHEUR_STOCK_VS_BESOIN_S = 300
 
-def charger_donnees_historiques():
+
+def fichiers_doses_actes():
     """
-    Charge toutes les données historiques de doses-actes (2021-2024)
+    Liste les fichiers doses-actes disponibles (CSV 2021-2022, JSON 2023-2024)
     
     Returns:
-        DataFrame avec colonnes: campagne, date, jour, variable, groupe, valeur
+        Liste de (annee, chemin)
     """
-    all_data = []
-    
-    # Charger CSV (2021, 2022)
+    fichiers = []
     for annee in ["2021", "2022"]:
         fichier = DATA_DIR / annee / f"doses-actes-{annee}.csv"
         if fichier.exists():
-            try:
-                df = pd.read_csv(fichier)
-                all_data.append(df)
-                print(f"✅ Chargé {annee}: {len(df)} lignes")
-            except Exception as e:
-                print(f"⚠️  Erreur {annee}: {e}")
-    
-    # Charger JSON (2023, 2024)
+            fichiers.append((annee, fichier))
+    
     for annee in ["2023", "2024"]:
         fichier = DATA_DIR / annee / f"doses-actes-{annee}.json"
         if not fichier.exists():
             fichier = DATA_DIR / annee / f"doses-actes-{annee} (1).json"
-        
         if fichier.exists():
-            try:
-                with open(fichier, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                df = pd.DataFrame(data)
-                all_data.append(df)
-                print(f"✅ Chargé {annee}: {len(df)} lignes")
-            except Exception as e:
-                print(f"⚠️  Erreur {annee}: {e}")
+            fichiers.append((annee, fichier))
+    
+    return fichiers
+
+
+def lire_doses_actes(chemin):
+    """
+    Parseur pour le registre : doses-actes d'une campagne triées par date, la colonne date
+    convertie quel que soit son format source (texte ISO dans les CSV, timestamp en
+    millisecondes dans les JSON)
+    """
+    df, index = indexer_dataframe(lire_dataframe_snapshot(chemin), "date")
+    if 'date' in df.columns:
+        df['date'] = index.dates
+    return df
+
+
+def charger_donnees_historiques():
+    """
+    Charge toutes les données historiques de doses-actes (2021-2024), triées par date
+    (les campagnes se chevauchent d'une année sur l'autre)
+    
+    Returns:
+        DataFrame avec colonnes: campagne, date, jour, variable, groupe, valeur
+    """
+    all_data = []
+    
+    for annee, fichier in fichiers_doses_actes():
+        try:
+            df = registre.charger(fichier, lire_doses_actes)
+            all_data.append(df)
+        except Exception as e:
+            print(f"⚠️  Erreur {annee}: {e}")
     
     if not all_data:
         print("❌ Aucune donnée historique trouvée")
         return pd.DataFrame()
     
-    # Fusionner toutes les données
+    # Fusionner toutes les données (chaque campagne est déjà triée : fusion stable)
     df_final = pd.concat(all_data, ignore_index=True)
-    
-    # Convertir date en datetime
     if 'date' in df_final.columns:
-        df_final['date'] = pd.to_datetime(df_final['date'], errors='coerce')
+        df_final = df_final.sort_values('date', kind='stable', ignore_index=True)
     
-    print(f"📊 Total chargé: {len(df_final)} lignes")
     return df_final
 
 
@@ -205,14 +224,8 @@ def calculer_facteur_zone(zone_code):
     """
     Calcule le facteur de population par zone
     """
-    populations = {
-        "A": sum([info["population"] for code, info in REGIONS_ZONES.items() if info["zone"] == "A"]),
-        "B": sum([info["population"] for code, info in REGIONS_ZONES.items() if info["zone"] == "B"]),
-        "C": sum([info["population"] for code, info in REGIONS_ZONES.items() if info["zone"] == "C"])
-    }
-    
-    total_pop = sum(populations.values())
-    return populations.get(zone_code, 1) / total_pop
+    population = geographie.population_zone(zone_code) if zone_code in geographie.index_zone else 1
+    return population / geographie.population_zone()
 
 
 def determiner_saison(mois):
@@ -234,10 +247,7 @@ def generer_prediction_fallback(zone_code, horizon_mois):
     # Estimation basée sur population cible
     from app.config import POURCENTAGE_CIBLE
     
-    if zone_code:
-        pop_zone = sum([info["population"] for code, info in REGIONS_ZONES.items() if info["zone"] == zone_code])
-    else:
-        pop_zone = sum([info["population"] for code, info in REGIONS_ZONES.items()])
+    pop_zone = geographie.population_zone(zone_code or None)
     
     pop_cible = int(pop_zone * POURCENTAGE_CIBLE)
     
@@ -284,12 +294,8 @@ def get_stock_actuel_simule(zone_code=None):
     df = charger_donnees_historiques()
     
     # Calcul du facteur de zone
-    if zone_code:
-        pop_zone = sum([info["population"] for code, info in REGIONS_ZONES.items() if info["zone"] == zone_code])
-        facteur_population = pop_zone / 65_000_000
-    else:
-        facteur_population = 1.0
-        pop_zone = sum([info["population"] for code, info in REGIONS_ZONES.items()])
+    pop_zone = geographie.population_zone(zone_code or None)
+    facteur_population = pop_zone / 65_000_000 if zone_code else 1.0
     
     # Si on a des données historiques, utiliser la moyenne récente
     if not df.empty:
@@ -359,6 +365,7 @@ def generer_recommandation_stock(niveau, mois):
         return "✅ Stock excellent - Réserves suffisantes"
 
 
+@servi_perime_si_vieux(FRAICHEUR_STOCK_VS_BESOIN_S)
 def get_stock_vs_besoin_par_zone():
     """
     Compare le stock actuel avec les besoins prévus pour chaque zone (A, B, C)
@@ -390,7 +397,7 @@ def get_stock_vs_besoin_par_zone():
         else:
             # Fallback : estimer basé sur population
             from app.config import POURCENTAGE_CIBLE
-            pop_zone = sum([info["population"] for code, info in REGIONS_ZONES.items() if info["zone"] == zone_code])
+            pop_zone = geographie.population_zone(zone_code)
             pop_cible = int(pop_zone * POURCENTAGE_CIBLE)
             
             # Estimation : 1.5 doses par personne sur la campagne (oct-fév = 5 mois)
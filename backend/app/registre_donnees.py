@@ -0,0 +1,235 @@
+"""
+Module REGISTRE DES DONNÉES
+Cache mémoire partagé pour tous les fichiers sources (JSON / CSV)
+Chaque fichier est parsé une seule fois puis rechargé uniquement
+si sa date de modification ou sa taille change
+
+Rechargement à chaud : quand un SurveillantDonnees est actif, les requêtes ne
+consultent plus les fichiers ; le surveillant reconstruit les entrées modifiées
+hors du chemin des requêtes puis les publie d'un bloc (voir recharger).
+"""
+import contextvars
+import hashlib
+import json
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+def lire_json(chemin: Path) -> Any:
+    """Parse un fichier JSON (liste d'enregistrements ou dict de colonnes)"""
+    with open(chemin, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def lire_json_dataframe(chemin: Path):
+    """Parse un fichier JSON et le convertit en DataFrame"""
+    import pandas as pd
+
+    return pd.DataFrame(lire_json(chemin))
+
+
+# Version des entrées épinglée pour la requête en cours (voir RegistreDonnees.instantane)
+_instantane: contextvars.ContextVar = contextvars.ContextVar("instantane_registre", default=None)
+
+
+def _signature(chemin) -> Tuple[int, int]:
+    stat = os.stat(chemin)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _empreinte(signatures) -> str:
+    return hashlib.blake2b(repr(signatures).encode(), digest_size=8).hexdigest()
+
+
+class RegistreDonnees:
+    """
+    Registre thread-safe des jeux de données chargés en mémoire.
+
+    Les objets retournés sont partagés entre toutes les requêtes :
+    ils ne doivent JAMAIS être modifiés en place (faire une copie avant).
+
+    Le dictionnaire des entrées est remplacé (copie) à chaque modification,
+    jamais modifié en place : une requête peut donc en garder une version cohérente.
+    """
+
+    def __init__(self):
+        self._verrou = threading.Lock()
+        self._entrees: Dict[Tuple, Tuple[Tuple[int, int], Any]] = {}
+        self._verrous_chargement: Dict[Tuple, threading.Lock] = {}
+        self._local = threading.local()
+        self._version: Tuple[Any, str] = (None, "")
+        # Signature des fichiers dont le dernier rechargement a échoué (non retentés tant qu'ils ne changent pas)
+        self._echecs: Dict[str, Tuple[int, int]] = {}
+        # True quand un surveillant détecte les modifications : les requêtes ne font plus de stat
+        self.surveille = False
+
+    def charger(self, chemin, parseur: Callable = lire_json, **options) -> Any:
+        """
+        Retourne le contenu parsé d'un fichier, depuis le cache si le fichier n'a pas changé.
+
+        Args:
+            chemin: Chemin du fichier (absolu ou relatif au répertoire courant)
+            parseur: Fonction de parsing appelée avec (chemin, **options)
+            **options: Options transmises au parseur (ex: sep=';')
+
+        Raises:
+            FileNotFoundError: Si le fichier n'existe pas
+        """
+        chemin = Path(os.path.abspath(chemin))
+        cle = (str(chemin), parseur, tuple(sorted(options.items())))
+
+        preparation = getattr(self._local, "preparation", None)
+        if preparation is not None:
+            return self._charger_preparation(cle, chemin, parseur, options, preparation)
+
+        entree = (_instantane.get() or self._entrees).get(cle)
+        if entree is not None and self.surveille:
+            return entree[1]
+
+        signature = _signature(chemin)
+        if entree is not None and entree[0] == signature:
+            return entree[1]
+
+        # Un seul thread parse un fichier donné, les autres attendent son résultat
+        with self._verrou_chargement(cle):
+            entree = self._entrees.get(cle)
+            if entree is not None and entree[0] == signature:
+                return entree[1]
+
+            valeur = parseur(chemin, **options)
+            with self._verrou:
+                self._entrees = {**self._entrees, cle: (signature, valeur)}
+            return valeur
+
+    def _charger_preparation(self, cle, chemin, parseur, options, preparation) -> Any:
+        """Chargement pendant recharger() : les nouvelles valeurs restent privées jusqu'à la publication"""
+        if cle in preparation:
+            return preparation[cle][1]
+
+        signature = _signature(chemin)
+        entree = self._entrees.get(cle)
+        if entree is not None and entree[0] == signature:
+            return entree[1]
+
+        valeur = parseur(chemin, **options)
+        preparation[cle] = (signature, valeur)
+        return valeur
+
+    def fichiers_modifies(self) -> List[str]:
+        """
+        Fichiers chargés dont la date de modification ou la taille a changé (ou supprimés),
+        sauf ceux dont le rechargement a déjà échoué pour cette même signature
+        """
+        signatures = {}
+        for (chemin, _, _), (signature, _) in self._entrees.items():
+            signatures.setdefault(chemin, set()).add(signature)
+
+        modifies = []
+        for chemin, connues in signatures.items():
+            try:
+                actuelle = _signature(chemin)
+            except OSError:
+                actuelle = None
+            if connues != {actuelle} and self._echecs.get(chemin) != actuelle:
+                modifies.append(chemin)
+        return modifies
+
+    def recharger(self, chemins: Iterable[str]) -> int:
+        """
+        Reconstruit toutes les entrées des fichiers donnés dans le thread appelant,
+        puis les publie d'un bloc (une table et ses index changent ensemble).
+
+        Les requêtes continuent de lire l'ancienne version pendant la reconstruction.
+        Une entrée dont le parsing échoue garde son ancienne valeur, et le fichier n'est
+        plus signalé par fichiers_modifies avant sa prochaine modification ; les entrées
+        des fichiers supprimés sont retirées.
+
+        Returns:
+            Nombre d'entrées reconstruites
+        """
+        chemins = {os.path.abspath(c) for c in chemins}
+        preparation: Dict[Tuple, Tuple[Tuple[int, int], Any]] = {}
+        supprimes = {c for c in chemins if not os.path.exists(c)}
+        echecs: Dict[str, Tuple[int, int]] = {}
+
+        self._local.preparation = preparation
+        try:
+            for cle in [c for c in self._entrees if c[0] in chemins - supprimes]:
+                chemin, parseur, options = cle
+                try:
+                    signature = _signature(chemin)
+                except OSError:
+                    continue
+                try:
+                    self.charger(chemin, parseur, **dict(options))
+                except Exception as e:
+                    print(f"⚠️  Rechargement {chemin} ({getattr(parseur, '__name__', parseur)}): {e} "
+                          f"(ancienne version conservée jusqu'à la prochaine modification)")
+                    echecs[chemin] = signature
+        finally:
+            self._local.preparation = None
+
+        with self._verrou:
+            entrees = {c: e for c, e in self._entrees.items() if c[0] not in supprimes}
+            entrees.update(preparation)
+            self._entrees = entrees
+            self._echecs = {c: sig for c, sig in self._echecs.items() if c not in chemins}
+            self._echecs.update(echecs)
+        return len(preparation)
+
+    def version(self) -> str:
+        """
+        Version des données lues par la requête en cours : empreinte des signatures
+        (date de modification, taille) des fichiers chargés. Elle change dès qu'un
+        fichier est modifié, ce qui invalide les caches qui l'incluent dans leur clé.
+
+        Avec un surveillant actif, seules les signatures publiées comptent (aucun stat),
+        et l'empreinte n'est calculée qu'une fois par version des entrées.
+        """
+        entrees = _instantane.get() or self._entrees
+        if self.surveille:
+            derniere = self._version
+            if derniere[0] is entrees:
+                return derniere[1]
+            version = _empreinte(sorted({(c[0], e[0]) for c, e in entrees.items()}))
+            self._version = (entrees, version)
+            return version
+
+        signatures = []
+        for chemin in sorted({c[0] for c in entrees}):
+            try:
+                signatures.append((chemin, _signature(chemin)))
+            except OSError:
+                signatures.append((chemin, None))
+        return _empreinte(signatures)
+
+    @contextmanager
+    def instantane(self):
+        """Épingle la version courante des entrées pour la durée d'une requête"""
+        jeton = _instantane.set(self._entrees)
+        try:
+            yield
+        finally:
+            _instantane.reset(jeton)
+
+    def invalider(self, chemin: Optional[str] = None):
+        """Vide le cache d'un fichier (ou de tous les fichiers si chemin est None)"""
+        with self._verrou:
+            if chemin is None:
+                self._entrees = {}
+                return
+            chemin_abs = os.path.abspath(chemin)
+            self._entrees = {c: e for c, e in self._entrees.items() if c[0] != chemin_abs}
+
+    def _verrou_chargement(self, cle: Tuple) -> threading.Lock:
+        with self._verrou:
+            if cle not in self._verrous_chargement:
+                self._verrous_chargement[cle] = threading.Lock()
+            return self._verrous_chargement[cle]
+
+
+# Instance unique partagée par tout le processus
+registre = RegistreDonnees()
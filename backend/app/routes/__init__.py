@@ -0,0 +1,3 @@
+"""
+Routes de l'API, une sous-partie par domaine (APIRouter inclus par app.main)
+"""
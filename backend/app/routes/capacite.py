@@ -0,0 +1,56 @@
+"""
+Routes CAPACITÉ VACCINALE
+Capacité des médecins réels face à la demande restante par département
+
+Les modules de calcul (pandas, numpy, scipy, requests) sont importés dans les routes :
+au premier appel ou pendant le préchauffage, pas au démarrage du worker.
+"""
+from datetime import datetime
+
+from fastapi import APIRouter
+
+router = APIRouter()
+
+
+@router.get("/capacite/departements")
+def get_capacite_departements_api(annee: str = "2024", zone: str = None, duree_campagne: int = 90):
+    """
+    **💉 Capacité Vaccinale vs Demande par Département**
+    
+    Confronte la capacité de vaccination des médecins réels (capacité journalière)
+    à la population cible restant à vacciner pour atteindre l'objectif de 70%.
+    
+    **Paramètres** :
+    - annee : Année de référence (défaut 2024)
+    - zone : Filtre par zone A, B ou C (optionnel)
+    - duree_campagne : Durée de la campagne en jours (défaut 90)
+    
+    **Exemples** :
+    - `/capacite/departements` → Tous les départements
+    - `/capacite/departements?zone=C&duree_campagne=60` → Zone C, campagne de 60 jours
+    
+    **Retourne** :
+    - Par département : demande restante, capacité, jours pour atteindre l'objectif
+    - Agrégats par zone et national
+    - Départements goulots d'étranglement (objectif hors d'atteinte sur la campagne)
+    """
+    from app.capacite import calculer_capacite_departements
+    try:
+        if zone and zone not in ["A", "B", "C"]:
+            return {
+                "success": False,
+                "error": "Zone code doit être A, B ou C"
+            }
+        
+        result = calculer_capacite_departements(annee, zone, duree_campagne)
+        
+        return {
+            "success": True,
+            "data": result,
+            "timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
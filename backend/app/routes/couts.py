@@ -0,0 +1,170 @@
+"""
+Routes COÛTS RÉELS
+Coûts de la vaccination grippe (national, zone, département, scénarios)
+
+Les modules de calcul (pandas, numpy, scipy, requests) sont importés dans les routes :
+au premier appel ou pendant le préchauffage, pas au démarrage du worker.
+"""
+from datetime import datetime
+
+from fastapi import APIRouter
+
+router = APIRouter()
+
+
+@router.get("/couts/national")
+def get_couts_nationaux():
+    """
+    **💰 Coûts Réels de la Vaccination Grippe - France**
+    
+    Calcule l'impact financier complet de la vaccination grippe :
+    
+    **Coûts Directs** :
+    - Vaccins (6.20€) + Honoraire pharmacien (0.60€)
+    - Consultations médicales (25€)
+    - Remboursements Sécurité Sociale (65% vaccins, 70% consultations)
+    
+    **Coûts Indirects Évités** :
+    - Consultations pour grippe (25€)
+    - Médicaments (15€)
+    - Arrêts maladie (5 jours × 50€ = 250€)
+    - Hospitalisations (3 jours × 800€ = 2,400€)
+    - Complications (500€)
+    
+    **Retourne** :
+    - Coûts totaux vaccination
+    - Économies générées
+    - ROI (Return on Investment)
+    - Répartition par acteur (Sécu, Mutuelles, Patients)
+    - Impact économique (jours d'arrêt évités, hospitalisations évitées)
+    """
+    from app.couts_reels import get_couts_vaccination_grippe
+    try:
+        couts = get_couts_vaccination_grippe()
+        
+        return {
+            "success": True,
+            "data": couts,
+            "timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@router.get("/couts/zone/{zone_code}")
+def get_couts_par_zone_api(zone_code: str):
+    """
+    **💰 Coûts de la Vaccination par Zone**
+    
+    Calcule les coûts spécifiques à une zone géographique.
+    
+    **Paramètres** :
+    - zone_code : Code zone (A, B, C)
+    
+    **Retourne** :
+    - Population de la zone
+    - Taux de vaccination zone
+    - Coûts vaccination zone
+    - Économies générées zone
+    - ROI zone
+    """
+    from app.couts_reels import get_couts_par_zone
+    try:
+        if zone_code not in ["A", "B", "C"]:
+            return {
+                "success": False,
+                "error": "Zone code doit être A, B ou C"
+            }
+        
+        couts_zone = get_couts_par_zone(zone_code)
+        
+        return {
+            "success": True,
+            "zone": zone_code,
+            "data": couts_zone,
+            "timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@router.get("/couts/departement/{code_departement}")
+def get_couts_par_departement_api(code_departement: str):
+    """
+    **💰 Coûts de la Vaccination par Département**
+    
+    Calcule les coûts spécifiques à un département.
+    
+    **Paramètres** :
+    - code_departement : Code département (75, 13, 69, etc.)
+    
+    **Exemples** :
+    - `/couts/departement/75` → Coûts Paris
+    - `/couts/departement/13` → Coûts Bouches-du-Rhône
+    - `/couts/departement/69` → Coûts Rhône
+    
+    **Retourne** :
+    - Population département
+    - Taux de vaccination département
+    - Coûts vaccination département
+    - Économies générées département
+    - ROI département
+    """
+    from app.couts_reels import get_couts_par_departement
+    try:
+        couts_dept = get_couts_par_departement(code_departement)
+        
+        return {
+            "success": True,
+            "departement": code_departement,
+            "data": couts_dept,
+            "timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@router.get("/couts/scenarios")
+def get_scenarios_vaccination_api():
+    """
+    **📊 Scénarios de Vaccination - Comparaison des Coûts**
+    
+    Compare différents taux de vaccination et leur impact financier.
+    
+    **Scénarios analysés** :
+    - 20% : Taux actuel faible
+    - 35% : Taux actuel moyen
+    - 50% : Objectif intermédiaire
+    - 70% : Objectif optimal
+    - 85% : Objectif ambitieux
+    
+    **Retourne** :
+    - Coûts par scénario
+    - Économies par scénario
+    - ROI par scénario
+    - Recommandation du taux optimal
+    - Justification économique
+    """
+    from app.couts_reels import get_scenarios_vaccination
+    try:
+        scenarios = get_scenarios_vaccination()
+        
+        return {
+            "success": True,
+            "data": scenarios,
+            "timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
@@ -0,0 +1,355 @@
+"""
+Routes COUVERTURES VACCINALES
+Couvertures HPV et grippe (national, régional, départemental) et utilitaires
+
+Les modules de calcul (pandas, numpy, scipy, requests) sont importés dans les routes :
+au premier appel ou pendant le préchauffage, pas au démarrage du worker.
+"""
+
+from fastapi import APIRouter
+
+router = APIRouter()
+
+
+# ------------------
+# HPV (Papillomavirus)
+# ------------------
+
+@router.get("/couverture/hpv/national")
+def get_couverture_hpv_national(annee_debut: str = "2022"):
+    """
+    **💉 Couverture vaccinale HPV au niveau national**
+    
+    Données HPV (filles et garçons, doses 1 et 2) depuis 2022
+    
+    **Paramètres** :
+    - `annee_debut` : Année de début (défaut: 2022)
+    
+    **Retourne** :
+    - Évolution annuelle HPV filles/garçons
+    """
+    from app.couverture_vaccins import get_hpv_national
+    try:
+        data = get_hpv_national(annee_debut=annee_debut)
+        return {
+            "success": True,
+            "data": data
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@router.get("/couverture/hpv/regional")
+def get_couverture_hpv_regional_tous(annee_debut: str = "2022"):
+    """
+    **💉 Couverture HPV toutes les régions**
+    
+    **Paramètres** :
+    - `annee_debut` : Année de début (défaut: 2022)
+    """
+    from app.couverture_vaccins import get_hpv_regional
+    try:
+        data = get_hpv_regional(code_region=None, annee_debut=annee_debut)
+        return {
+            "success": True,
+            "data": data
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@router.get("/couverture/hpv/regional/{code_region}")
+def get_couverture_hpv_regional_detail(code_region: str, annee_debut: str = "2022"):
+    """
+    **💉 Couverture HPV d'une région spécifique**
+    
+    **Paramètres** :
+    - `code_region` : Code région (ex: "11" pour IDF)
+    - `annee_debut` : Année de début (défaut: 2022)
+    """
+    from app.couverture_vaccins import get_hpv_regional
+    try:
+        data = get_hpv_regional(code_region=code_region, annee_debut=annee_debut)
+        return {
+            "success": True,
+            "data": data
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@router.get("/couverture/hpv/departemental")
+def get_couverture_hpv_departemental_tous(annee_debut: str = "2022"):
+    """
+    **💉 Couverture HPV tous les départements**
+    
+    **Paramètres** :
+    - `annee_debut` : Année de début (défaut: 2022)
+    """
+    from app.couverture_vaccins import get_hpv_departemental
+    try:
+        data = get_hpv_departemental(code_dept=None, annee_debut=annee_debut)
+        return {
+            "success": True,
+            "data": data
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@router.get("/couverture/hpv/departemental/{code_dept}")
+def get_couverture_hpv_departemental_detail(code_dept: str, annee_debut: str = "2022"):
+    """
+    **💉 Couverture HPV d'un département spécifique**
+    
+    **Paramètres** :
+    - `code_dept` : Code département (ex: "75" pour Paris)
+    - `annee_debut` : Année de début (défaut: 2022)
+    """
+    from app.couverture_vaccins import get_hpv_departemental
+    try:
+        data = get_hpv_departemental(code_dept=code_dept, annee_debut=annee_debut)
+        return {
+            "success": True,
+            "data": data
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+# ------------------
+# GRIPPE DÉTAILLÉE
+# ------------------
+
+@router.get("/couverture/grippe/national")
+def get_couverture_grippe_national_route(annee: str = None):
+    """
+    **🦠 Couverture vaccinale grippe détaillée au niveau national**
+    
+    Toutes les catégories :
+    - Moins de 65 ans
+    - 65 ans et plus
+    - 65-74 ans
+    - 75 ans et plus
+    - Résidents EHPAD
+    - Professionnels de santé
+    
+    **Paramètres** :
+    - `annee` : Année spécifique ou None pour toutes les années
+    """
+    from app.couverture_vaccins import get_grippe_national
+    try:
+        data = get_grippe_national(annee=annee)
+        return {
+            "success": True,
+            "data": data
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@router.get("/couverture/grippe/regional")
+def get_couverture_grippe_regional_tous(annee: str = None):
+    """
+    **🦠 Couverture grippe toutes les régions**
+    
+    **Paramètres** :
+    - `annee` : Année spécifique ou None pour toutes
+    """
+    from app.couverture_vaccins import get_grippe_regional
+    try:
+        data = get_grippe_regional(code_region=None, annee=annee)
+        return {
+            "success": True,
+            "data": data
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@router.get("/couverture/grippe/regional/{code_region}")
+def get_couverture_grippe_regional_detail(code_region: str, annee: str = None):
+    """
+    **🦠 Couverture grippe d'une région spécifique**
+    
+    **Paramètres** :
+    - `code_region` : Code région (ex: "11")
+    - `annee` : Année spécifique ou None pour toutes
+    """
+    from app.couverture_vaccins import get_grippe_regional
+    try:
+        data = get_grippe_regional(code_region=code_region, annee=annee)
+        return {
+            "success": True,
+            "data": data
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@router.get("/couverture/grippe/zones")
+def get_couverture_grippe_par_zones(annee: str = None):
+    """
+    **🦠 Couverture grippe groupée par zones (A, B, C)**
+    
+    Regroupe les régions par zones géographiques :
+    - Zone A : Grandes métropoles (Île-de-France, Auvergne-Rhône-Alpes, etc.)
+    - Zone B : Agglomérations moyennes 
+    - Zone C : Reste de la France
+    
+    **Paramètres** :
+    - `annee` : Année spécifique ou None pour toutes
+    
+    **Retourne** :
+    - Données groupées par zone
+    - Statistiques moyennes par zone
+    - Liste des régions dans chaque zone
+    """
+    from app.couverture_vaccins import get_grippe_par_zones
+    try:
+        data = get_grippe_par_zones(annee=annee)
+        return {
+            "success": True,
+            "data": data
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@router.get("/couverture/grippe/departemental")
+def get_couverture_grippe_departemental_tous(annee: str = None):
+    """
+    **🦠 Couverture grippe tous les départements**
+    
+    **Paramètres** :
+    - `annee` : Année spécifique ou None pour toutes
+    """
+    from app.couverture_vaccins import get_grippe_departemental
+    try:
+        data = get_grippe_departemental(code_dept=None, annee=annee)
+        return {
+            "success": True,
+            "data": data
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@router.get("/couverture/grippe/departemental/{code_dept}")
+def get_couverture_grippe_departemental_detail(code_dept: str, annee: str = None):
+    """
+    **🦠 Couverture grippe d'un département spécifique**
+    
+    **Paramètres** :
+    - `code_dept` : Code département (ex: "75")
+    - `annee` : Année spécifique ou None pour toutes
+    """
+    from app.couverture_vaccins import get_grippe_departemental
+    try:
+        data = get_grippe_departemental(code_dept=code_dept, annee=annee)
+        return {
+            "success": True,
+            "data": data
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+# ------------------
+# UTILITAIRES
+# ------------------
+
+@router.get("/couverture/annees")
+def get_annees_disponibles_route():
+    """
+    **📅 Liste des années disponibles**
+    
+    Retourne les années avec données HPV et Grippe
+    """
+    from app.couverture_vaccins import get_annees_disponibles
+    try:
+        data = get_annees_disponibles()
+        return {
+            "success": True,
+            "data": data
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@router.get("/couverture/regions")
+def get_liste_regions_route():
+    """
+    **🗺️ Liste de toutes les régions**
+    
+    Retourne la liste des régions avec codes
+    """
+    from app.couverture_vaccins import get_liste_regions
+    try:
+        data = get_liste_regions()
+        return {
+            "success": True,
+            "data": data
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@router.get("/couverture/departements")
+def get_liste_departements_route():
+    """
+    **🏘️ Liste de tous les départements**
+    
+    Retourne la liste des départements avec codes et régions
+    """
+    from app.couverture_vaccins import get_liste_departements
+    try:
+        data = get_liste_departements()
+        return {
+            "success": True,
+            "data": data
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
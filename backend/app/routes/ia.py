@@ -0,0 +1,114 @@
+"""
+Routes IA
+Analyse des données par le modèle Ollama local
+
+Les modules de calcul (pandas, numpy, scipy, requests) sont importés dans les routes :
+au premier appel ou pendant le préchauffage, pas au démarrage du worker.
+"""
+
+from fastapi import APIRouter
+
+router = APIRouter()
+
+
+@router.get("/ai/status")
+def get_ai_status():
+    """
+    **🤖 Statut de l'IA Ollama**
+    
+    Vérifie si Ollama est disponible et liste les modèles installés
+    """
+    from app.ia_analyzer import get_ollama_status
+    try:
+        status = get_ollama_status()
+        
+        return {
+            "success": True,
+            "data": status
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@router.post("/ai/analyze")
+def analyze_vaccination_data(request: dict):
+    """
+    **🤖 Analyse IA des Données de Vaccination**
+    
+    Utilise Ollama (IA locale) pour analyser vos données de vaccination.
+    
+    **Corps de la requête** :
+    ```json
+    {
+        "prompt": "Analyse les tendances de vaccination et donne des recommandations",
+        "data_type": "zones|departements|national",
+        "model": "llama3.2",
+        "annee": "2024"
+    }
+    ```
+    
+    **Exemples de prompts** :
+    - "Analyse les zones les moins vaccinées et propose des actions"
+    - "Compare les taux de vaccination par région et identifie les disparités"
+    - "Donne des recommandations pour améliorer la couverture vaccinale"
+    - "Analyse l'évolution de la vaccination et prédit les tendances"
+    
+    **Retourne** :
+    - Analyse détaillée de l'IA
+    - Recommandations personnalisées
+    - Modèle utilisé et timestamp
+    """
+    from app.ia_analyzer import analyze_with_ai
+    try:
+        # Validation des paramètres
+        prompt = request.get("prompt", "")
+        data_type = request.get("data_type", "zones")
+        model = request.get("model", "llama3.2")
+        annee = request.get("annee", "2024")
+        
+        if not prompt.strip():
+            return {
+                "success": False,
+                "error": "Le prompt est requis"
+            }
+        
+        # Charger les données selon le type demandé
+        data = {}
+        
+        if data_type == "zones":
+            from app.vaccination import calculer_taux_par_zone
+            zones = calculer_taux_par_zone(annee)
+            data = {"zones": zones}
+            
+        elif data_type == "departements":
+            from app.vaccination import calculer_taux_par_departement
+            departements = calculer_taux_par_departement(annee)
+            data = {"departements": departements}
+            
+        elif data_type == "national":
+            from app.vaccination import get_statistiques_nationales
+            stats = get_statistiques_nationales(annee)
+            data = {"statistiques": stats}
+            
+        else:
+            return {
+                "success": False,
+                "error": "data_type doit être 'zones', 'departements' ou 'national'"
+            }
+        
+        # Analyser avec l'IA
+        result = analyze_with_ai(prompt, data, model)
+        
+        return {
+            "success": True,
+            "data": result
+        }
+        
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
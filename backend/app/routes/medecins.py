@@ -0,0 +1,399 @@
+"""
+Routes MÉDECINS RÉELS
+Listes paginées, recherche, carte (proximité, rectangle, clusters) et statistiques
+
+Les modules de calcul (pandas, numpy, scipy, requests) sont importés dans les routes :
+au premier appel ou pendant le préchauffage, pas au démarrage du worker.
+"""
+import json
+from datetime import datetime
+
+from fastapi import APIRouter, Header
+from fastapi.responses import StreamingResponse
+
+router = APIRouter()
+
+
+NDJSON = "application/x-ndjson"
+
+
+def _flux_ndjson(medecins):
+    """Réponse streamée : un médecin JSON par ligne, envoyé dès qu'il est produit"""
+    return StreamingResponse(
+        (json.dumps(m, ensure_ascii=False) + "\n" for m in medecins),
+        media_type=NDJSON
+    )
+
+
+@router.get("/medecins/comptage")
+def get_comptage_medecins():
+    """
+    **📊 Comptage des Médecins par Région**
+    
+    Retourne le nombre de médecins par région + 10 exemples par région.
+    **Optimisé** pour éviter de charger tous les médecins.
+    
+    **Retourne** :
+    - Nombre total de médecins
+    - Comptage par région
+    - 10 exemples de médecins par région (avec GPS)
+    - Top 10 des régions
+    """
+    from app.medecins_reels import get_comptage_medecins_par_region
+    try:
+        comptage = get_comptage_medecins_par_region()
+        
+        return {
+            "success": True,
+            "data": comptage,
+            "timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@router.get("/medecins/zone/{zone_code}")
+def get_medecins_par_zone_api(zone_code: str, limit: int = 100, offset: int = 0,
+                              curseur: str = None, fields: str = None, accept: str = Header(None)):
+    """
+    **🏥 Médecins par Zone (Paginé)**
+    
+    Retourne les médecins d'une zone spécifique avec pagination.
+    
+    **Paramètres** :
+    - zone_code : Code zone (A, B, C)
+    - limit : Nombre de médecins à retourner (max 100, défaut 100)
+    - offset : Décalage pour la pagination (défaut 0)
+    - curseur : Id du dernier médecin reçu (`next_cursor`), prioritaire sur offset
+    - fields : Champs à retourner, séparés par des virgules (défaut : tous)
+    
+    Avec l'en-tête `Accept: application/x-ndjson`, tous les médecins suivant le
+    curseur sont streamés (un objet JSON par ligne, sans limite).
+    
+    **Exemples** :
+    - `/medecins/zone/A` → 100 premiers médecins Zone A
+    - `/medecins/zone/A?limit=50&offset=100` → 50 médecins suivants
+    - `/medecins/zone/A?curseur=med_real_412&fields=id,nom,latitude,longitude` → page suivante, champs carte
+    
+    **Retourne** :
+    - Médecins de la zone avec coordonnées GPS
+    - Informations de pagination
+    """
+    from app.medecins_reels import get_medecins_reels_par_zone, iterer_medecins, positions_recherche_medecins
+    try:
+        if zone_code not in ["A", "B", "C"]:
+            return {
+                "success": False,
+                "error": "Zone code doit être A, B ou C"
+            }
+        
+        if accept and NDJSON in accept:
+            return _flux_ndjson(iterer_medecins(positions_recherche_medecins(zone_code=zone_code), curseur, fields))
+        
+        if limit > 100:
+            limit = 100  # Limite maximale
+        
+        result = get_medecins_reels_par_zone(zone_code, limit, offset, curseur, fields)
+        
+        return {
+            "success": True,
+            "zone": zone_code,
+            "data": result,
+            "timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@router.get("/medecins/region/{region_code}")
+def get_medecins_par_region_api(region_code: str, limit: int = 100, offset: int = 0,
+                                curseur: str = None, fields: str = None, accept: str = Header(None)):
+    """
+    **🏥 Médecins par Région (Paginé)**
+    
+    Retourne les médecins d'une région spécifique avec pagination.
+    
+    **Paramètres** :
+    - region_code : Code région (11, 84, 93, etc.)
+    - limit : Nombre de médecins à retourner (max 100, défaut 100)
+    - offset : Décalage pour la pagination (défaut 0)
+    - curseur : Id du dernier médecin reçu (`next_cursor`), prioritaire sur offset
+    - fields : Champs à retourner, séparés par des virgules (défaut : tous)
+    
+    Avec l'en-tête `Accept: application/x-ndjson`, tous les médecins suivant le
+    curseur sont streamés (un objet JSON par ligne, sans limite).
+    
+    **Exemples** :
+    - `/medecins/region/11` → 100 premiers médecins Île-de-France
+    - `/medecins/region/11?limit=50&offset=100` → 50 médecins suivants
+    - `/medecins/region/11?curseur=med_real_412` → page suivant le médecin med_real_412
+    
+    **Retourne** :
+    - Médecins de la région avec coordonnées GPS
+    - Informations de pagination
+    """
+    from app.medecins_reels import get_medecins_reels_par_region, iterer_medecins, positions_recherche_medecins
+    try:
+        if accept and NDJSON in accept:
+            return _flux_ndjson(iterer_medecins(positions_recherche_medecins(region_code=region_code), curseur, fields))
+        
+        if limit > 100:
+            limit = 100  # Limite maximale
+        
+        result = get_medecins_reels_par_region(region_code, limit, offset, curseur, fields)
+        
+        if result["pagination"]["total"] == 0:
+            return {
+                "success": False,
+                "error": f"Aucun médecin trouvé pour la région {region_code}"
+            }
+        
+        return {
+            "success": True,
+            "region_code": region_code,
+            "data": result,
+            "timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@router.get("/medecins/recherche")
+def rechercher_medecins_api(
+    zone_code: str = None,
+    region_code: str = None,
+    departement: str = None,
+    specialite: str = None,
+    avec_gps: bool = None,
+    approximatif: bool = False,
+    limit: int = None,
+    curseur: str = None,
+    fields: str = None,
+    accept: str = Header(None)
+):
+    """
+    **🔍 Recherche Avancée de Médecins**
+    
+    Recherche de médecins avec filtres multiples.
+    
+    **Paramètres de recherche** :
+    - zone_code : Code zone (A, B, C)
+    - region_code : Code région (11, 84, 93, etc.)
+    - departement : Nom du département
+    - specialite : Spécialité médicale
+    - avec_gps : Avoir des coordonnées GPS (true/false)
+    - approximatif : Tolérer les fautes de frappe sur departement / specialite (défaut false)
+    
+    **Pagination et format** :
+    - limit / curseur : Pagination par curseur (`next_cursor`) ; sans eux, tous les résultats
+    - fields : Champs à retourner, séparés par des virgules (défaut : tous)
+    - En-tête `Accept: application/x-ndjson` : résultats streamés, un objet JSON par ligne
+    
+    **Exemples** :
+    - `/medecins/recherche?avec_gps=true&zone_code=A`
+    - `/medecins/recherche?region_code=11&specialite=généraliste`
+    - `/medecins/recherche?departement=Calvados`
+    - `/medecins/recherche?departement=Calvdos&approximatif=true`
+    - `/medecins/recherche?zone_code=A&limit=500&fields=id,nom,latitude,longitude`
+    
+    **Retourne** :
+    - Médecins correspondant aux critères
+    - Coordonnées GPS pour carte
+    - Détails pratiques
+    """
+    from app.medecins_reels import iterer_medecins, paginer_medecins, positions_recherche_medecins
+    try:
+        positions = positions_recherche_medecins(
+            zone_code=zone_code,
+            region_code=region_code,
+            departement=departement,
+            specialite=specialite,
+            avec_gps=avec_gps,
+            approximatif=approximatif
+        )
+        
+        if accept and NDJSON in accept:
+            return _flux_ndjson(iterer_medecins(positions, curseur, fields))
+        
+        if limit is None and curseur is None:
+            medecins = list(iterer_medecins(positions, fields=fields))
+            pagination = None
+        else:
+            page = paginer_medecins(positions, limit or 100, 0, curseur, fields)
+            medecins, pagination = page["medecins"], page["pagination"]
+        
+        reponse = {
+            "success": True,
+            "filtres_appliques": {
+                "zone_code": zone_code,
+                "region_code": region_code,
+                "departement": departement,
+                "specialite": specialite,
+                "avec_gps": avec_gps,
+                "approximatif": approximatif
+            },
+            "total_trouves": len(positions),
+            "medecins": medecins,
+            "timestamp": datetime.now().isoformat()
+        }
+        if pagination is not None:
+            reponse["pagination"] = pagination
+        return reponse
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@router.get("/medecins/proches")
+def get_medecins_proches_api(lat: float, lon: float, k: int = 10, rayon_km: float = None):
+    """
+    **📍 Médecins les Plus Proches**
+    
+    Retourne les k médecins les plus proches d'une position GPS (index spatial).
+    
+    **Paramètres** :
+    - lat, lon : Position en degrés
+    - k : Nombre de médecins (max 100, défaut 10)
+    - rayon_km : Distance maximale en km (optionnel)
+    
+    **Exemples** :
+    - `/medecins/proches?lat=48.8566&lon=2.3522` → 10 médecins les plus proches de Paris
+    - `/medecins/proches?lat=49.18&lon=-0.37&k=50&rayon_km=5` → jusqu'à 50 médecins à moins de 5 km de Caen
+    
+    **Retourne** :
+    - Médecins triés par distance croissante (distance_km)
+    """
+    from app.medecins_reels import get_medecins_proches
+    try:
+        if k > 100:
+            k = 100  # Limite maximale
+        
+        result = get_medecins_proches(lat, lon, k, rayon_km)
+        
+        return {
+            "success": True,
+            "data": result,
+            "timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@router.get("/medecins/bbox")
+def get_medecins_bbox_api(bbox: str, limit: int = 100, offset: int = 0,
+                          curseur: str = None, fields: str = None):
+    """
+    **🗺️ Médecins dans un Rectangle (Paginé)**
+    
+    Retourne les médecins situés dans la zone affichée d'une carte.
+    
+    **Paramètres** :
+    - bbox : Rectangle "lon_min,lat_min,lon_max,lat_max" (en degrés)
+    - limit : Nombre de médecins à retourner (max 100, défaut 100)
+    - offset : Décalage pour la pagination (défaut 0)
+    - curseur : Id du dernier médecin reçu (`next_cursor`), prioritaire sur offset
+    - fields : Champs à retourner, séparés par des virgules (défaut : tous)
+    
+    **Exemples** :
+    - `/medecins/bbox?bbox=2.25,48.81,2.42,48.90` → médecins de Paris intra-muros
+    
+    **Retourne** :
+    - Médecins du rectangle avec coordonnées GPS
+    - Informations de pagination
+    """
+    from app.medecins_reels import get_medecins_bbox
+    try:
+        if limit > 100:
+            limit = 100  # Limite maximale
+        
+        result = get_medecins_bbox(bbox, limit, offset, curseur, fields)
+        
+        return {
+            "success": True,
+            "data": result,
+            "timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@router.get("/medecins/clusters")
+def get_clusters_medecins_api(bbox: str, zoom: int):
+    """
+    **🗺️ Clusters de Médecins pour la Carte**
+    
+    Retourne les médecins regroupés par cellule de grille (64 px à l'écran) pour le
+    niveau de zoom demandé : le nombre de marqueurs reste constant quel que soit le
+    nombre de médecins chargés.
+    
+    **Paramètres** :
+    - bbox : Zone affichée "lon_min,lat_min,lon_max,lat_max" (en degrés)
+    - zoom : Niveau de zoom de la carte (0 à 16, au-delà borné à 16)
+    
+    **Exemples** :
+    - `/medecins/clusters?bbox=-5.5,41.3,9.6,51.1&zoom=5` → France métropolitaine
+    - `/medecins/clusters?bbox=2.25,48.81,2.42,48.90&zoom=13` → Paris
+    
+    **Retourne** :
+    - Clusters avec nombre de médecins, centroïde GPS et 3 exemples
+    """
+    from app.medecins_reels import get_clusters_medecins
+    try:
+        result = get_clusters_medecins(bbox, zoom)
+        
+        return {
+            "success": True,
+            "data": result,
+            "timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@router.get("/medecins/statistiques")
+def get_statistiques_medecins_api():
+    """
+    **📊 Statistiques des Médecins**
+    
+    Retourne les statistiques globales des médecins par zone et région.
+    
+    **Retourne** :
+    - Nombre total de médecins
+    - Capacité totale de vaccination
+    - Répartition par zone
+    - Statistiques par région
+    """
+    from app.medecins_reels import get_statistiques_medecins_reels
+    try:
+        stats = get_statistiques_medecins_reels()
+        
+        return {
+            "success": True,
+            "statistiques": stats,
+            "timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
@@ -0,0 +1,164 @@
+"""
+Routes PRÉDICTION
+Prédiction des besoins en doses et suivi des stocks
+
+Les modules de calcul (pandas, numpy, scipy, requests) sont importés dans les routes :
+au premier appel ou pendant le préchauffage, pas au démarrage du worker.
+"""
+
+from fastapi import APIRouter
+
+router = APIRouter()
+
+
+@router.get("/prediction/doses")
+def get_prediction_doses_nationales(horizon_mois: int = 1):
+    """
+    **📊 Prédiction des besoins en doses au niveau national**
+    
+    Prédiction basée sur :
+    - Données historiques 2021-2024 (IQVIA)
+    - Moyenne mobile + Tendance
+    - Saisonnalité (pic oct-déc)
+    
+    **Paramètres** :
+    - `horizon_mois` : Nombre de mois à prédire (1-3)
+    
+    **Retourne** :
+    - Prédictions mensuelles
+    - Statistiques historiques
+    - Contexte saisonnier
+    """
+    from app.prediction import predire_besoins_prochains_mois
+    try:
+        if horizon_mois < 1 or horizon_mois > 3:
+            return {
+                "success": False,
+                "error": "horizon_mois doit être entre 1 et 3"
+            }
+        
+        prediction = predire_besoins_prochains_mois(zone_code=None, horizon_mois=horizon_mois)
+        
+        return {
+            "success": True,
+            "data": prediction
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@router.get("/prediction/doses/zone/{zone_code}")
+def get_prediction_doses_zone(zone_code: str, horizon_mois: int = 1):
+    """
+    **📊 Prédiction des besoins en doses par zone (A, B, C)**
+    
+    Prédiction ajustée par zone en fonction de la population
+    
+    **Paramètres** :
+    - `zone_code` : Code zone (A, B ou C)
+    - `horizon_mois` : Nombre de mois à prédire (1-3)
+    """
+    from app.prediction import predire_besoins_prochains_mois
+    try:
+        zone_code = zone_code.upper()
+        
+        if zone_code not in ["A", "B", "C"]:
+            return {
+                "success": False,
+                "error": "zone_code doit être A, B ou C"
+            }
+        
+        if horizon_mois < 1 or horizon_mois > 3:
+            return {
+                "success": False,
+                "error": "horizon_mois doit être entre 1 et 3"
+            }
+        
+        prediction = predire_besoins_prochains_mois(zone_code=zone_code, horizon_mois=horizon_mois)
+        
+        return {
+            "success": True,
+            "data": prediction
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@router.get("/prediction/stock")
+def get_stock_actuel(zone_code: str = None):
+    """
+    **📦 Estimation du stock de doses disponibles**
+    
+    Calcule une estimation du stock basée sur les données historiques :
+    - Stock disponible en entrepôt
+    - Réserve stratégique (15%)
+    - Doses distribuées dans les centres (25%)
+    - Doses en transit (5%)
+    - Niveau d'alerte et recommandations
+    - Autonomie en jours
+    
+    **Note** : Les valeurs sont estimées à partir des données de distribution.
+    En production, cette route serait connectée à l'API de gestion de stock réelle.
+    
+    **Paramètres** :
+    - `zone_code` : Code zone (A, B, C) ou None pour national
+    """
+    from app.prediction import get_stock_actuel_simule
+    try:
+        if zone_code:
+            zone_code = zone_code.upper()
+            if zone_code not in ["A", "B", "C"]:
+                return {
+                    "success": False,
+                    "error": "zone_code doit être A, B ou C"
+                }
+        
+        stock = get_stock_actuel_simule(zone_code=zone_code)
+        
+        return {
+            "success": True,
+            "data": stock
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@router.get("/prediction/stock-vs-besoin")
+def get_stock_vs_besoin():
+    """
+    **📊 Comparaison Stock vs Besoin par Zone**
+    
+    Tableau de bord comparant pour chaque zone (A, B, C) :
+    - **Current Inventory** : Stock actuel disponible
+    - **Forecasted Need (Next 30 Days)** : Besoin prévu sur 30 jours
+    - **Surplus/Deficit** : Différence (positif = excédent, négatif = déficit)
+    - Taux de couverture et autonomie en jours
+    - Recommandations et alertes
+    
+    **Retourne** :
+    - Données par zone
+    - Total national
+    - Alertes et recommandations
+    """
+    from app.prediction import get_stock_vs_besoin_par_zone
+    try:
+        data = get_stock_vs_besoin_par_zone()
+        
+        return {
+            "success": True,
+            "data": data
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
@@ -0,0 +1,228 @@
+"""
+Routes URGENCES
+Passages aux urgences et actes SOS Médecins pour grippe
+
+Les modules de calcul (pandas, numpy, scipy, requests) sont importés dans les routes :
+au premier appel ou pendant le préchauffage, pas au démarrage du worker.
+"""
+from datetime import datetime
+
+from fastapi import APIRouter
+
+router = APIRouter()
+
+
+@router.get("/urgences/national")
+def get_urgences_nationales_route(annee: str = None):
+    """
+    **🚨 Urgences Nationales**
+    
+    Retourne les données de passages aux urgences pour la grippe au niveau national.
+    
+    **Paramètres** :
+    - annee : Année (2020, 2021, 2022, 2023) ou None pour toutes les années
+    
+    **Retourne** :
+    - Données nationales d'urgences grippe
+    - Statistiques calculées
+    - Période des données
+    """
+    from app.urgences import get_urgences_nationales
+    try:
+        result = get_urgences_nationales(annee)
+        
+        return {
+            "success": True,
+            "annee": annee,
+            "data": result,
+            "timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@router.get("/urgences/regional")
+def get_urgences_regionales_route(annee: str = None):
+    """
+    **🚨 Urgences Régionales**
+    
+    Retourne les données de passages aux urgences pour la grippe par région.
+    
+    **Paramètres** :
+    - annee : Année (2020, 2021, 2022, 2023) ou None pour toutes les années
+    
+    **Retourne** :
+    - Données régionales d'urgences grippe
+    - Statistiques par région
+    - Période des données
+    """
+    from app.urgences import get_urgences_par_region
+    try:
+        result = get_urgences_par_region(None, annee)
+        
+        return {
+            "success": True,
+            "annee": annee,
+            "data": result,
+            "timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@router.get("/urgences/regional/{code_region}")
+def get_urgences_region_detail_route(code_region: str, annee: str = None):
+    """
+    **🚨 Urgences par Région**
+    
+    Retourne les données de passages aux urgences pour la grippe d'une région spécifique.
+    
+    **Paramètres** :
+    - code_region : Code région (11, 84, 93, etc.)
+    - annee : Année (2020, 2021, 2022, 2023) ou None pour toutes les années
+    
+    **Retourne** :
+    - Données d'urgences de la région
+    - Statistiques détaillées
+    - Période des données
+    """
+    from app.urgences import get_urgences_par_region
+    try:
+        result = get_urgences_par_region(code_region, annee)
+        
+        if result["total_regions"] == 0:
+            return {
+                "success": False,
+                "error": f"Aucune donnée d'urgence trouvée pour la région {code_region}"
+            }
+        
+        return {
+            "success": True,
+            "region_code": code_region,
+            "annee": annee,
+            "data": result,
+            "timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@router.get("/urgences/departemental")
+def get_urgences_departementales_route(annee: str = None):
+    """
+    **🚨 Urgences Départementales**
+    
+    Retourne les données de passages aux urgences pour la grippe par département.
+    
+    **Paramètres** :
+    - annee : Année (2020, 2021, 2022, 2023) ou None pour toutes les années
+    
+    **Retourne** :
+    - Données départementales d'urgences grippe
+    - Statistiques par département
+    - Période des données
+    """
+    from app.urgences import get_urgences_par_departement
+    try:
+        result = get_urgences_par_departement(None, annee)
+        
+        return {
+            "success": True,
+            "annee": annee,
+            "data": result,
+            "timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@router.get("/urgences/departement/{code_departement}")
+def get_urgences_departement_detail_route(code_departement: str, annee: str = None):
+    """
+    **🚨 Urgences par Département**
+    
+    Retourne les données de passages aux urgences pour la grippe d'un département spécifique.
+    
+    **Paramètres** :
+    - code_departement : Code département (61, 75, 69, etc.)
+    - annee : Année (2020, 2021, 2022, 2023) ou None pour toutes les années
+    
+    **Retourne** :
+    - Données d'urgences du département
+    - Statistiques détaillées
+    - Période des données
+    """
+    from app.urgences import get_urgences_par_departement
+    try:
+        result = get_urgences_par_departement(code_departement, annee)
+        
+        if result["total_departements"] == 0:
+            return {
+                "success": False,
+                "error": f"Aucune donnée d'urgence trouvée pour le département {code_departement}"
+            }
+        
+        return {
+            "success": True,
+            "departement_code": code_departement,
+            "annee": annee,
+            "data": result,
+            "timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@router.get("/urgences/zone/{zone_code}")
+def get_urgences_par_zone_route(zone_code: str, annee: str = None):
+    """
+    **🚨 Urgences par Zone**
+    
+    Retourne les données de passages aux urgences pour la grippe d'une zone spécifique (A, B, C).
+    
+    **Paramètres** :
+    - zone_code : Code zone (A, B, C)
+    - annee : Année (2020, 2021, 2022, 2023) ou None pour toutes les années
+    
+    **Retourne** :
+    - Données d'urgences de la zone
+    - Statistiques par région dans la zone
+    - Période des données
+    """
+    from app.urgences import get_urgences_par_zone
+    try:
+        if zone_code not in ["A", "B", "C"]:
+            return {
+                "success": False,
+                "error": "Zone code doit être A, B ou C"
+            }
+        
+        result = get_urgences_par_zone(zone_code, annee)
+        
+        return {
+            "success": True,
+            "zone": zone_code,
+            "annee": annee,
+            "data": result,
+            "timestamp": datetime.now().isoformat()
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
@@ -0,0 +1,187 @@
+"""
+Routes VACCINATION
+Taux de vaccination par zone A, B, C et par département
+
+Les modules de calcul (pandas, numpy, scipy, requests) sont importés dans les routes :
+au premier appel ou pendant le préchauffage, pas au démarrage du worker.
+"""
+
+from fastapi import APIRouter
+
+router = APIRouter()
+
+
+@router.get("/vaccination/zones")
+def get_vaccination_zones(annee: str = "2024"):
+    """
+    **Taux de vaccination par zone A, B, C**
+    
+    Retourne pour chaque zone :
+    - Population totale et cible
+    - Nombre de personnes vaccinées
+    - Taux de vaccination (%)
+    - Objectif et si atteint
+    """
+    from app.vaccination import calculer_taux_par_zone
+    try:
+        zones = calculer_taux_par_zone(annee)
+        
+        return {
+            "success": True,
+            "annee": annee,
+            "zones": zones
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@router.get("/vaccination/zone/{zone_code}")
+def get_vaccination_zone(zone_code: str, annee: str = "2024"):
+    """
+    **Détails d'une zone spécifique (A, B ou C)**
+    """
+    from app.vaccination import get_details_zone
+    try:
+        zone = get_details_zone(zone_code.upper(), annee)
+        
+        if not zone:
+            return {
+                "success": False,
+                "error": f"Zone {zone_code} non trouvée"
+            }
+        
+        return {
+            "success": True,
+            "annee": annee,
+            "zone": zone
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@router.get("/vaccination/national")
+def get_vaccination_national(annee: str = "2024"):
+    """
+    **Statistiques nationales de vaccination**
+    """
+    from app.vaccination import get_statistiques_nationales
+    try:
+        stats = get_statistiques_nationales(annee)
+        
+        return {
+            "success": True,
+            "annee": annee,
+            "statistiques": stats
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@router.get("/vaccination/departements")
+def get_vaccination_departements(annee: str = "2024", zone: str = None):
+    """
+    **📍 Taux de vaccination par département**
+    
+    Retourne pour chaque département :
+    - Code et nom du département
+    - Région et zone associées
+    - Population totale et cible
+    - Nombre de personnes vaccinées
+    - Taux de vaccination (%)
+    - Objectif et si atteint
+    
+    **Paramètres** :
+    - `annee` : Année de référence (défaut: 2024)
+    - `zone` : Filtre par zone (A, B ou C) ou None pour tous
+    """
+    from app.vaccination import calculer_taux_par_departement
+    try:
+        if zone:
+            zone = zone.upper()
+            if zone not in ["A", "B", "C"]:
+                return {
+                    "success": False,
+                    "error": "zone doit être A, B ou C"
+                }
+        
+        departements = calculer_taux_par_departement(annee, zone_filter=zone)
+        
+        return {
+            "success": True,
+            "annee": annee,
+            "zone_filtre": zone,
+            "nb_departements": len(departements),
+            "departements": departements
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@router.get("/vaccination/departement/{code_dept}")
+def get_vaccination_departement(code_dept: str, annee: str = "2024"):
+    """
+    **📍 Détails d'un département spécifique**
+    
+    **Paramètres** :
+    - `code_dept` : Code département (ex: "75" pour Paris)
+    - `annee` : Année de référence
+    """
+    from app.vaccination import get_details_departement
+    try:
+        dept = get_details_departement(code_dept, annee)
+        
+        if not dept:
+            return {
+                "success": False,
+                "error": f"Département {code_dept} non trouvé"
+            }
+        
+        return {
+            "success": True,
+            "annee": annee,
+            "departement": dept
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+@router.get("/vaccination/zones-departements")
+def get_vaccination_zones_avec_departements(annee: str = "2024"):
+    """
+    **📊 Statistiques par zone avec détails des départements**
+    
+    Vue agrégée par zone (A, B, C) avec liste des départements
+    et leurs taux de vaccination respectifs
+    
+    **Paramètres** :
+    - `annee` : Année de référence (défaut: 2024)
+    """
+    from app.vaccination import get_statistiques_par_zone_et_departement
+    try:
+        stats = get_statistiques_par_zone_et_departement(annee)
+        
+        return {
+            "success": True,
+            "annee": annee,
+            "zones": stats
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
@@ -0,0 +1,291 @@
+"""
+Module SNAPSHOT COLONNAIRE
+Normalise une seule fois les fichiers de data/datagouve (CSV séparés par ';' ou ',',
+JSON en enregistrements, JSON pandas "par colonne") en colonnes NumPy typées (.npy)
+accompagnées d'un petit manifeste JSON.
+
+L'application ouvre ensuite ces colonnes avec np.load(mmap_mode="r") : plus de parsing
+JSON au démarrage et les pages mémoire sont partagées entre les workers uvicorn.
+
+Construction du snapshot (à relancer après mise à jour des données) :
+    python -m app.snapshot_colonnes
+"""
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.registre_donnees import registre, lire_json_dataframe
+
+DATA_DIR = Path(__file__).parent.parent / "data" / "datagouve"
+SNAPSHOT_DIR = Path(__file__).parent.parent / "data" / "snapshot"
+# Tables dérivées persistées (tenseurs urgences, médecins) : hors de SNAPSHOT_DIR,
+# que construire_snapshot remplace en entier
+CACHE_DIR = Path(__file__).parent.parent / "data" / "cache"
+MANIFESTE = "manifeste.json"
+VERSION_FORMAT = 1
+
+
+# ============================================================================
+# CONSTRUCTION
+# ============================================================================
+
+def lire_source(chemin: Path) -> pd.DataFrame:
+    """Parse un fichier source (séparateur CSV détecté sur l'en-tête)"""
+    if chemin.suffix == ".csv":
+        with open(chemin, 'r', encoding='utf-8') as f:
+            entete = f.readline()
+        sep = ';' if entete.count(';') > entete.count(',') else ','
+        return pd.read_csv(chemin, sep=sep, encoding='utf-8', low_memory=False)
+    return lire_json_dataframe(chemin)
+
+
+def _encoder_colonne(serie: pd.Series):
+    """
+    Encode une colonne en tableau NumPy typé.
+
+    Returns:
+        (type, tableau, categories) avec type "numerique" ou "categorie"
+    """
+    if serie.dtype.kind in "biuf":
+        return "numerique", np.ascontiguousarray(serie.to_numpy()), None
+
+    non_nulles = serie.dropna()
+
+    # Colonne mixte nombres / chaînes numériques (ex: "50.4" et 61.0) -> float
+    if len(non_nulles) and any(not isinstance(v, str) for v in non_nulles):
+        numerique = pd.to_numeric(serie, errors='coerce')
+        if numerique.notna().sum() == len(non_nulles):
+            return "numerique", numerique.to_numpy(dtype=np.float64), None
+
+    # Chaînes (variable, groupe, reg, dep, ...) -> codes catégoriels
+    codes, categories = pd.factorize(serie.map(lambda v: v if isinstance(v, str) or pd.isna(v) else str(v)))
+    return "categorie", codes.astype(np.int32), [str(c) for c in categories]
+
+
+def _ecrire_colonnes(df: pd.DataFrame, racine: Path, dossier_table: str) -> list:
+    """Écrit chaque colonne en .npy sous racine/dossier_table et retourne leur description"""
+    colonnes = []
+    for j, nom in enumerate(df.columns):
+        type_colonne, tableau, categories = _encoder_colonne(df[nom])
+        fichier = f"{dossier_table}/c{j:03d}.npy"
+        np.save(racine / fichier, tableau)
+        colonne = {"nom": str(nom), "type": type_colonne, "fichier": fichier}
+        if categories is not None:
+            colonne["categories"] = categories
+        colonnes.append(colonne)
+    return colonnes
+
+
+def construire_snapshot(source: Path = DATA_DIR, destination: Path = SNAPSHOT_DIR) -> Dict:
+    """
+    Construit le snapshot colonnaire de tous les fichiers CSV / JSON de `source`.
+
+    Le snapshot est écrit dans un répertoire temporaire puis substitué à l'ancien.
+
+    Returns:
+        Le manifeste écrit
+    """
+    destination = Path(destination)
+    temporaire = destination.with_name(destination.name + ".tmp")
+    shutil.rmtree(temporaire, ignore_errors=True)
+    temporaire.mkdir(parents=True)
+
+    manifeste = {"version": VERSION_FORMAT, "tables": {}}
+    fichiers = sorted(p for p in Path(source).rglob("*") if p.suffix in (".csv", ".json"))
+
+    for i, chemin in enumerate(fichiers):
+        nom_table = chemin.relative_to(source).as_posix()
+        try:
+            df = lire_source(chemin)
+        except Exception as e:
+            print(f"⚠️  Snapshot: {nom_table} ignoré ({e})")
+            continue
+
+        dossier_table = f"t{i:03d}"
+        (temporaire / dossier_table).mkdir()
+
+        colonnes = _ecrire_colonnes(df, temporaire, dossier_table)
+
+        stat = chemin.stat()
+        manifeste["tables"][nom_table] = {
+            "lignes": len(df),
+            "source": {"mtime_ns": stat.st_mtime_ns, "taille": stat.st_size},
+            "colonnes": colonnes
+        }
+
+    with open(temporaire / MANIFESTE, 'w', encoding='utf-8') as f:
+        json.dump(manifeste, f, ensure_ascii=False)
+
+    ancien = destination.with_name(destination.name + ".old")
+    shutil.rmtree(ancien, ignore_errors=True)
+    if destination.exists():
+        os.replace(destination, ancien)
+    os.replace(temporaire, destination)
+    shutil.rmtree(ancien, ignore_errors=True)
+
+    return manifeste
+
+
+# ============================================================================
+# LECTURE (memory-mapped)
+# ============================================================================
+
+def charger_manifeste(dossier: Path = SNAPSHOT_DIR) -> Optional[Dict]:
+    """Charge le manifeste du snapshot (None si absent ou d'un autre format)"""
+    try:
+        manifeste = registre.charger(Path(dossier) / MANIFESTE)
+    except FileNotFoundError:
+        return None
+    if manifeste.get("version") != VERSION_FORMAT:
+        return None
+    return manifeste
+
+
+def ouvrir_table(chemin_source, dossier: Path = SNAPSHOT_DIR) -> Optional[Dict]:
+    """
+    Ouvre en lecture seule (mmap) les colonnes d'un fichier source.
+
+    Returns:
+        {"lignes", "colonnes": {nom: np.ndarray}, "categories": {nom: [str]}}
+        ou None si le fichier n'est pas dans le snapshot ou a changé depuis
+    """
+    manifeste = charger_manifeste(dossier)
+    if manifeste is None:
+        return None
+
+    try:
+        nom_table = Path(os.path.abspath(chemin_source)).relative_to(os.path.abspath(DATA_DIR)).as_posix()
+    except ValueError:
+        return None
+
+    table = manifeste["tables"].get(nom_table)
+    if table is None:
+        return None
+
+    stat = os.stat(chemin_source)
+    if (stat.st_mtime_ns, stat.st_size) != (table["source"]["mtime_ns"], table["source"]["taille"]):
+        return None
+
+    return {"lignes": table["lignes"], **_ouvrir_colonnes(dossier, table["colonnes"])}
+
+
+def _dataframe_depuis_table(table: Dict) -> pd.DataFrame:
+    """Construit un DataFrame à partir des colonnes mappées d'une table"""
+    colonnes = {}
+    for nom, valeurs in table["colonnes"].items():
+        if nom in table["categories"]:
+            # Le code -1 (absent) pointe sur le None ajouté en fin de liste
+            libelles = np.array(table["categories"][nom] + [None], dtype=object)
+            colonnes[nom] = libelles[valeurs]
+        else:
+            # Vue ndarray sur le mmap (évite la sous-classe np.memmap dans pandas)
+            colonnes[nom] = np.asarray(valeurs)
+
+    return pd.DataFrame(colonnes, copy=False)
+
+
+def _ouvrir_colonnes(racine: Path, description: list) -> Dict:
+    """Ouvre en mmap les colonnes décrites dans un manifeste"""
+    colonnes, categories = {}, {}
+    for colonne in description:
+        colonnes[colonne["nom"]] = np.load(Path(racine) / colonne["fichier"], mmap_mode="r")
+        if colonne["type"] == "categorie":
+            categories[colonne["nom"]] = colonne["categories"]
+    return {"colonnes": colonnes, "categories": categories}
+
+
+def lire_dataframe_snapshot(chemin: Path) -> pd.DataFrame:
+    """
+    Parseur DataFrame pour le registre : lit le snapshot colonnaire s'il est à jour,
+    sinon parse directement le fichier source.
+
+    Les colonnes numériques restent adossées au fichier mappé (lecture seule),
+    les colonnes catégorielles sont décodées en chaînes (None si absentes).
+    """
+    table = ouvrir_table(chemin)
+    if table is None:
+        return lire_source(Path(chemin))
+
+    return _dataframe_depuis_table(table)
+
+
+# ============================================================================
+# FICHIERS COMPAGNONS (tables dérivées persistées)
+# ============================================================================
+
+def repertoire_temporaire(dossier: Path) -> Path:
+    """Répertoire de travail unique à côté de `dossier` (plusieurs workers peuvent écrire en même temps)"""
+    dossier = Path(dossier)
+    dossier.parent.mkdir(parents=True, exist_ok=True)
+    return Path(tempfile.mkdtemp(prefix=f".{dossier.name}.", suffix=".tmp", dir=dossier.parent))
+
+
+def remplacer_repertoire(temporaire: Path, dossier: Path):
+    """
+    Publie `temporaire` sous le nom `dossier` : l'ancien répertoire est écarté sous un nom
+    unique puis supprimé. Si un autre worker a publié entre-temps, sa version est gardée.
+    """
+    ecarte = temporaire.with_suffix(".old")
+    try:
+        os.replace(dossier, ecarte)
+    except FileNotFoundError:
+        pass
+    try:
+        os.replace(temporaire, dossier)
+    except OSError:
+        shutil.rmtree(temporaire, ignore_errors=True)
+    shutil.rmtree(ecarte, ignore_errors=True)
+
+
+def sauvegarder_dataframe(df: pd.DataFrame, dossier: Path, signature: Tuple[int, int]):
+    """
+    Persiste un DataFrame dérivé d'un fichier source (mêmes encodages que le snapshot).
+
+    Args:
+        df: Table à persister
+        dossier: Répertoire cible (remplacé de façon atomique)
+        signature: (mtime_ns, taille) du fichier source
+    """
+    temporaire = repertoire_temporaire(dossier)
+    try:
+        (temporaire / "colonnes").mkdir()
+        table = {
+            "version": VERSION_FORMAT,
+            "lignes": len(df),
+            "source": {"mtime_ns": signature[0], "taille": signature[1]},
+            "colonnes": _ecrire_colonnes(df, temporaire, "colonnes")
+        }
+        with open(temporaire / MANIFESTE, 'w', encoding='utf-8') as f:
+            json.dump(table, f, ensure_ascii=False)
+    except BaseException:
+        shutil.rmtree(temporaire, ignore_errors=True)
+        raise
+
+    remplacer_repertoire(temporaire, Path(dossier))
+
+
+def charger_dataframe(dossier: Path, signature: Tuple[int, int]) -> Optional[pd.DataFrame]:
+    """Ouvre en mmap un DataFrame persisté (None s'il est absent, périmé ou remplacé pendant la lecture)"""
+    try:
+        with open(Path(dossier) / MANIFESTE, 'r', encoding='utf-8') as f:
+            table = json.load(f)
+
+        if table.get("version") != VERSION_FORMAT:
+            return None
+        if (table["source"]["mtime_ns"], table["source"]["taille"]) != tuple(signature):
+            return None
+
+        return _dataframe_depuis_table(_ouvrir_colonnes(dossier, table["colonnes"]))
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+if __name__ == "__main__":
+    resultat = construire_snapshot()
+    print(f"✅ Snapshot construit: {len(resultat['tables'])} tables dans {SNAPSHOT_DIR}")
@@ -0,0 +1,95 @@
+"""
+Module SURVEILLANCE DES DONNÉES
+Rechargement à chaud des fichiers de data/datagouve sans redémarrer le processus.
+
+Un thread d'arrière-plan vérifie périodiquement (polling, sans dépendance système)
+la date de modification et la taille des fichiers chargés dans le registre.
+Quand un fichier change, seules ses entrées (table, tables dérivées, index) sont
+reconstruites puis publiées d'un bloc, et les agrégats dérivés sont recalculés :
+les requêtes ne paient jamais le rechargement.
+
+Intervalle réglable avec SURVEILLANCE_DONNEES_INTERVALLE (secondes, 0 = désactivé).
+"""
+import os
+import threading
+import time
+from typing import Callable, List, Optional
+
+from app.registre_donnees import registre
+
+INTERVALLE_DEFAUT = 30.0
+
+
+def intervalle_configure() -> float:
+    """Intervalle de vérification en secondes (0 si la surveillance est désactivée)"""
+    try:
+        return max(0.0, float(os.environ.get("SURVEILLANCE_DONNEES_INTERVALLE", INTERVALLE_DEFAUT)))
+    except ValueError:
+        return INTERVALLE_DEFAUT
+
+
+class SurveillantDonnees:
+    """
+    Surveillant des fichiers du registre.
+
+    Args:
+        intervalle: Secondes entre deux vérifications
+        apres_rechargement: Appelé (dans le thread du surveillant) avec la liste
+                            des fichiers rechargés, pour recalculer les agrégats dérivés
+    """
+
+    def __init__(self, intervalle: float = INTERVALLE_DEFAUT,
+                 apres_rechargement: Optional[Callable[[List[str]], None]] = None):
+        self.intervalle = intervalle
+        self.apres_rechargement = apres_rechargement
+        self.dernier_rechargement = None
+        self._arret = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def verifier(self) -> List[str]:
+        """
+        Recharge les fichiers modifiés depuis leur chargement
+
+        Returns:
+            Chemins des fichiers rechargés
+        """
+        modifies = registre.fichiers_modifies()
+        if not modifies:
+            return []
+
+        debut = time.perf_counter()
+        nb_entrees = registre.recharger(modifies)
+        if self.apres_rechargement is not None:
+            try:
+                self.apres_rechargement(modifies)
+            except Exception as e:
+                print(f"⚠️  Recalcul des agrégats après rechargement: {e}")
+
+        duree = time.perf_counter() - debut
+        self.dernier_rechargement = {"fichiers": modifies, "entrees": nb_entrees, "duree_s": round(duree, 3)}
+        print(f"🔄 Données rechargées ({len(modifies)} fichier(s), {nb_entrees} entrée(s)) en {duree:.2f} s")
+        return modifies
+
+    def demarrer(self):
+        """Démarre le thread de surveillance (les requêtes ne consultent plus les fichiers)"""
+        if self._thread is not None:
+            return
+        registre.surveille = True
+        self._arret.clear()
+        self._thread = threading.Thread(target=self._boucle, name="surveillance-donnees", daemon=True)
+        self._thread.start()
+
+    def arreter(self):
+        """Arrête le thread (les requêtes reviennent à la vérification des fichiers)"""
+        self._arret.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.intervalle + 5)
+            self._thread = None
+        registre.surveille = False
+
+    def _boucle(self):
+        while not self._arret.wait(self.intervalle):
+            try:
+                self.verifier()
+            except Exception as e:
+                print(f"❌ Surveillance des données: {e}")
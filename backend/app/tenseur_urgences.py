@@ -0,0 +1,209 @@
+"""
+Module TENSEUR URGENCES
+Stockage dense des séries hebdomadaires de passages aux urgences (SAU) et d'actes
+SOS Médecins : accumulateurs exacts (somme, nombre, min, max en float64) indexés par
+[géographie, semaine, classe d'âge, indicateur], persistés en .npy sous data/cache
+et ouverts en mmap.
+
+Chaque enregistrement source est compté, y compris plusieurs lignes pour une même
+cellule géographie/semaine/âge : les agrégats sont ceux des enregistrements.
+
+L'axe des semaines est trié par date (et non par texte : "2024-S9" précède "2024-S10") :
+un filtre annuel, une période ou une saison grippale devient une plage d'indices (voir index_temporel).
+"""
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.index_temporel import IndexTemporel, convertir_dates
+from app.snapshot_colonnes import CACHE_DIR, lire_dataframe_snapshot, remplacer_repertoire, repertoire_temporaire
+
+TENSEURS_DIR = CACHE_DIR / "urgences"
+VERSION_FORMAT = 4
+
+METRIQUES = ["taux_passages_grippe_sau", "taux_hospit_grippe_sau", "taux_actes_grippe_sos"]
+
+# Position de ligne source utilisée quand une cellule est absente
+LIGNE_ABSENTE = np.iinfo(np.int32).max
+
+
+class TenseurUrgences:
+    """
+    Séries urgences d'un niveau géographique (région ou département).
+
+    - sommes[geo, semaine, age, indicateur] : somme des taux renseignés (float64)
+    - nombres[geo, semaine, age, indicateur] : nombre de taux renseignés
+    - minimums / maximums[geo, semaine, age, indicateur] : extrêmes (NaN si aucun taux)
+    - effectifs[geo, semaine, age] : nombre d'enregistrements source
+    - premieres_lignes[geo, semaine, age] : première ligne source (ordre d'apparition)
+    - libelles_cellules[geo, semaine, age] : libellés de cette première ligne (indice dans libelles, -1 si vide)
+    - semaines : dates `date_complet` triées par date (sans date ou invalides en fin)
+    """
+
+    TABLEAUX = ("sommes", "nombres", "minimums", "maximums", "effectifs", "premieres_lignes", "libelles_cellules")
+
+    def __init__(self, sommes: np.ndarray, nombres: np.ndarray, minimums: np.ndarray, maximums: np.ndarray,
+                 effectifs: np.ndarray, premieres_lignes: np.ndarray, libelles_cellules: np.ndarray, axes: Dict):
+        self.sommes = sommes
+        self.nombres = nombres
+        self.minimums = minimums
+        self.maximums = maximums
+        self.effectifs = effectifs
+        self.premieres_lignes = premieres_lignes
+        self.libelles_cellules = libelles_cellules
+        self.axes = axes
+        self.semaines: List[str] = axes["semaines"]
+        self.codes: List[str] = axes["codes"]
+        self.libelles: List[Dict] = axes["libelles"]
+        self.classes_age: List[str] = axes["classes_age"]
+        self.index_geo = {code: i for i, code in enumerate(self.codes)}
+
+        # L'axe est déjà dans l'ordre des dates : les plages de l'index sont celles de l'axe
+        self.index_temporel = IndexTemporel(convertir_dates(self.semaines))
+
+    @classmethod
+    def depuis_dataframe(cls, df: pd.DataFrame, colonne_geo: str, colonnes_libelles: Tuple[str, ...]):
+        """Construit le tenseur à partir des enregistrements (une ou plusieurs lignes par géo/semaine/âge)"""
+        n = len(df)
+
+        def colonne(nom, defaut):
+            if nom not in df.columns:
+                return pd.Series([defaut] * n, dtype=object)
+            return df[nom].astype(object).where(df[nom].notna(), defaut)
+
+        codes_geo, codes = pd.factorize(colonne(colonne_geo, "Inconnu"))
+        codes_age, classes_age = pd.factorize(colonne("sursaud_cl_age_gene", "Tous âges"))
+        dates = colonne("date_complet", "").astype(str).to_numpy()
+        etiquettes = np.unique(dates)
+        # Axe trié par date (tri stable : semaines sans date ou invalides en fin)
+        ordre = np.argsort(convertir_dates(etiquettes), kind="stable")
+        semaines = etiquettes[ordre]
+        rangs = np.empty(len(ordre), dtype=np.int64)
+        rangs[ordre] = np.arange(len(ordre))
+        codes_semaine = rangs[np.searchsorted(etiquettes, dates)]
+
+        forme = (len(codes), len(semaines), len(classes_age))
+        nb_cellules = int(np.prod(forme))
+        cellules = np.ravel_multi_index((codes_geo, codes_semaine, codes_age), forme) if n else np.zeros(0, dtype=np.int64)
+
+        # Accumulateurs par cellule et par indicateur, dans l'ordre des lignes source
+        sommes = np.zeros((nb_cellules, len(METRIQUES)))
+        nombres = np.zeros((nb_cellules, len(METRIQUES)), dtype=np.int32)
+        minimums = np.full((nb_cellules, len(METRIQUES)), np.inf)
+        maximums = np.full((nb_cellules, len(METRIQUES)), -np.inf)
+        for m, metrique in enumerate(METRIQUES):
+            if metrique not in df.columns:
+                continue
+            valeurs = pd.to_numeric(df[metrique], errors='coerce').to_numpy(np.float64)
+            renseignees = ~np.isnan(valeurs)
+            cellules_m, valeurs_m = cellules[renseignees], valeurs[renseignees]
+            sommes[:, m] = np.bincount(cellules_m, weights=valeurs_m, minlength=nb_cellules)
+            nombres[:, m] = np.bincount(cellules_m, minlength=nb_cellules)
+            np.minimum.at(minimums[:, m], cellules_m, valeurs_m)
+            np.maximum.at(maximums[:, m], cellules_m, valeurs_m)
+        minimums[nombres == 0] = np.nan
+        maximums[nombres == 0] = np.nan
+
+        effectifs = np.bincount(cellules, minlength=nb_cellules).astype(np.int32).reshape(forme)
+        premieres_lignes = np.full(nb_cellules, LIGNE_ABSENTE, dtype=np.int32)
+        np.minimum.at(premieres_lignes, cellules, np.arange(n, dtype=np.int32))
+
+        # Libellés de chaque ligne (combinaisons distinctes), retenus pour la première ligne de chaque cellule
+        valeurs_libelles = [
+            df[nom].map(lambda v: str(v) if pd.notna(v) else None).tolist() if nom in df.columns else [None] * n
+            for nom in colonnes_libelles
+        ]
+        codes_libelles, combinaisons = pd.factorize(pd.Series(list(zip(*valeurs_libelles)), dtype=object))
+        libelles = [dict(zip(colonnes_libelles, combinaison)) for combinaison in combinaisons]
+        libelles_cellules = np.full(nb_cellules, -1, dtype=np.int32)
+        remplies = premieres_lignes < LIGNE_ABSENTE
+        libelles_cellules[remplies] = codes_libelles[premieres_lignes[remplies]]
+
+        premieres_lignes = premieres_lignes.reshape(forme)
+        libelles_cellules = libelles_cellules.reshape(forme)
+
+        forme_indicateurs = forme + (len(METRIQUES),)
+        sommes, nombres = sommes.reshape(forme_indicateurs), nombres.reshape(forme_indicateurs)
+        minimums, maximums = minimums.reshape(forme_indicateurs), maximums.reshape(forme_indicateurs)
+
+        axes = {
+            "semaines": [str(s) for s in semaines],
+            "codes": [str(c) for c in codes],
+            "libelles": libelles,
+            "classes_age": [str(c) for c in classes_age],
+        }
+        return cls(sommes, nombres, minimums, maximums, effectifs, premieres_lignes, libelles_cellules, axes)
+
+    def plage_semaines(self, annee: Optional[str] = None) -> slice:
+        """Plage de l'axe des semaines dont la date commence par `annee` (toutes si None)"""
+        if not annee:
+            return slice(0, len(self.semaines))
+        if len(annee) == 4 and annee.isdigit():
+            return self.index_temporel.plage_annee(annee)
+        # Autre préfixe (ex: "2024-03") : semaines correspondantes, contiguës dans l'ordre des dates
+        positions = [i for i, semaine in enumerate(self.semaines) if semaine.startswith(annee)]
+        return slice(positions[0], positions[-1] + 1) if positions else slice(0, 0)
+
+    def plage_dates(self, debut=None, fin=None) -> slice:
+        """Plage de l'axe des semaines entre deux dates incluses"""
+        return self.index_temporel.plage_dates(debut, fin)
+
+    def plage_saison(self, annee_debut) -> slice:
+        """Plage de l'axe des semaines de la saison grippale S40 `annee_debut` -> S20"""
+        return self.index_temporel.plage_saison(annee_debut)
+
+    def sauvegarder(self, dossier: Path, signature: Tuple[int, int]):
+        """Écrit le tenseur (répertoire temporaire unique puis remplacement atomique)"""
+        temporaire = repertoire_temporaire(dossier)
+        try:
+            for nom in self.TABLEAUX:
+                np.save(temporaire / f"{nom}.npy", getattr(self, nom))
+            with open(temporaire / "axes.json", 'w', encoding='utf-8') as f:
+                json.dump({"version": VERSION_FORMAT, "source": list(signature), **self.axes}, f, ensure_ascii=False)
+        except BaseException:
+            shutil.rmtree(temporaire, ignore_errors=True)
+            raise
+
+        remplacer_repertoire(temporaire, Path(dossier))
+
+    @classmethod
+    def ouvrir(cls, dossier: Path, signature: Tuple[int, int]):
+        """Ouvre un tenseur persisté en mmap (None s'il est absent, périmé ou remplacé pendant la lecture)"""
+        dossier = Path(dossier)
+        try:
+            with open(dossier / "axes.json", 'r', encoding='utf-8') as f:
+                axes = json.load(f)
+
+            if axes.pop("version", None) != VERSION_FORMAT or tuple(axes.pop("source", ())) != tuple(signature):
+                return None
+
+            tableaux = [np.asarray(np.load(dossier / f"{nom}.npy", mmap_mode="r")) for nom in cls.TABLEAUX]
+            return cls(*tableaux, axes)
+        except (OSError, ValueError, KeyError):
+            return None
+
+
+def charger_tenseur_urgences(chemin: Path, colonne_geo: str, colonnes_libelles: Tuple[str, ...]) -> TenseurUrgences:
+    """
+    Parseur pour le registre : ouvre le tenseur persisté s'il correspond au fichier source,
+    sinon le reconstruit depuis les enregistrements et le persiste pour les autres workers.
+    """
+    stat = os.stat(chemin)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    dossier = TENSEURS_DIR / Path(chemin).stem
+
+    tenseur = TenseurUrgences.ouvrir(dossier, signature)
+    if tenseur is not None:
+        return tenseur
+
+    tenseur = TenseurUrgences.depuis_dataframe(lire_dataframe_snapshot(chemin), colonne_geo, colonnes_libelles)
+    try:
+        tenseur.sauvegarder(dossier, signature)
+    except OSError as e:
+        print(f"⚠️  Tenseur urgences non persisté ({dossier}): {e}")
+    return tenseur
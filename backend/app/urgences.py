@@ -2,50 +2,187 @@
 Module URGENCES
 Gestion des données de passages aux urgences pour la grippe
 """
-import json
 import os
 from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
 
+import numpy as np
 
-def charger_donnees_urgences_departementales() -> List[Dict[str, Any]]:
+from app.geographie import geographie
+from app.registre_donnees import registre
+from app.tenseur_urgences import LIGNE_ABSENTE, TenseurUrgences, charger_tenseur_urgences
+
+FICHIER_DEPARTEMENTAL = 'data/datagouve/passage_urgence/grippe-passages-aux-urgences-et-actes-sos-medecins-departement.json'
+FICHIER_REGIONAL = 'data/datagouve/passage_urgence/grippe-passages-urgences-et-actes-sos-medecin_reg.json'
+
+# Clés de réponse des indicateurs, dans l'ordre de tenseur_urgences.METRIQUES
+CLES_INDICATEURS = ["taux_passages", "taux_hospitalisations", "taux_actes_sos"]
+
+NOTES_INDICATEURS = {
+    "taux_passages": "Taux de passages aux urgences pour grippe (pas des pourcentages)",
+    "taux_hospitalisations": "Taux d'hospitalisations pour grippe (pas des pourcentages)",
+    "taux_actes_sos": "Taux d'actes SOS Médecins pour grippe (pas des pourcentages)"
+}
+
+# Nombre de semaines lues par lot dans le noyau d'agrégation
+SEMAINES_PAR_LOT = 52
+
+
+def charger_donnees_urgences_departementales() -> Optional[TenseurUrgences]:
     """
     Charge les données d'urgences départementales
     
     Returns:
-        Liste des données d'urgences par département
+        Tenseur [département, semaine, âge, indicateur] ou None si indisponible
     """
-    file_path = 'data/datagouve/passage_urgence/grippe-passages-aux-urgences-et-actes-sos-medecins-departement.json'
-    
-    if not os.path.exists(file_path):
-        return []
+    if not os.path.exists(FICHIER_DEPARTEMENTAL):
+        return None
     
     try:
-        with open(file_path, 'r') as f:
-            return json.load(f)
+        return registre.charger(
+            FICHIER_DEPARTEMENTAL, charger_tenseur_urgences,
+            colonne_geo="dep", colonnes_libelles=("libgeo", "reglib", "reg")
+        )
     except Exception as e:
         print(f"Erreur lors du chargement des données départementales: {e}")
-        return []
+        return None
 
 
-def charger_donnees_urgences_regionales() -> List[Dict[str, Any]]:
+def charger_donnees_urgences_regionales() -> Optional[TenseurUrgences]:
     """
     Charge les données d'urgences régionales
     
     Returns:
-        Liste des données d'urgences par région
+        Tenseur [région, semaine, âge, indicateur] ou None si indisponible
     """
-    file_path = 'data/datagouve/passage_urgence/grippe-passages-urgences-et-actes-sos-medecin_reg.json'
-    
-    if not os.path.exists(file_path):
-        return []
+    if not os.path.exists(FICHIER_REGIONAL):
+        return None
     
     try:
-        with open(file_path, 'r') as f:
-            return json.load(f)
+        return registre.charger(
+            FICHIER_REGIONAL, charger_tenseur_urgences,
+            colonne_geo="region", colonnes_libelles=("reglib",)
+        )
     except Exception as e:
         print(f"Erreur lors du chargement des données régionales: {e}")
-        return []
+        return None
+
+
+def _arrondi(valeur) -> float:
+    """Arrondit un taux à 2 décimales (0 si aucune valeur)"""
+    return 0 if not np.isfinite(valeur) else round(float(valeur), 2)
+
+
+def _selection_geos(tenseur: TenseurUrgences, codes: Optional[List[str]]) -> np.ndarray:
+    """Indices géographiques des codes demandés (tous si None), dans l'ordre du tenseur"""
+    if codes is None:
+        return np.arange(len(tenseur.codes))
+    return np.array(sorted(tenseur.index_geo[c] for c in set(codes) if c in tenseur.index_geo), dtype=np.int64)
+
+
+def agreger_urgences(tenseur: TenseurUrgences, geos: np.ndarray, plage: slice, par_age: bool = False) -> Dict[str, Any]:
+    """
+    Noyau d'agrégation unique des urgences : parcourt la sélection une seule fois,
+    par lots de semaines, avec des accumulateurs (somme, nombre, min, max) par groupe.
+    
+    Args:
+        tenseur: Tenseur urgences du niveau
+        geos: Indices géographiques retenus
+        plage: Plage de semaines retenue
+        par_age: Grouper par classe d'âge (sinon par entité géographique)
+        
+    Returns:
+        Dict avec groupes [(indice, nb_enregistrements, statistiques, libellés)] dans l'ordre
+        d'apparition source, total, statistiques globales et période. Les libellés (None par
+        classe d'âge) sont ceux du premier enregistrement de l'entité dans la plage.
+    """
+    nb_groupes = len(tenseur.classes_age) if par_age else len(geos)
+    axes = (0, 1) if par_age else (1, 2)
+    forme = (nb_groupes, len(CLES_INDICATEURS))
+    
+    sommes = np.zeros(forme)
+    valides = np.zeros(forme, dtype=np.int64)
+    minimums = np.full(forme, np.inf)
+    maximums = np.full(forme, -np.inf)
+    effectifs = np.zeros(nb_groupes, dtype=np.int64)
+    premieres = np.full(nb_groupes, LIGNE_ABSENTE, dtype=np.int64)
+    libelles_groupes = np.full(nb_groupes, -1, dtype=np.int64)
+    premiere_semaine, derniere_semaine = None, None
+    
+    for debut in range(plage.start, plage.stop, SEMAINES_PAR_LOT):
+        lot = slice(debut, min(debut + SEMAINES_PAR_LOT, plage.stop))
+        nombres_lot = tenseur.nombres[geos, lot]
+        effectifs_lot = tenseur.effectifs[geos, lot]
+        
+        presentes = nombres_lot > 0
+        sommes += tenseur.sommes[geos, lot].sum(axis=axes)
+        valides += nombres_lot.sum(axis=axes)
+        minimums = np.minimum(minimums, np.where(presentes, tenseur.minimums[geos, lot], np.inf).min(axis=axes, initial=np.inf))
+        maximums = np.maximum(maximums, np.where(presentes, tenseur.maximums[geos, lot], -np.inf).max(axis=axes, initial=-np.inf))
+        effectifs += effectifs_lot.sum(axis=axes)
+        premieres_lot = tenseur.premieres_lignes[geos, lot]
+        if par_age:
+            premieres = np.minimum(premieres, premieres_lot.min(axis=axes, initial=LIGNE_ABSENTE))
+        else:
+            # Libellés de la première ligne de chaque entité dans la plage retenue
+            taille_lot = premieres_lot.shape[1] * premieres_lot.shape[2]
+            lignes_lot = premieres_lot.reshape(len(geos), taille_lot)
+            positions = lignes_lot.argmin(axis=1)
+            lignes = lignes_lot[np.arange(len(geos)), positions]
+            plus_tot = lignes < premieres
+            libelles_lot = tenseur.libelles_cellules[geos, lot].reshape(len(geos), taille_lot)[np.arange(len(geos)), positions]
+            libelles_groupes[plus_tot] = libelles_lot[plus_tot]
+            premieres = np.minimum(premieres, lignes)
+        
+        # Période : semaines datées contenant au moins un enregistrement
+        for s in np.flatnonzero(effectifs_lot.sum(axis=(0, 2)) > 0) + debut:
+            if tenseur.semaines[s]:
+                premiere_semaine = tenseur.semaines[s] if premiere_semaine is None else premiere_semaine
+                derniere_semaine = tenseur.semaines[s]
+    
+    with np.errstate(invalid="ignore", divide="ignore"):
+        moyennes = sommes / valides
+    
+    groupes = np.flatnonzero(effectifs > 0)
+    groupes = groupes[np.argsort(premieres[groupes], kind="stable")]
+    
+    total = int(effectifs.sum())
+    statistiques = {}
+    if total:
+        statistiques["total_entrees"] = total
+        nb_total = valides.sum(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            moyennes_globales = sommes.sum(axis=0) / nb_total
+        for m, cle in enumerate(CLES_INDICATEURS):
+            statistiques[cle] = {
+                "moyenne": _arrondi(moyennes_globales[m]),
+                "minimum": _arrondi(minimums[:, m].min()),
+                "maximum": _arrondi(maximums[:, m].max()),
+                "nombre_valides": int(nb_total[m]),
+                "unite": "pour 100 000 habitants",
+                "note": NOTES_INDICATEURS[cle]
+            }
+    
+    return {
+        "groupes": [
+            (
+                int(g) if par_age else int(geos[g]),
+                int(effectifs[g]),
+                {
+                    cle: {
+                        "moyenne": _arrondi(moyennes[g, m]),
+                        "min": _arrondi(minimums[g, m]),
+                        "max": _arrondi(maximums[g, m])
+                    }
+                    for m, cle in enumerate(CLES_INDICATEURS)
+                },
+                None if par_age else tenseur.libelles[libelles_groupes[g]]
+            )
+            for g in groupes
+        ],
+        "total": total,
+        "statistiques": statistiques,
+        "periode": {"debut": premiere_semaine, "fin": derniere_semaine}
+    }
 
 
 def get_urgences_par_departement(code_departement: str = None, annee: str = None, limit: int = None) -> Dict[str, Any]:
@@ -60,9 +197,9 @@ def get_urgences_par_departement(code_departement: str = None, annee: str = None
     Returns:
         Dict avec données d'urgences départementales AGRÉGÉES
     """
-    data = charger_donnees_urgences_departementales()
+    tenseur = charger_donnees_urgences_departementales()
     
-    if not data:
+    if tenseur is None or not tenseur.codes:
         return {
             "departements": [],
             "total_departements": 0,
@@ -70,93 +207,48 @@ def get_urgences_par_departement(code_departement: str = None, annee: str = None
             "statistiques": {}
         }
     
-    # Filtrer par département si spécifié
-    if code_departement:
-        data = [item for item in data if item.get('dep') == code_departement]
-    
-    # Filtrer par année si spécifiée
-    if annee:
-        data = [item for item in data if item.get('date_complet', '').startswith(annee)]
-    
-    # Grouper et AGRÉGER par département (ne pas garder tous les détails)
-    departements = {}
-    for item in data:
-        dep = item.get('dep', 'Inconnu')
-        if dep not in departements:
-            departements[dep] = {
-                "code_departement": dep,
-                "nom_departement": item.get('libgeo', 'Inconnu'),
-                "region": item.get('reglib', 'Inconnue'),
-                "code_region": item.get('reg', 'Inconnu'),
-                "taux_passages_list": [],
-                "taux_hospit_list": [],
-                "taux_actes_sos_list": [],
-                "nb_enregistrements": 0
-            }
-        
-        # Agréger les taux au lieu de garder tous les détails
-        taux_passages = item.get('taux_passages_grippe_sau')
-        taux_hospit = item.get('taux_hospit_grippe_sau')
-        taux_actes = item.get('taux_actes_grippe_sos')
-        
-        if taux_passages is not None:
-            departements[dep]["taux_passages_list"].append(taux_passages)
-        if taux_hospit is not None:
-            departements[dep]["taux_hospit_list"].append(taux_hospit)
-        if taux_actes is not None:
-            departements[dep]["taux_actes_sos_list"].append(taux_actes)
-        
-        departements[dep]["nb_enregistrements"] += 1
+    # Filtrer par département (accès direct) et par année (plage de semaines)
+    geos = _selection_geos(tenseur, [code_departement] if code_departement else None)
+    agregat = agreger_urgences(tenseur, geos, tenseur.plage_semaines(annee))
     
-    # Calculer les statistiques agrégées pour chaque département
     departements_finaux = []
-    for dep_code, dep_data in departements.items():
-        taux_passages = dep_data["taux_passages_list"]
-        taux_hospit = dep_data["taux_hospit_list"]
-        taux_actes = dep_data["taux_actes_sos_list"]
-        
+    for geo, nb_enregistrements, statistiques_geo, libelles in agregat["groupes"]:
         departements_finaux.append({
-            "code_departement": dep_data["code_departement"],
-            "nom_departement": dep_data["nom_departement"],
-            "region": dep_data["region"],
-            "code_region": dep_data["code_region"],
-            "nb_enregistrements": dep_data["nb_enregistrements"],
-            "statistiques": {
-                "taux_passages": {
-                    "moyenne": round(sum(taux_passages) / len(taux_passages), 2) if taux_passages else 0,
-                    "min": round(min(taux_passages), 2) if taux_passages else 0,
-                    "max": round(max(taux_passages), 2) if taux_passages else 0
-                },
-                "taux_hospitalisations": {
-                    "moyenne": round(sum(taux_hospit) / len(taux_hospit), 2) if taux_hospit else 0,
-                    "min": round(min(taux_hospit), 2) if taux_hospit else 0,
-                    "max": round(max(taux_hospit), 2) if taux_hospit else 0
-                },
-                "taux_actes_sos": {
-                    "moyenne": round(sum(taux_actes) / len(taux_actes), 2) if taux_actes else 0,
-                    "min": round(min(taux_actes), 2) if taux_actes else 0,
-                    "max": round(max(taux_actes), 2) if taux_actes else 0
-                }
-            }
+            "code_departement": tenseur.codes[geo],
+            "nom_departement": libelles["libgeo"] or 'Inconnu',
+            "region": libelles["reglib"] or 'Inconnue',
+            "code_region": libelles["reg"] or 'Inconnu',
+            "nb_enregistrements": nb_enregistrements,
+            "statistiques": statistiques_geo
         })
     
     # Limiter le nombre de résultats si demandé
     if limit:
         departements_finaux = departements_finaux[:limit]
     
-    # Calculer les statistiques globales
-    statistiques = calculer_statistiques_urgences(data)
-    
     return {
         "departements": departements_finaux,
         "total_departements": len(departements_finaux),
-        "total_enregistrements_source": len(data),
-        "periode": get_periode_donnees(data),
-        "statistiques": statistiques,
+        "total_enregistrements_source": agregat["total"],
+        "periode": agregat["periode"],
+        "statistiques": agregat["statistiques"],
         "note": "Données agrégées pour optimisation - moyennes par département"
     }
 
 
+def _regions_finales(tenseur: TenseurUrgences, agregat: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Formate les groupes régionaux produits par le noyau d'agrégation"""
+    return [
+        {
+            "code_region": tenseur.codes[geo],
+            "nom_region": libelles["reglib"] or 'Inconnue',
+            "nb_enregistrements": nb_enregistrements,
+            "statistiques": statistiques_geo
+        }
+        for geo, nb_enregistrements, statistiques_geo, libelles in agregat["groupes"]
+    ]
+
+
 def get_urgences_par_region(code_region: str = None, annee: str = None, limit: int = None) -> Dict[str, Any]:
     """
     Récupère les données d'urgences par région (version optimisée avec agrégation)
@@ -169,9 +261,9 @@ def get_urgences_par_region(code_region: str = None, annee: str = None, limit: i
     Returns:
         Dict avec données d'urgences régionales AGRÉGÉES
     """
-    data = charger_donnees_urgences_regionales()
+    tenseur = charger_donnees_urgences_regionales()
     
-    if not data:
+    if tenseur is None or not tenseur.codes:
         return {
             "regions": [],
             "total_regions": 0,
@@ -179,85 +271,21 @@ def get_urgences_par_region(code_region: str = None, annee: str = None, limit: i
             "statistiques": {}
         }
     
-    # Filtrer par région si spécifiée
-    if code_region:
-        data = [item for item in data if item.get('region') == code_region]
-    
-    # Filtrer par année si spécifiée
-    if annee:
-        data = [item for item in data if item.get('date_complet', '').startswith(annee)]
-    
-    # Grouper et AGRÉGER par région (ne pas garder tous les détails)
-    regions = {}
-    for item in data:
-        reg = item.get('region', 'Inconnue')
-        if reg not in regions:
-            regions[reg] = {
-                "code_region": reg,
-                "nom_region": item.get('reglib', 'Inconnue'),
-                "taux_passages_list": [],
-                "taux_hospit_list": [],
-                "taux_actes_sos_list": [],
-                "nb_enregistrements": 0
-            }
-        
-        # Agréger les taux
-        taux_passages = item.get('taux_passages_grippe_sau')
-        taux_hospit = item.get('taux_hospit_grippe_sau')
-        taux_actes = item.get('taux_actes_grippe_sos')
-        
-        if taux_passages is not None:
-            regions[reg]["taux_passages_list"].append(taux_passages)
-        if taux_hospit is not None:
-            regions[reg]["taux_hospit_list"].append(taux_hospit)
-        if taux_actes is not None:
-            regions[reg]["taux_actes_sos_list"].append(taux_actes)
-        
-        regions[reg]["nb_enregistrements"] += 1
-    
-    # Calculer les statistiques agrégées pour chaque région
-    regions_finales = []
-    for reg_code, reg_data in regions.items():
-        taux_passages = reg_data["taux_passages_list"]
-        taux_hospit = reg_data["taux_hospit_list"]
-        taux_actes = reg_data["taux_actes_sos_list"]
-        
-        regions_finales.append({
-            "code_region": reg_data["code_region"],
-            "nom_region": reg_data["nom_region"],
-            "nb_enregistrements": reg_data["nb_enregistrements"],
-            "statistiques": {
-                "taux_passages": {
-                    "moyenne": round(sum(taux_passages) / len(taux_passages), 2) if taux_passages else 0,
-                    "min": round(min(taux_passages), 2) if taux_passages else 0,
-                    "max": round(max(taux_passages), 2) if taux_passages else 0
-                },
-                "taux_hospitalisations": {
-                    "moyenne": round(sum(taux_hospit) / len(taux_hospit), 2) if taux_hospit else 0,
-                    "min": round(min(taux_hospit), 2) if taux_hospit else 0,
-                    "max": round(max(taux_hospit), 2) if taux_hospit else 0
-                },
-                "taux_actes_sos": {
-                    "moyenne": round(sum(taux_actes) / len(taux_actes), 2) if taux_actes else 0,
-                    "min": round(min(taux_actes), 2) if taux_actes else 0,
-                    "max": round(max(taux_actes), 2) if taux_actes else 0
-                }
-            }
-        })
+    # Filtrer par région (accès direct) et par année (plage de semaines)
+    geos = _selection_geos(tenseur, [code_region] if code_region else None)
+    agregat = agreger_urgences(tenseur, geos, tenseur.plage_semaines(annee))
+    regions_finales = _regions_finales(tenseur, agregat)
     
     # Limiter le nombre de résultats si demandé
     if limit:
         regions_finales = regions_finales[:limit]
     
-    # Calculer les statistiques globales
-    statistiques = calculer_statistiques_urgences(data)
-    
     return {
         "regions": regions_finales,
         "total_regions": len(regions_finales),
-        "total_enregistrements_source": len(data),
-        "periode": get_periode_donnees(data),
-        "statistiques": statistiques,
+        "total_enregistrements_source": agregat["total"],
+        "periode": agregat["periode"],
+        "statistiques": agregat["statistiques"],
         "note": "Données agrégées pour optimisation - moyennes par région"
     }
 
@@ -273,159 +301,36 @@ def get_urgences_nationales(annee: str = None) -> Dict[str, Any]:
         Dict avec données d'urgences nationales AGRÉGÉES (uniquement statistiques)
     """
     # Utiliser les données régionales pour le national
-    data = charger_donnees_urgences_regionales()
+    tenseur = charger_donnees_urgences_regionales()
     
-    if not data:
+    if tenseur is None or not tenseur.codes:
         return {
             "donnees_nationales": {},
             "periode": None,
             "statistiques": {}
         }
     
-    # Filtrer par année si spécifiée
-    if annee:
-        data = [item for item in data if item.get('date_complet', '').startswith(annee)]
-    
-    # Agréger par groupe d'âge (au lieu de tout lister)
-    groupes_age = {}
-    for item in data:
-        groupe = item.get('sursaud_cl_age_gene', 'Tous âges')
-        if groupe not in groupes_age:
-            groupes_age[groupe] = {
-                "groupe_age": groupe,
-                "taux_passages_list": [],
-                "taux_hospit_list": [],
-                "taux_actes_sos_list": [],
-                "nb_enregistrements": 0
-            }
-        
-        taux_passages = item.get('taux_passages_grippe_sau')
-        taux_hospit = item.get('taux_hospit_grippe_sau')
-        taux_actes = item.get('taux_actes_grippe_sos')
-        
-        if taux_passages is not None:
-            groupes_age[groupe]["taux_passages_list"].append(taux_passages)
-        if taux_hospit is not None:
-            groupes_age[groupe]["taux_hospit_list"].append(taux_hospit)
-        if taux_actes is not None:
-            groupes_age[groupe]["taux_actes_sos_list"].append(taux_actes)
-        
-        groupes_age[groupe]["nb_enregistrements"] += 1
-    
-    # Calculer les statistiques par groupe d'âge
-    donnees_par_groupe = []
-    for groupe, data_groupe in groupes_age.items():
-        taux_passages = data_groupe["taux_passages_list"]
-        taux_hospit = data_groupe["taux_hospit_list"]
-        taux_actes = data_groupe["taux_actes_sos_list"]
-        
-        donnees_par_groupe.append({
-            "groupe_age": groupe,
-            "nb_enregistrements": data_groupe["nb_enregistrements"],
-            "statistiques": {
-                "taux_passages": {
-                    "moyenne": round(sum(taux_passages) / len(taux_passages), 2) if taux_passages else 0,
-                    "min": round(min(taux_passages), 2) if taux_passages else 0,
-                    "max": round(max(taux_passages), 2) if taux_passages else 0
-                },
-                "taux_hospitalisations": {
-                    "moyenne": round(sum(taux_hospit) / len(taux_hospit), 2) if taux_hospit else 0,
-                    "min": round(min(taux_hospit), 2) if taux_hospit else 0,
-                    "max": round(max(taux_hospit), 2) if taux_hospit else 0
-                },
-                "taux_actes_sos": {
-                    "moyenne": round(sum(taux_actes) / len(taux_actes), 2) if taux_actes else 0,
-                    "min": round(min(taux_actes), 2) if taux_actes else 0,
-                    "max": round(max(taux_actes), 2) if taux_actes else 0
-                }
-            }
-        })
+    # Agréger par groupe d'âge toutes régions confondues
+    agregat = agreger_urgences(tenseur, _selection_geos(tenseur, None), tenseur.plage_semaines(annee), par_age=True)
     
-    # Calculer les statistiques globales
-    statistiques = calculer_statistiques_urgences(data)
+    donnees_par_groupe = [
+        {
+            "groupe_age": tenseur.classes_age[age],
+            "nb_enregistrements": nb_enregistrements,
+            "statistiques": statistiques_age
+        }
+        for age, nb_enregistrements, statistiques_age, _ in agregat["groupes"]
+    ]
     
     return {
         "donnees_par_groupe_age": donnees_par_groupe,
-        "total_enregistrements": len(data),
-        "periode": get_periode_donnees(data),
-        "statistiques_globales": statistiques,
+        "total_enregistrements": agregat["total"],
+        "periode": agregat["periode"],
+        "statistiques_globales": agregat["statistiques"],
         "note": "Données agrégées pour optimisation - moyennes nationales par groupe d'âge"
     }
 
 
-def calculer_statistiques_urgences(data: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """
-    Calcule les statistiques des données d'urgences
-    
-    Args:
-        data: Liste des données d'urgences
-        
-    Returns:
-        Dict avec statistiques calculées
-    """
-    if not data:
-        return {}
-    
-    # Extraire les taux valides
-    taux_passages = [item.get('taux_passages_grippe_sau') for item in data 
-                    if item.get('taux_passages_grippe_sau') is not None]
-    taux_hospit = [item.get('taux_hospit_grippe_sau') for item in data 
-                  if item.get('taux_hospit_grippe_sau') is not None]
-    taux_actes = [item.get('taux_actes_grippe_sos') for item in data 
-                 if item.get('taux_actes_grippe_sos') is not None]
-    
-    return {
-        "total_entrees": len(data),
-        "taux_passages": {
-            "moyenne": round(sum(taux_passages) / len(taux_passages), 2) if taux_passages else 0,
-            "minimum": round(min(taux_passages), 2) if taux_passages else 0,
-            "maximum": round(max(taux_passages), 2) if taux_passages else 0,
-            "nombre_valides": len(taux_passages),
-            "unite": "pour 100 000 habitants",
-            "note": "Taux de passages aux urgences pour grippe (pas des pourcentages)"
-        },
-        "taux_hospitalisations": {
-            "moyenne": round(sum(taux_hospit) / len(taux_hospit), 2) if taux_hospit else 0,
-            "minimum": round(min(taux_hospit), 2) if taux_hospit else 0,
-            "maximum": round(max(taux_hospit), 2) if taux_hospit else 0,
-            "nombre_valides": len(taux_hospit),
-            "unite": "pour 100 000 habitants",
-            "note": "Taux d'hospitalisations pour grippe (pas des pourcentages)"
-        },
-        "taux_actes_sos": {
-            "moyenne": round(sum(taux_actes) / len(taux_actes), 2) if taux_actes else 0,
-            "minimum": round(min(taux_actes), 2) if taux_actes else 0,
-            "maximum": round(max(taux_actes), 2) if taux_actes else 0,
-            "nombre_valides": len(taux_actes),
-            "unite": "pour 100 000 habitants",
-            "note": "Taux d'actes SOS Médecins pour grippe (pas des pourcentages)"
-        }
-    }
-
-
-def get_periode_donnees(data: List[Dict[str, Any]]) -> Dict[str, str]:
-    """
-    Détermine la période des données
-    
-    Args:
-        data: Liste des données
-        
-    Returns:
-        Dict avec date début et fin
-    """
-    if not data:
-        return {"debut": None, "fin": None}
-    
-    dates = [item.get('date_complet') for item in data if item.get('date_complet')]
-    if dates:
-        return {
-            "debut": min(dates),
-            "fin": max(dates)
-        }
-    
-    return {"debut": None, "fin": None}
-
-
 def get_urgences_par_zone(zone_code: str, annee: str = None) -> Dict[str, Any]:
     """
     Récupère les données d'urgences par zone (A, B, C) - version optimisée avec agrégation
@@ -437,19 +342,12 @@ def get_urgences_par_zone(zone_code: str, annee: str = None) -> Dict[str, Any]:
     Returns:
         Dict avec données d'urgences de la zone AGRÉGÉES
     """
-    # Mapping zones -> régions
-    zones_regions = {
-        "A": ["11", "84", "93", "76", "75"],  # Grandes métropoles
-        "B": ["32", "44", "53", "52"],        # Agglomérations moyennes  
-        "C": ["28", "27", "24", "94"]         # Reste de la France
-    }
-    
-    regions_zone = zones_regions.get(zone_code, [])
+    regions_zone = geographie.regions_de_zone(zone_code)
     
     # Charger les données régionales
-    data = charger_donnees_urgences_regionales()
+    tenseur = charger_donnees_urgences_regionales()
     
-    if not data:
+    if tenseur is None or not tenseur.codes:
         return {
             "zone": zone_code,
             "regions": [],
@@ -457,81 +355,17 @@ def get_urgences_par_zone(zone_code: str, annee: str = None) -> Dict[str, Any]:
             "statistiques": {}
         }
     
-    # Filtrer par zone et année
-    data_zone = []
-    for item in data:
-        region_code = item.get('region', '')
-        if region_code in regions_zone:
-            if not annee or item.get('date_complet', '').startswith(annee):
-                data_zone.append(item)
-    
-    # Grouper et AGRÉGER par région (ne pas garder tous les détails)
-    regions = {}
-    for item in data_zone:
-        reg = item.get('region', 'Inconnue')
-        if reg not in regions:
-            regions[reg] = {
-                "code_region": reg,
-                "nom_region": item.get('reglib', 'Inconnue'),
-                "taux_passages_list": [],
-                "taux_hospit_list": [],
-                "taux_actes_sos_list": [],
-                "nb_enregistrements": 0
-            }
-        
-        # Agréger les taux
-        taux_passages = item.get('taux_passages_grippe_sau')
-        taux_hospit = item.get('taux_hospit_grippe_sau')
-        taux_actes = item.get('taux_actes_grippe_sos')
-        
-        if taux_passages is not None:
-            regions[reg]["taux_passages_list"].append(taux_passages)
-        if taux_hospit is not None:
-            regions[reg]["taux_hospit_list"].append(taux_hospit)
-        if taux_actes is not None:
-            regions[reg]["taux_actes_sos_list"].append(taux_actes)
-        
-        regions[reg]["nb_enregistrements"] += 1
-    
-    # Calculer les statistiques agrégées pour chaque région
-    regions_finales = []
-    for reg_code, reg_data in regions.items():
-        taux_passages = reg_data["taux_passages_list"]
-        taux_hospit = reg_data["taux_hospit_list"]
-        taux_actes = reg_data["taux_actes_sos_list"]
-        
-        regions_finales.append({
-            "code_region": reg_data["code_region"],
-            "nom_region": reg_data["nom_region"],
-            "nb_enregistrements": reg_data["nb_enregistrements"],
-            "statistiques": {
-                "taux_passages": {
-                    "moyenne": round(sum(taux_passages) / len(taux_passages), 2) if taux_passages else 0,
-                    "min": round(min(taux_passages), 2) if taux_passages else 0,
-                    "max": round(max(taux_passages), 2) if taux_passages else 0
-                },
-                "taux_hospitalisations": {
-                    "moyenne": round(sum(taux_hospit) / len(taux_hospit), 2) if taux_hospit else 0,
-                    "min": round(min(taux_hospit), 2) if taux_hospit else 0,
-                    "max": round(max(taux_hospit), 2) if taux_hospit else 0
-                },
-                "taux_actes_sos": {
-                    "moyenne": round(sum(taux_actes) / len(taux_actes), 2) if taux_actes else 0,
-                    "min": round(min(taux_actes), 2) if taux_actes else 0,
-                    "max": round(max(taux_actes), 2) if taux_actes else 0
-                }
-            }
-        })
-    
-    # Calculer les statistiques globales de la zone
-    statistiques = calculer_statistiques_urgences(data_zone)
+    # Filtrer par zone (régions de la zone) et par année (plage de semaines)
+    geos = _selection_geos(tenseur, regions_zone)
+    agregat = agreger_urgences(tenseur, geos, tenseur.plage_semaines(annee))
+    regions_finales = _regions_finales(tenseur, agregat)
     
     return {
         "zone": zone_code,
         "regions": regions_finales,
         "total_regions": len(regions_finales),
-        "total_enregistrements": len(data_zone),
-        "periode": get_periode_donnees(data_zone),
-        "statistiques": statistiques,
+        "total_enregistrements": agregat["total"],
+        "periode": agregat["periode"],
+        "statistiques": agregat["statistiques"],
         "note": "Données agrégées pour optimisation - moyennes par région de la zone"
     }
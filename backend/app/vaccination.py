@@ -4,17 +4,105 @@ Gère les données de vaccination par zone
 Utilise fichiers locaux + APIs pour les vraies données
 """
 from app.config import REGIONS_ZONES, POURCENTAGE_CIBLE
+from app.geographie import ZONE_DEFAUT, geographie
+from app.agregation_hierarchique import agreger, memoise_par_version
 from app.data_loader import get_donnees_vaccination_region, get_donnees_doses_region
 
+_NON_CALCULE = object()
 
-def calculer_taux_par_zone(annee: str = "2024"):
+
+class ContexteCalcul:
+    """
+    Contexte de calcul propre à une requête.
+    
+    Calcule une seule fois (à la demande) le taux national ACTE et la table
+    des départements d'une année, puis les partage entre toutes les régions
+    et zones dérivées pendant la requête.
+    """
+
+    def __init__(self, annee: str = "2024"):
+        self.annee = annee
+        self._taux_national = _NON_CALCULE
+        self._departements = None
+        self._departements_par_region = None
+
+    @property
+    def taux_national(self):
+        """Taux réel national depuis les ACTE (ou None si indisponible)"""
+        if self._taux_national is _NON_CALCULE:
+            from app.data_loader import calculer_taux_reel_depuis_actes
+            self._taux_national = calculer_taux_reel_depuis_actes(self.annee)
+        return self._taux_national
+
+    @property
+    def departements(self):
+        """Table complète des départements de l'année"""
+        if self._departements is None:
+            self._departements = calculer_taux_par_departement(self.annee, contexte=self)
+        return self._departements
+
+    def departements_region(self, code_region) -> list:
+        """Départements d'une région (index construit une seule fois)"""
+        if self._departements_par_region is None:
+            self._departements_par_region = {}
+            for dept in self.departements:
+                self._departements_par_region.setdefault(dept["code_region"], []).append(dept)
+        return self._departements_par_region.get(str(code_region), [])
+
+
+# Indicateurs de couverture des populations à risque (données départementales SPF)
+INDICATEURS_COUVERTURE_RISQUE = ("grip_65plus", "grip_6574", "grip_75plus", "grip_moins65")
+
+
+@memoise_par_version
+def calculer_couverture_risque_par_zone(annee: str = "2024") -> dict:
+    """
+    Taux de couverture des populations à risque par zone : moyennes des départements
+    pondérées par leur population, tous indicateurs et toutes zones en un seul cumul
+    (résultat partagé, ne pas modifier)
+    
+    Returns:
+        dict: {zone_code: {indicateur: taux arrondi à 0.1 ou None}}
+    """
+    import numpy as np
+    from app.couverture_vaccins import charger_donnees_departementales
+    
+    donnees_couverture = charger_donnees_departementales()
+    donnees_annee = [d for d in donnees_couverture if d.get('an_mesure') == annee] if donnees_couverture else []
+    
+    # Une ligne par département des régions rattachées à une zone (DOM exclus)
+    feuilles = [geographie.index_region.get(str(d.get('reg', '')), -1) for d in donnees_annee]
+    colonnes = {"population": geographie.populations_departements(d.get('dep', '') for d in donnees_annee)}
+    for indicateur in INDICATEURS_COUVERTURE_RISQUE:
+        colonnes[indicateur] = [np.nan if d.get(indicateur) is None else d[indicateur] for d in donnees_annee]
+    
+    spec = {indicateur: ("moyenne_ponderee", indicateur, "population") for indicateur in INDICATEURS_COUVERTURE_RISQUE}
+    cumuls = agreger(geographie.hierarchie.a_partir_de("region"), feuilles, colonnes, spec, niveaux=["zone"])["zone"]
+    
+    return {
+        zone_code: {
+            indicateur: None if np.isnan(cumuls[indicateur][z]) else round(float(cumuls[indicateur][z]), 1)
+            for indicateur in INDICATEURS_COUVERTURE_RISQUE
+        }
+        for z, zone_code in enumerate(cumuls["codes"])
+    }
+
+
+def calculer_taux_par_zone(annee: str = "2024", contexte: ContexteCalcul = None):
     """
     Calcule le taux de vaccination par zone A, B, C.
     Utilise les VRAIES DONNÉES (fichiers + APIs)
     
+    Args:
+        annee: Année de référence
+        contexte: Contexte de calcul partagé (créé si absent)
+    
     Returns:
         dict: Données par zone avec taux de vaccination
     """
+    if contexte is None:
+        contexte = ContexteCalcul(annee)
+    
     # Initialiser les 3 zones : A, B, C
     zones = {
         "A": {"regions": [], "population": 0, "vaccines": 0, "sources": []},
@@ -29,7 +117,7 @@ def calculer_taux_par_zone(annee: str = "2024"):
         population_cible = int(population * POURCENTAGE_CIBLE)
         
         # ✅ VRAIES DONNÉES : fichiers locaux + APIs
-        donnees = get_donnees_vaccination_region(code_region, annee)
+        donnees = get_donnees_vaccination_region(code_region, annee, contexte=contexte)
         
         # Récupérer le taux (différents formats possibles)
         if "taux_global" in donnees and donnees["taux_global"]:
@@ -49,12 +137,8 @@ def calculer_taux_par_zone(annee: str = "2024"):
         zones[zone]["vaccines"] += vaccines
         zones[zone]["sources"].append(donnees["source"])
     
-    # Calculer les taux de couverture par populations à risque par zone
-    from app.couverture_vaccins import charger_donnees_departementales
-    
-    # Charger les données de couverture départementales
-    donnees_couverture = charger_donnees_departementales()
-    donnees_annee = [d for d in donnees_couverture if d.get('an_mesure') == annee] if donnees_couverture else []
+    # Taux de couverture des populations à risque par zone (moyennes pondérées par population)
+    couverture_zones = calculer_couverture_risque_par_zone(annee)
     
     # Calculer les taux par zone
     resultats = []
@@ -63,53 +147,15 @@ def calculer_taux_par_zone(annee: str = "2024"):
         population_cible = int(data["population"] * POURCENTAGE_CIBLE)
         taux = (data["vaccines"] / population_cible * 100) if population_cible > 0 else 0
         
-        # Calculer les taux de couverture par populations à risque pour cette zone
-        taux_couverture_zone = {
-            "grip_65plus": None,
-            "grip_6574": None, 
-            "grip_75plus": None,
-            "grip_moins65": None
-        }
+        # Calculer le taux global des populations à risque
+        # Pondération: 65+ ans (70%), <65 ans (30%) car les 65+ sont prioritaires
+        taux_couverture_zone = couverture_zones[zone_code]
+        taux_65plus = taux_couverture_zone["grip_65plus"]
+        taux_moins65 = taux_couverture_zone["grip_moins65"]
         
         taux_vaccination_a_risque = None  # Taux global des populations à risque
-        
-        if donnees_annee:
-            # Obtenir les codes région pour cette zone
-            codes_region_zone = [str(code) for code, info in REGIONS_ZONES.items() if info["zone"] == zone_code]
-            
-            # Filtrer les départements de cette zone
-            depts_zone = [d for d in donnees_annee if str(d.get('reg', '')) in codes_region_zone]
-            
-            if depts_zone:
-                # Calculer les moyennes pondérées par population
-                total_pop_zone = sum(estimer_population_departement(d.get('dep', '')) for d in depts_zone)
-                
-                for taux_key in taux_couverture_zone.keys():
-                    valeurs_valides = []
-                    poids_population = []
-                    
-                    for dept in depts_zone:
-                        valeur = dept.get(taux_key)
-                        if valeur is not None:
-                            pop_dept = estimer_population_departement(dept.get('dep', ''))
-                            valeurs_valides.append(valeur)
-                            poids_population.append(pop_dept)
-                    
-                    if valeurs_valides:
-                        # Moyenne pondérée par population
-                        total_poids = sum(poids_population)
-                        if total_poids > 0:
-                            taux_couverture_zone[taux_key] = round(
-                                sum(v * p for v, p in zip(valeurs_valides, poids_population)) / total_poids, 1
-                            )
-                
-                # Calculer le taux global des populations à risque
-                # Pondération: 65+ ans (70%), <65 ans (30%) car les 65+ sont prioritaires
-                taux_65plus = taux_couverture_zone["grip_65plus"]
-                taux_moins65 = taux_couverture_zone["grip_moins65"]
-                
-                if taux_65plus is not None and taux_moins65 is not None:
-                    taux_vaccination_a_risque = round(taux_65plus * 0.7 + taux_moins65 * 0.3, 1)
+        if taux_65plus is not None and taux_moins65 is not None:
+            taux_vaccination_a_risque = round(taux_65plus * 0.7 + taux_moins65 * 0.3, 1)
         
         # Déterminer sources de données
         sources_count = {}
@@ -143,15 +189,18 @@ def calculer_taux_par_zone(annee: str = "2024"):
     return resultats
 
 
+@memoise_par_version
+def index_zones(annee: str = "2024") -> dict:
+    """
+    Zones de l'année indexées par code, calculées une fois par version des données
+    (partagées entre les requêtes, ne pas modifier)
+    """
+    return {zone["zone_code"]: zone for zone in calculer_taux_par_zone(annee)}
+
+
 def get_details_zone(zone_code: str, annee: str = "2024"):
-    """Détails d'une zone spécifique."""
-    toutes_zones = calculer_taux_par_zone(annee)
-    
-    for zone in toutes_zones:
-        if zone["zone_code"] == zone_code:
-            return zone
-    
-    return None
+    """Détails d'une zone spécifique (lecture directe dans l'index de l'année)"""
+    return index_zones(annee).get(zone_code)
 
 
 def get_statistiques_nationales(annee: str = "2024"):
@@ -672,76 +721,95 @@ def calculer_impact_amelioration_vaccination(zone_code: str, taux_actuel: float)
 # VACCINATION PAR DÉPARTEMENT
 # =============================================================================
 
+# Départements du calcul de secours (sans données officielles)
+NOMS_DEPARTEMENTS_FALLBACK = {
+    # Zone A - Île-de-France (11)
+    "75": "Paris",
+    "77": "Seine-et-Marne",
+    "78": "Yvelines",
+    "91": "Essonne",
+    "92": "Hauts-de-Seine",
+    "93": "Seine-Saint-Denis",
+    "94": "Val-de-Marne",
+    "95": "Val-d'Oise",
+
+    # Zone A - Auvergne-Rhône-Alpes (84)
+    "01": "Ain",
+    "03": "Allier",
+    "07": "Ardèche",
+    "15": "Cantal",
+    "26": "Drôme",
+    "38": "Isère",
+    "42": "Loire",
+    "43": "Haute-Loire",
+    "63": "Puy-de-Dôme",
+    "69": "Rhône",
+    "73": "Savoie",
+    "74": "Haute-Savoie",
+
+    # Zone B - Hauts-de-France (32)
+    "02": "Aisne",
+    "59": "Nord",
+    "60": "Oise",
+    "62": "Pas-de-Calais",
+    "80": "Somme",
+
+    # Zone B - Grand Est (44)
+    "08": "Ardennes",
+    "10": "Aube",
+    "51": "Marne",
+    "52": "Haute-Marne",
+    "54": "Meurthe-et-Moselle",
+    "55": "Meuse",
+    "57": "Moselle",
+    "67": "Bas-Rhin",
+    "68": "Haut-Rhin",
+    "88": "Vosges",
+
+    # Zone C - Normandie (28)
+    "14": "Calvados",
+    "27": "Eure",
+    "50": "Manche",
+    "61": "Orne",
+    "76": "Seine-Maritime",
+
+    # Zone A - PACA (93)
+    "04": "Alpes-de-Haute-Provence",
+    "05": "Hautes-Alpes",
+    "06": "Alpes-Maritimes",
+    "13": "Bouches-du-Rhône",
+    "83": "Var",
+    "84": "Vaucluse",
+}
+
+
+def _construire_mapping_departements():
+    mapping = {}
+    for code_dept, nom in NOMS_DEPARTEMENTS_FALLBACK.items():
+        dept = geographie.index_departement[code_dept]
+        region = geographie.region_des_departements[dept]
+        mapping[code_dept] = {
+            "nom": nom,
+            "region": geographie.regions[region],
+            "region_nom": geographie.noms_regions[region],
+            "zone": geographie.zones[geographie.zone_des_departements[dept]],
+            "population": int(geographie.population_departements[dept])
+        }
+    return mapping
+
+
+_MAPPING_DEPARTEMENTS = _construire_mapping_departements()
+
+
 def get_mapping_departements():
     """
     Retourne le mapping des départements avec leur région et zone
+    (construit une fois depuis le référentiel géographique, ne pas modifier)
     """
-    # Mapping département -> région -> zone
-    DEPARTEMENTS = {
-        # Zone A - Île-de-France (11)
-        "75": {"nom": "Paris", "region": "11", "region_nom": "Île-de-France", "zone": "A", "population": 2_165_423},
-        "77": {"nom": "Seine-et-Marne", "region": "11", "region_nom": "Île-de-France", "zone": "A", "population": 1_403_997},
-        "78": {"nom": "Yvelines", "region": "11", "region_nom": "Île-de-France", "zone": "A", "population": 1_438_266},
-        "91": {"nom": "Essonne", "region": "11", "region_nom": "Île-de-France", "zone": "A", "population": 1_296_641},
-        "92": {"nom": "Hauts-de-Seine", "region": "11", "region_nom": "Île-de-France", "zone": "A", "population": 1_609_306},
-        "93": {"nom": "Seine-Saint-Denis", "region": "11", "region_nom": "Île-de-France", "zone": "A", "population": 1_623_540},
-        "94": {"nom": "Val-de-Marne", "region": "11", "region_nom": "Île-de-France", "zone": "A", "population": 1_387_926},
-        "95": {"nom": "Val-d'Oise", "region": "11", "region_nom": "Île-de-France", "zone": "A", "population": 1_241_250},
-        
-        # Zone A - Auvergne-Rhône-Alpes (84)
-        "01": {"nom": "Ain", "region": "84", "region_nom": "Auvergne-Rhône-Alpes", "zone": "A", "population": 652_432},
-        "03": {"nom": "Allier", "region": "84", "region_nom": "Auvergne-Rhône-Alpes", "zone": "A", "population": 335_136},
-        "07": {"nom": "Ardèche", "region": "84", "region_nom": "Auvergne-Rhône-Alpes", "zone": "A", "population": 328_278},
-        "15": {"nom": "Cantal", "region": "84", "region_nom": "Auvergne-Rhône-Alpes", "zone": "A", "population": 144_692},
-        "26": {"nom": "Drôme", "region": "84", "region_nom": "Auvergne-Rhône-Alpes", "zone": "A", "population": 516_762},
-        "38": {"nom": "Isère", "region": "84", "region_nom": "Auvergne-Rhône-Alpes", "zone": "A", "population": 1_258_722},
-        "42": {"nom": "Loire", "region": "84", "region_nom": "Auvergne-Rhône-Alpes", "zone": "A", "population": 764_023},
-        "43": {"nom": "Haute-Loire", "region": "84", "region_nom": "Auvergne-Rhône-Alpes", "zone": "A", "population": 227_552},
-        "63": {"nom": "Puy-de-Dôme", "region": "84", "region_nom": "Auvergne-Rhône-Alpes", "zone": "A", "population": 662_285},
-        "69": {"nom": "Rhône", "region": "84", "region_nom": "Auvergne-Rhône-Alpes", "zone": "A", "population": 1_843_319},
-        "73": {"nom": "Savoie", "region": "84", "region_nom": "Auvergne-Rhône-Alpes", "zone": "A", "population": 436_434},
-        "74": {"nom": "Haute-Savoie", "region": "84", "region_nom": "Auvergne-Rhône-Alpes", "zone": "A", "population": 825_194},
-        
-        # Zone B - Hauts-de-France (32)
-        "02": {"nom": "Aisne", "region": "32", "region_nom": "Hauts-de-France", "zone": "B", "population": 531_345},
-        "59": {"nom": "Nord", "region": "32", "region_nom": "Hauts-de-France", "zone": "B", "population": 2_608_346},
-        "60": {"nom": "Oise", "region": "32", "region_nom": "Hauts-de-France", "zone": "B", "population": 824_503},
-        "62": {"nom": "Pas-de-Calais", "region": "32", "region_nom": "Hauts-de-France", "zone": "B", "population": 1_465_278},
-        "80": {"nom": "Somme", "region": "32", "region_nom": "Hauts-de-France", "zone": "B", "population": 569_880},
-        
-        # Zone B - Grand Est (44)
-        "08": {"nom": "Ardennes", "region": "44", "region_nom": "Grand Est", "zone": "B", "population": 272_988},
-        "10": {"nom": "Aube", "region": "44", "region_nom": "Grand Est", "zone": "B", "population": 310_242},
-        "51": {"nom": "Marne", "region": "44", "region_nom": "Grand Est", "zone": "B", "population": 566_145},
-        "52": {"nom": "Haute-Marne", "region": "44", "region_nom": "Grand Est", "zone": "B", "population": 172_512},
-        "54": {"nom": "Meurthe-et-Moselle", "region": "44", "region_nom": "Grand Est", "zone": "B", "population": 733_481},
-        "55": {"nom": "Meuse", "region": "44", "region_nom": "Grand Est", "zone": "B", "population": 184_083},
-        "57": {"nom": "Moselle", "region": "44", "region_nom": "Grand Est", "zone": "B", "population": 1_043_522},
-        "67": {"nom": "Bas-Rhin", "region": "44", "region_nom": "Grand Est", "zone": "B", "population": 1_125_559},
-        "68": {"nom": "Haut-Rhin", "region": "44", "region_nom": "Grand Est", "zone": "B", "population": 764_030},
-        "88": {"nom": "Vosges", "region": "44", "region_nom": "Grand Est", "zone": "B", "population": 364_762},
-        
-        # Zone C - Normandie (28)
-        "14": {"nom": "Calvados", "region": "28", "region_nom": "Normandie", "zone": "C", "population": 694_002},
-        "27": {"nom": "Eure", "region": "28", "region_nom": "Normandie", "zone": "C", "population": 601_843},
-        "50": {"nom": "Manche", "region": "28", "region_nom": "Normandie", "zone": "C", "population": 495_045},
-        "61": {"nom": "Orne", "region": "28", "region_nom": "Normandie", "zone": "C", "population": 279_942},
-        "76": {"nom": "Seine-Maritime", "region": "28", "region_nom": "Normandie", "zone": "C", "population": 1_254_609},
-        
-        # Ajouter d'autres départements selon les besoins
-        # Zone A - PACA (93)
-        "04": {"nom": "Alpes-de-Haute-Provence", "region": "93", "region_nom": "Provence-Alpes-Côte d'Azur", "zone": "A", "population": 164_308},
-        "05": {"nom": "Hautes-Alpes", "region": "93", "region_nom": "Provence-Alpes-Côte d'Azur", "zone": "A", "population": 141_284},
-        "06": {"nom": "Alpes-Maritimes", "region": "93", "region_nom": "Provence-Alpes-Côte d'Azur", "zone": "A", "population": 1_083_310},
-        "13": {"nom": "Bouches-du-Rhône", "region": "93", "region_nom": "Provence-Alpes-Côte d'Azur", "zone": "A", "population": 2_043_110},
-        "83": {"nom": "Var", "region": "93", "region_nom": "Provence-Alpes-Côte d'Azur", "zone": "A", "population": 1_076_711},
-        "84": {"nom": "Vaucluse", "region": "93", "region_nom": "Provence-Alpes-Côte d'Azur", "zone": "A", "population": 561_469},
-    }
-    
-    return DEPARTEMENTS
+    return _MAPPING_DEPARTEMENTS
 
 
-def calculer_taux_par_departement(annee: str = "2024", zone_filter: str = None):
+def calculer_taux_par_departement(annee: str = "2024", zone_filter: str = None, contexte: ContexteCalcul = None):
     """
     Calcule le taux de vaccination par département en utilisant les VRAIES données ACTE
     
@@ -751,113 +819,102 @@ def calculer_taux_par_departement(annee: str = "2024", zone_filter: str = None):
     Args:
         annee: Année de référence
         zone_filter: Filtre par zone (A, B ou C) ou None pour tous
+        contexte: Contexte de calcul partagé (évite de recalculer le taux national)
     
     Returns:
         list: Liste des départements avec leurs statistiques de vaccination
     """
-    from app.couverture_vaccins import charger_donnees_departementales
-    from app.config import REGIONS_ZONES
-    from app.data_loader import calculer_taux_reel_depuis_actes
+    import numpy as np
+    from app.couverture_vaccins import charger_dataframe_departemental
+    
+    if contexte is None:
+        contexte = ContexteCalcul(annee)
     
     # 1. Calculer le VRAI taux national depuis les ACTE (vaccinations réelles)
-    taux_national = calculer_taux_reel_depuis_actes(annee)
+    taux_national = contexte.taux_national
     
-    # 2. Charger les données départementales
-    donnees_departementales = charger_donnees_departementales()
+    # 2. Charger les données départementales (format colonnes)
+    df = charger_dataframe_departemental()
     
-    if not donnees_departementales:
+    if df.empty:
         # Fallback sur l'ancien système si pas de données
         return calculer_taux_par_departement_fallback(annee, zone_filter)
     
-    resultats = []
-    
     # Filtrer par année
-    donnees_annee = [d for d in donnees_departementales if d.get('an_mesure') == annee]
-    
-    for dept_data in donnees_annee:
-        code_dept = dept_data.get('dep', '')
-        nom_dept = dept_data.get('libgeo', '')
-        code_region = str(dept_data.get('reg', ''))
-        nom_region = dept_data.get('reglib', '')
-        
-        # Déterminer la zone à partir de la région
-        zone = None
-        for reg_code, reg_info in REGIONS_ZONES.items():
-            if str(reg_code) == code_region:
-                zone = reg_info["zone"]
-                break
-        
-        if not zone:
-            zone = "C"  # Zone par défaut
-        
-        # Filtrer par zone si demandé
-        if zone_filter and zone != zone_filter:
-            continue
-        
-        # 3. Calculer le VRAI taux de vaccination pour ce département
-        # On utilise le taux national ACTE comme base, mais on peut l'ajuster selon le département
-        
-        if taux_national:
-            # Utiliser le taux réel calculé depuis les ACTE
-            taux_vaccination = taux_national["taux_reel_global"]
-            
-            # On peut ajuster légèrement selon les données départementales populations à risque
-            # pour refléter les variations locales
-            taux_65_plus_risque = dept_data.get('grip_65plus')
-            taux_moins_65_risque = dept_data.get('grip_moins65')
-            
-            # Si on a des données départementales, on peut faire un ajustement proportionnel
-            if taux_65_plus_risque is not None:
-                # Ajuster le taux selon la variation locale (populations à risque comme proxy)
-                # Moyenne nationale des populations à risque ~55% pour 65+
-                ratio_ajustement = taux_65_plus_risque / 55.0 if taux_65_plus_risque > 0 else 1.0
-                ratio_ajustement = max(0.7, min(1.3, ratio_ajustement))  # Limiter l'ajustement
-                taux_vaccination = taux_vaccination * ratio_ajustement
-        else:
-            # Fallback: utiliser les taux populations à risque (avec avertissement)
-            taux_65_plus_risque = dept_data.get('grip_65plus')
-            taux_moins_65_risque = dept_data.get('grip_moins65')
-            
-            if taux_65_plus_risque is not None:
-                taux_vaccination = taux_65_plus_risque
-            elif taux_moins_65_risque is not None:
-                taux_vaccination = taux_moins_65_risque
-            else:
-                taux_vaccination = 50.0
-        
-        # Estimation de la population (approximative)
-        population_estimee = estimer_population_departement(code_dept)
-        population_cible = int(population_estimee * POURCENTAGE_CIBLE)
-        
-        # Calculer nombre de vaccinés avec le VRAI taux (population générale)
-        vaccines = int(population_cible * (taux_vaccination / 100))
-        
-        # Source d'information
-        if taux_national:
-            source = "ACTE (vaccinations réelles) - ajusté par département"
-            note = "Taux calculé sur population TOTALE, pas uniquement populations à risque"
-        else:
-            source = "Santé Publique France (populations à risque)"
-            note = "⚠️ Taux pour populations à risque uniquement"
-        
-        resultats.append({
+    df_annee = df[df['an_mesure'] == annee]
+    
+    # Jointure avec la zone (via la région) et la population estimée
+    codes_region = df_annee['reg'].astype(str)
+    zones = codes_region.map(geographie.zone_par_region).fillna(ZONE_DEFAUT)
+    
+    # Filtrer par zone si demandé
+    if zone_filter:
+        masque = (zones == zone_filter).to_numpy()
+        df_annee, codes_region, zones = df_annee[masque], codes_region[masque], zones[masque]
+    
+    grip_65plus = df_annee['grip_65plus'].to_numpy(dtype=float)  # NaN si absent
+    grip_moins65 = df_annee['grip_moins65'].to_numpy(dtype=float)
+    
+    # 3. Calculer le VRAI taux de vaccination pour chaque département
+    if taux_national:
+        # Taux réel ACTE ajusté selon la variation locale des populations à risque
+        # Moyenne nationale des populations à risque ~55% pour 65+ (ajustement limité à ±30%)
+        ratio_ajustement = np.where(grip_65plus > 0, grip_65plus / 55.0, 1.0)
+        ratio_ajustement = np.clip(ratio_ajustement, 0.7, 1.3)
+        taux_vaccination = np.where(
+            np.isnan(grip_65plus),
+            taux_national["taux_reel_global"],
+            taux_national["taux_reel_global"] * ratio_ajustement
+        )
+        source = "ACTE (vaccinations réelles) - ajusté par département"
+        note = "Taux calculé sur population TOTALE, pas uniquement populations à risque"
+    else:
+        # Fallback: utiliser les taux populations à risque (avec avertissement)
+        taux_vaccination = np.where(
+            ~np.isnan(grip_65plus), grip_65plus,
+            np.where(~np.isnan(grip_moins65), grip_moins65, 50.0)
+        )
+        source = "Santé Publique France (populations à risque)"
+        note = "⚠️ Taux pour populations à risque uniquement"
+    
+    # Estimation de la population (approximative) et nombre de vaccinés
+    population_estimee = geographie.populations_departements(df_annee['dep'].tolist())
+    population_cible = (population_estimee * POURCENTAGE_CIBLE).astype(np.int64)
+    vaccines = (population_cible * (taux_vaccination / 100)).astype(np.int64)
+    
+    resultats = [
+        {
             "code_departement": code_dept,
             "nom_departement": nom_dept,
             "code_region": code_region,
             "nom_region": nom_region,
             "zone": zone,
-            "population_totale": int(population_estimee),
-            "population_cible": int(population_cible),
-            "nombre_vaccines": int(vaccines),
-            "taux_vaccination": float(round(taux_vaccination, 1)),
-            "taux_65_plus_risque": float(dept_data.get('grip_65plus')) if dept_data.get('grip_65plus') is not None else None,
-            "taux_moins_65_risque": float(dept_data.get('grip_moins65')) if dept_data.get('grip_moins65') is not None else None,
+            "population_totale": pop,
+            "population_cible": pop_cible,
+            "nombre_vaccines": nb_vaccines,
+            "taux_vaccination": float(round(taux, 1)),
+            "taux_65_plus_risque": None if np.isnan(t65) else t65,
+            "taux_moins_65_risque": None if np.isnan(tm65) else tm65,
             "objectif": 70.0,
-            "atteint": bool(taux_vaccination >= 70.0),
+            "atteint": bool(taux >= 70.0),
             "source": source,
             "note": note,
             "annee": annee
-        })
+        }
+        for code_dept, nom_dept, code_region, nom_region, zone, pop, pop_cible, nb_vaccines, taux, t65, tm65 in zip(
+            df_annee['dep'].tolist(),
+            df_annee['libgeo'].tolist(),
+            codes_region.tolist(),
+            df_annee['reglib'].tolist(),
+            zones.tolist(),
+            population_estimee.tolist(),
+            population_cible.tolist(),
+            vaccines.tolist(),
+            taux_vaccination.tolist(),
+            grip_65plus.tolist(),
+            grip_moins65.tolist()
+        )
+    ]
     
     # Trier par zone puis par code département
     resultats.sort(key=lambda x: (x["zone"], x["code_departement"]))
@@ -923,90 +980,78 @@ def calculer_taux_par_departement_fallback(annee: str = "2024", zone_filter: str
 
 def estimer_population_departement(code_dept: str) -> int:
     """Estime la population d'un département"""
-    # Populations approximatives par département (INSEE 2021)
-    populations = {
-        # Métropole
-        "01": 652_432, "02": 531_345, "03": 335_136, "04": 164_308, "05": 141_284,
-        "06": 1_083_310, "07": 328_278, "08": 272_988, "09": 153_287, "10": 310_242,
-        "11": 376_029, "12": 279_169, "13": 2_043_110, "14": 694_002, "15": 144_692,
-        "16": 352_335, "17": 651_358, "18": 305_937, "19": 240_872, "2A": 155_000,
-        "2B": 180_000, "21": 535_503, "22": 602_991, "23": 116_617, "24": 413_606,
-        "25": 541_052, "26": 516_762, "27": 601_843, "28": 1_254_609, "29": 908_249,
-        "30": 748_437, "31": 1_400_000, "32": 192_432, "33": 1_600_000, "34": 1_200_000,
-        "35": 1_000_000, "36": 225_184, "37": 610_079, "38": 1_258_722, "39": 260_781,
-        "40": 414_929, "41": 331_280, "42": 764_023, "43": 227_552, "44": 1_400_000,
-        "45": 678_105, "46": 173_828, "47": 332_119, "48": 76_422, "49": 818_573,
-        "50": 495_045, "51": 566_145, "52": 172_512, "53": 307_445, "54": 733_481,
-        "55": 184_083, "56": 750_863, "57": 1_043_522, "58": 204_452, "59": 2_608_346,
-        "60": 824_503, "61": 279_942, "62": 1_465_278, "63": 662_285, "64": 682_621,
-        "65": 230_956, "66": 487_307, "67": 1_125_559, "68": 764_030, "69": 1_843_319,
-        "70": 235_313, "71": 555_663, "72": 567_501, "73": 436_434, "74": 825_194,
-        "75": 2_165_423, "76": 1_254_609, "77": 1_403_997, "78": 1_438_266, "79": 374_435,
-        "80": 569_880, "81": 389_844, "82": 260_189, "83": 1_076_711, "84": 561_469,
-        "85": 1_400_000, "86": 438_435, "87": 374_426, "88": 364_762, "89": 337_108,
-        "90": 144_504, "91": 1_296_641, "92": 1_609_306, "93": 1_623_540, "94": 1_387_926,
-        "95": 1_241_250,
-        # DOM-TOM
-        "971": 384_315, "972": 376_480, "973": 294_071, "974": 858_450, "976": 288_926
-    }
-    
-    return populations.get(code_dept, 500_000)  # Défaut 500k
+    return geographie.population_departement(code_dept)
+
+
+@memoise_par_version
+def index_departements(annee: str = "2024") -> dict:
+    """
+    Départements de l'année indexés par code, calculés une fois par version des données
+    (premier département du tri par zone pour un code en double ; partagés, ne pas modifier)
+    """
+    index = {}
+    for dept in calculer_taux_par_departement(annee):
+        index.setdefault(dept["code_departement"], dept)
+    return index
 
 
 def get_details_departement(code_dept: str, annee: str = "2024"):
-    """Détails d'un département spécifique"""
-    tous_departements = calculer_taux_par_departement(annee)
-    
-    for dept in tous_departements:
-        if dept["code_departement"] == code_dept:
-            return dept
-    
-    return None
+    """Détails d'un département spécifique (lecture directe dans l'index de l'année)"""
+    return index_departements(annee).get(code_dept)
+
+
+# Cumul des départements par zone (moteur d'agrégation hiérarchique)
+SPEC_ZONES_DEPARTEMENTS = {
+    "population_totale": ("somme", "population_totale"),
+    "population_cible": ("somme", "population_cible"),
+    "nombre_vaccines": ("somme", "nombre_vaccines"),
+    "nb_departements": ("nombre", None),
+}
 
 
+@memoise_par_version
 def get_statistiques_par_zone_et_departement(annee: str = "2024"):
     """
     Statistiques agrégées par zone avec détails par département
+    (résultat partagé, ne pas modifier)
     """
     tous_departements = calculer_taux_par_departement(annee)
     
-    # Agréger par zone
-    zones = {}
-    for dept in tous_departements:
-        zone = dept["zone"]
-        if zone not in zones:
-            zones[zone] = {
-                "zone": f"Zone {zone}",
-                "zone_code": zone,
-                "population_totale": 0,
-                "population_cible": 0,
-                "nombre_vaccines": 0,
-                "nb_departements": 0,
-                "departements": []
-            }
-        
-        zones[zone]["population_totale"] += dept["population_totale"]
-        zones[zone]["population_cible"] += dept["population_cible"]
-        zones[zone]["nombre_vaccines"] += dept["nombre_vaccines"]
-        zones[zone]["nb_departements"] += 1
-        zones[zone]["departements"].append({
-            "code": dept["code_departement"],
-            "nom": dept["nom_departement"],
-            "taux": dept["taux_vaccination"]
-        })
+    # Départements -> zones en un seul cumul (zone portée par chaque département)
+    hierarchie = geographie.hierarchie.a_partir_de("zone")
+    zones_departements = hierarchie.ids((d["zone"] for d in tous_departements), "zone")
+    colonnes = {col: [d[col] for d in tous_departements] for col in ("population_totale", "population_cible", "nombre_vaccines")}
+    cumuls = agreger(hierarchie, zones_departements, colonnes, SPEC_ZONES_DEPARTEMENTS, niveaux=["zone"])["zone"]
     
     # Calculer les taux par zone
     resultats = []
-    for zone_code in ["A", "B", "C"]:
-        if zone_code in zones:
-            data = zones[zone_code]
-            taux = (data["nombre_vaccines"] / data["population_cible"] * 100) if data["population_cible"] > 0 else 0
-            
-            data["taux_vaccination"] = round(taux, 1)
-            data["objectif"] = 70.0
-            data["atteint"] = taux >= 70.0
-            
-            resultats.append(data)
+    for z, zone_code in enumerate(cumuls["codes"]):
+        if cumuls["nb_departements"][z] == 0:
+            continue
+        
+        population_cible = int(cumuls["population_cible"][z])
+        nombre_vaccines = int(cumuls["nombre_vaccines"][z])
+        taux = (nombre_vaccines / population_cible * 100) if population_cible > 0 else 0
+        
+        resultats.append({
+            "zone": f"Zone {zone_code}",
+            "zone_code": zone_code,
+            "population_totale": int(cumuls["population_totale"][z]),
+            "population_cible": population_cible,
+            "nombre_vaccines": nombre_vaccines,
+            "nb_departements": int(cumuls["nb_departements"][z]),
+            "departements": [
+                {
+                    "code": dept["code_departement"],
+                    "nom": dept["nom_departement"],
+                    "taux": dept["taux_vaccination"]
+                }
+                for dept, zone_dept in zip(tous_departements, zones_departements) if zone_dept == z
+            ],
+            "taux_vaccination": round(taux, 1),
+            "objectif": 70.0,
+            "atteint": taux >= 70.0
+        })
     
     return resultats
 
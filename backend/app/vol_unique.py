@@ -0,0 +1,57 @@
+"""
+Module VOL UNIQUE (single-flight)
+Regroupe les exécutions simultanées d'un même calcul : la première requête d'une clé
+l'exécute, les requêtes identiques qui arrivent pendant ce temps attendent son résultat
+au lieu de recalculer (pic de charge à l'ouverture des tableaux de bord).
+
+Les requêtes d'un worker partagent une même boucle asyncio : pas de verrou nécessaire.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+
+class VolUnique:
+    """Exécutions en cours, par clé"""
+
+    def __init__(self):
+        self._en_cours: Dict[str, asyncio.Future] = {}
+
+    def nb_en_cours(self) -> int:
+        return len(self._en_cours)
+
+    async def executer(self, cle: str, calcul: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        Exécute calcul() une seule fois pour toutes les demandes simultanées de la clé
+
+        Returns:
+            (résultat, partagé) : partagé vaut True si le résultat vient d'une autre requête
+
+        Raises:
+            L'exception levée par calcul(), pour la requête qui l'a exécuté et celles qui l'attendaient
+        """
+        futur = self._en_cours.get(cle)
+        if futur is not None:
+            try:
+                return await asyncio.shield(futur), True
+            except asyncio.CancelledError:
+                # Requête meneuse annulée (client déconnecté) : on calcule soi-même
+                if not futur.cancelled():
+                    raise
+                return await self.executer(cle, calcul)
+
+        futur = asyncio.get_running_loop().create_future()
+        self._en_cours[cle] = futur
+        try:
+            resultat = await calcul()
+        except Exception as e:
+            futur.set_exception(e)
+            futur.exception()  # Marquée comme lue : aucune requête n'attendait peut-être
+            raise
+        except BaseException:
+            futur.cancel()
+            raise
+        else:
+            futur.set_result(resultat)
+            return resultat, False
+        finally:
+            del self._en_cours[cle]
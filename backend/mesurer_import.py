@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Budget de temps d'import de app.main (démarrage à froid d'un worker)
+
+Mesure avec `python -X importtime -c "import app.main"` et vérifie que :
+- le temps cumulé d'import de app.main reste sous le budget
+- aucune dépendance lourde (pandas, numpy, scipy, requests) n'est importée au démarrage
+  (elles le sont au premier appel ou pendant le préchauffage)
+
+Usage (depuis backend/) :
+    python mesurer_import.py [budget_ms]
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+BUDGET_IMPORT_MS = 600
+MODULES_LOURDS = ("pandas", "numpy", "scipy", "requests")
+
+
+def mesurer():
+    """Retourne {module: temps cumulé en ms} pour l'import de app.main"""
+    resultat = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        cwd=Path(__file__).parent, capture_output=True, text=True
+    )
+    if resultat.returncode != 0:
+        print(resultat.stderr[-2000:])
+        raise SystemExit("❌ Import de app.main impossible")
+
+    temps = {}
+    for ligne in resultat.stderr.splitlines():
+        if not ligne.startswith("import time:") or "cumulative" in ligne:
+            continue
+        # "import time: propre | cumulé | module" (µs, module indenté selon la profondeur)
+        _, cumule, module = ligne.split("|")
+        temps[module.strip()] = int(cumule) / 1000
+    return temps
+
+
+def main():
+    budget = float(sys.argv[1]) if len(sys.argv) > 1 else BUDGET_IMPORT_MS
+    temps = mesurer()
+    total = temps.get("app.main", 0.0)
+
+    print("⏱️  Imports les plus coûteux (cumulé) :")
+    for module, duree in sorted(temps.items(), key=lambda x: x[1], reverse=True)[:10]:
+        print(f"   {duree:8.1f} ms  {module}")
+
+    lourds = [m for m in MODULES_LOURDS if m in temps]
+    ok = total <= budget and not lourds
+
+    print(f"\nimport app.main : {total:.1f} ms (budget {budget:.0f} ms)")
+    if lourds:
+        print(f"❌ Dépendances lourdes importées au démarrage : {', '.join(lourds)}")
+    print("✅ Budget respecté" if ok else "❌ Budget dépassé")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()